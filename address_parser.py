@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+주소 파싱 캐시 + 주소 유사도 점수
+
+같은 원본 주소 / 후보 주소가 후보마다, 행마다 반복해서 split 되지 않도록
+주소 문자열 하나당 한 번만 ParsedAddress(시도, 시군구, 동/리, 번지, 나머지)로 나누고
+LRU 캐시에서 재사용한다. 점수 계산은 기존 compare_address_similarity /
+compare_address_similarity_with_jibun 규칙과 같다.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+# 캐시할 서로 다른 주소 문자열 수 (오프라인 재채점처럼 후보가 많을 때를 고려)
+PARSE_CACHE_SIZE = 200000
+
+# text: 원본 문자열, parts: 공백 기준 조각, rest: 네 번째 조각부터 (건물명, 번지, 층 등)
+ParsedAddress = namedtuple('ParsedAddress', ['text', 'parts', 'sido', 'sigungu', 'dong_ri', 'bunji', 'rest'])
+
+EMPTY_ADDRESS = ParsedAddress('', (), None, None, None, None, ())
+
+# 주소 유사도 항목별 점수 (rescore_candidates.py --weight 로 바꿔서 오프라인 재채점 가능)
+SIMILARITY_WEIGHTS = {
+    'sido': 1,              # 시/도 일치
+    'sigungu': 1,           # 시/군 일치
+    'dong_ri': 5,           # 동/리 일치 (가장 중요)
+    'dong_ri_partial': 3,   # 동/리 이름만 일치 (예: "고현동" vs "고현")
+    'detail': 1             # 상세 주소 조각마다
+}
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse(text):
+    parts = tuple(text.split())
+    # 동/리: 처음 나오는 '동' / '리'로 끝나는 조각
+    dong_ri = next((part for part in parts if part.endswith('동') or part.endswith('리')), None)
+    # 번지: 처음 나오는 '123-4' 형태 조각
+    bunji = next((part for part in parts if '-' in part and part.replace('-', '').isdigit()), None)
+    return ParsedAddress(
+        text=text,
+        parts=parts,
+        sido=parts[0] if len(parts) > 0 else None,
+        sigungu=parts[1] if len(parts) > 1 else None,
+        dong_ri=dong_ri,
+        bunji=bunji,
+        rest=parts[3:]
+    )
+
+
+def parse_address(address):
+    """주소 문자열을 ParsedAddress로 변환 (같은 문자열은 캐시 사용, 빈 값/NaN은 빈 주소)"""
+    if isinstance(address, ParsedAddress):
+        return address
+    if not isinstance(address, str) or not address:
+        return EMPTY_ADDRESS
+    return _parse(address)
+
+
+def similarity_breakdown(original_address, search_address, weights=None):
+    """원본 주소 기준 검색 주소의 항목별 매칭 [(항목, 값, 점수), ...]
+
+    기본 점수: 시/도 +1, 시/군 +1, 동/리 +5 (동/리 이름만 일치하면 +3), 상세 주소 조각마다 +1
+    """
+    weights = weights or SIMILARITY_WEIGHTS
+    original = parse_address(original_address)
+    search = parse_address(search_address).text
+    matched = []
+    if not original.parts or not search:
+        return matched
+
+    if original.sido in search:
+        matched.append(('시/도', original.sido, weights['sido']))
+    if original.sigungu is not None and original.sigungu in search:
+        matched.append(('시/군', original.sigungu, weights['sigungu']))
+
+    if original.dong_ri:
+        if original.dong_ri in search:
+            matched.append(('동/리', original.dong_ri, weights['dong_ri']))
+        else:
+            # 부분 매칭 (예: "고현동" vs "고현")
+            dong_ri_base = original.dong_ri.replace('동', '').replace('리', '')
+            if dong_ri_base in search:
+                matched.append(('동/리 부분', dong_ri_base, weights['dong_ri_partial']))
+
+    for detail in original.rest:
+        if detail in search:
+            matched.append(('상세 주소', detail, weights['detail']))
+    return matched
+
+
+def address_similarity(original_address, search_address, weights=None):
+    """원본 주소와 검색 주소의 유사도 점수"""
+    return sum(points for _, _, points in similarity_breakdown(original_address, search_address, weights))
+
+
+def jibun_similarity(original_address, jibun_address):
+    """원본 주소와 검색 구주소(지번)의 유사도 점수
+
+    동/리 정확히 일치 +10, 시/도 +1, 시/군 +1, 번지 일치 +5
+    """
+    original = parse_address(original_address)
+    jibun = parse_address(jibun_address)
+    if not original.parts:
+        return 0
+
+    score = 0
+    if original.dong_ri and jibun.dong_ri and original.dong_ri == jibun.dong_ri:
+        score += 10
+    if jibun.parts and original.sido in jibun.text:
+        score += 1
+    if len(original.parts) > 1 and len(jibun.parts) > 1 and original.sigungu in jibun.text:
+        score += 1
+    if original.bunji and jibun.bunji and original.bunji == jibun.bunji:
+        score += 5
+    return score
+
+
+def parse_cache_info():
+    """파싱 캐시 적중 / 미적중 횟수"""
+    return _parse.cache_info()
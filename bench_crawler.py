@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤러 처리량 벤치마크 (로컬 재현 서버 사용, 실제 네이버 지도에 접속하지 않음)
+
+fixture_server.py 를 띄우고 시나리오 업체로 만든 입력 CSV를 FlexibleCrawler로 처리한 뒤
+초당 처리 행 수, 단계별(검색 페이지 / 결과 확인 / 상세 추출 / 행 전체) 지연 시간,
+기대 전화번호 일치 수를 출력합니다.
+
+사용 예:
+    python bench_crawler.py --rows 30 --latency-ms 50
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+
+from config import CSV_CONFIG, CACHE_CONFIG, SITE_CONFIG, RATE_LIMIT_CONFIG
+from fixture_server import DEFAULT_SCENARIO_FILE, load_scenarios, start_fixture_server
+from result_store import read_results
+
+# 측정할 단계: (FlexibleCrawler 메서드명, 단계 이름)
+PHASES = [
+    ('_open_search_page', 'search_page'),
+    ('_check_and_extract_phone', 'result_check'),
+    ('extract_phone_number_from_detail', 'detail'),
+    ('process_row', 'row')
+]
+
+class PhaseTimer:
+    """메서드 호출 시간을 단계별로 모으는 측정기"""
+
+    def __init__(self):
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def wrap(self, cls, method_name, phase):
+        """클래스 메서드를 감싸서 호출 시간 기록 (병렬 워커에도 적용)"""
+        original = getattr(cls, method_name)
+        timer = self
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                timer.add(phase, time.perf_counter() - start)
+
+        setattr(cls, method_name, timed)
+
+    def add(self, phase, seconds):
+        with self.lock:
+            self.samples.setdefault(phase, []).append(seconds)
+
+    def summary(self):
+        """단계별 호출 수, 평균, p50, p95, 최대 (ms)"""
+        result = {}
+        for phase, values in self.samples.items():
+            values = sorted(values)
+            result[phase] = {
+                'count': len(values),
+                'mean_ms': sum(values) / len(values) * 1000,
+                'p50_ms': percentile(values, 50) * 1000,
+                'p95_ms': percentile(values, 95) * 1000,
+                'max_ms': values[-1] * 1000
+            }
+        return result
+
+def percentile(sorted_values, pct):
+    """정렬된 값에서 nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+def write_input_csv(path, scenarios, rows):
+    """시나리오 업체를 반복해서 rows개 행의 입력 CSV 생성 (인덱스 → 기대 전화번호 반환)"""
+    columns = CSV_CONFIG['columns']
+    headers = [columns['business_name'], columns['address']]
+    if columns.get('phone'):
+        headers.append(columns['phone'])
+
+    expected = {}
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        for i in range(rows):
+            scenario = scenarios[i % len(scenarios)]
+            row = [scenario['business_name'], scenario['address']]
+            if columns.get('phone'):
+                row.append('')
+            writer.writerow(row)
+            expected[i + 1] = scenario.get('expected_phone')
+    return expected
+
+def count_matches(result_file, expected):
+    """결과 파일의 새전화번호가 시나리오 기대값과 같은 행 수"""
+    df = read_results(result_file, dtype=str)
+    matched = 0
+    for index, new_phone in zip(df['인덱스'], df['새전화번호']):
+        want = expected.get(int(index))
+        got = new_phone if isinstance(new_phone, str) and '-' in new_phone else None
+        if got == want:
+            matched += 1
+    return matched, len(df)
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='로컬 재현 서버 기반 크롤러 벤치마크')
+    parser.add_argument('--rows', type=int, default=30, help='처리할 행 수')
+    parser.add_argument('--workers', type=int, default=1, help='병렬 워커 수')
+    parser.add_argument('--latency-ms', type=int, default=0, help='재현 서버 응답 지연 (ms)')
+    parser.add_argument('--detail-delay-ms', type=int, default=300, help='a.BfF3H 클릭 후 전화번호 표시 지연 (ms)')
+    parser.add_argument('--scenarios', default=DEFAULT_SCENARIO_FILE, help='시나리오 JSON 파일')
+    parser.add_argument('--politeness', action='store_true', help='요청 속도 조절 유지 (기본: 생략)')
+    parser.add_argument('--output', help='요약 결과를 저장할 JSON 파일')
+    args = parser.parse_args()
+
+    scenarios = load_scenarios(args.scenarios)
+    server, base_url = start_fixture_server(args.scenarios, latency_ms=args.latency_ms,
+                                            detail_delay_ms=args.detail_delay_ms)
+    print(f"🧪 재현 서버: {base_url}")
+
+    # 실제 사이트 대신 재현 서버로 접속하고, 캐시 없이 매번 브라우저로 처리
+    SITE_CONFIG['base_url'] = base_url
+    CACHE_CONFIG['mode'] = 'off'
+
+    # 결과 파일, 로그, 체크포인트는 임시 폴더에 생성
+    output_path = os.path.abspath(args.output) if args.output else None
+    workdir = tempfile.mkdtemp(prefix='bench_crawler_')
+    os.chdir(workdir)
+    input_file = os.path.join(workdir, 'bench_input.csv')
+    expected = write_input_csv(input_file, scenarios, args.rows)
+    CSV_CONFIG['target_file'] = input_file
+    print(f"📁 작업 폴더: {workdir}")
+
+    if not args.politeness:
+        RATE_LIMIT_CONFIG['enabled'] = False
+
+    from flexible_crawler import FlexibleCrawler
+
+    timer = PhaseTimer()
+    for method_name, phase in PHASES:
+        timer.wrap(FlexibleCrawler, method_name, phase)
+
+    crawler = FlexibleCrawler()
+    try:
+        # Chrome 실행 시간은 처리량에서 제외
+        crawler.start_driver()
+        start = time.perf_counter()
+        crawler.crawl_phone_numbers(workers=args.workers)
+        elapsed = time.perf_counter() - start
+        crawler.checkpoint_results()
+        matched, total = count_matches(crawler.result_file, expected)
+    finally:
+        crawler.close()
+        server.shutdown()
+
+    summary = {
+        'rows': total,
+        'workers': args.workers,
+        'latency_ms': args.latency_ms,
+        'elapsed_seconds': elapsed,
+        'rows_per_second': total / elapsed if elapsed else 0,
+        'expected_phone_matches': matched,
+        'phases': timer.summary(),
+        'pipeline_phases': crawler.metrics.summary()
+    }
+
+    print("\n" + "=" * 60)
+    print(f"📊 처리 행 수: {total}개, 소요 시간: {elapsed:.2f}초, 처리량: {summary['rows_per_second']:.2f} rows/sec")
+    print(f"✅ 기대 전화번호 일치: {matched}/{total}")
+    print(f"{'단계':<14}{'호출':>6}{'평균(ms)':>12}{'p50(ms)':>12}{'p95(ms)':>12}{'최대(ms)':>12}")
+    for method_name, phase in PHASES:
+        stats = summary['phases'].get(phase)
+        if not stats:
+            continue
+        print(f"{phase:<14}{stats['count']:>6}{stats['mean_ms']:>12.1f}{stats['p50_ms']:>12.1f}"
+              f"{stats['p95_ms']:>12.1f}{stats['max_ms']:>12.1f}")
+
+    print(f"\n{'세부 단계':<16}{'호출':>6}{'평균(ms)':>12}{'p50(ms)':>12}{'p95(ms)':>12}{'p99(ms)':>12}")
+    for phase, stats in sorted(summary['pipeline_phases'].items()):
+        print(f"{phase:<16}{stats['count']:>6}{stats['mean_ms']:>12.1f}{stats['p50_ms']:>12.1f}"
+              f"{stats['p95_ms']:>12.1f}{stats['p99_ms']:>12.1f}")
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"\n요약 결과 저장: {output_path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+update_phone_numbers.find_matching_businesses 벤치마크 스크립트
+(기존 iterrows 이중 루프와 업소명 사전 매칭 방식의 속도 및 결과 비교)
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from update_phone_numbers import clean_business_name, find_matching_businesses
+
+def find_matching_businesses_iterrows(stores_df, temp_df):
+    """기존 방식: temp 행마다 stores 전체를 iterrows로 순회 (비교 기준)"""
+    matches = []
+    stores_business_col = stores_df.columns[3]
+    temp_business_col = temp_df.columns[1]
+    temp_phone_col = temp_df.columns[4]
+
+    for idx, temp_row in temp_df.iterrows():
+        temp_business = clean_business_name(temp_row[temp_business_col])
+        temp_phone = temp_row[temp_phone_col]
+
+        for stores_idx, stores_row in stores_df.iterrows():
+            stores_business = clean_business_name(stores_row[stores_business_col])
+
+            if temp_business == stores_business:
+                matches.append({
+                    'temp_idx': idx,
+                    'stores_idx': stores_idx,
+                    'business_name': temp_business,
+                    'new_phone': temp_phone,
+                    'old_phone': stores_row.iloc[4],
+                    'has_phone': not (pd.isna(temp_phone) or temp_phone == "")
+                })
+                break
+
+    return matches
+
+def make_sample_data(stores_count, temp_count, seed=0):
+    """stores02.csv / temp.csv 와 같은 칼럼 구조의 샘플 데이터 생성"""
+    rng = random.Random(seed)
+
+    names = [f"업체{i:06d}" for i in range(stores_count)]
+    # 중복 업소명, 공백 차이, 빈 업소명도 일부 포함
+    for i in range(0, stores_count, 97):
+        names[i] = names[max(i - 1, 0)]
+    for i in range(0, stores_count, 131):
+        names[i] = np.nan
+
+    stores_df = pd.DataFrame({
+        '순번': range(1, stores_count + 1),
+        '구분': '일반음식점',
+        '지역': '동구',
+        '업소명': names,
+        '전화번호': [f"052-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}" for _ in range(stores_count)],
+        '주소': '울산광역시 동구'
+    })
+
+    temp_names = []
+    for _ in range(temp_count):
+        name = f"업체{rng.randint(0, int(stores_count * 1.2)):06d}"
+        if rng.random() < 0.1:
+            name = f"  {name[:2]}  {name[2:]} "
+        temp_names.append(name)
+
+    temp_df = pd.DataFrame({
+        '순번': range(1, temp_count + 1),
+        '사업장명': temp_names,
+        '주소': '울산광역시 동구',
+        '기존전화번호': '',
+        '새전화번호': [rng.choice(["", np.nan, f"052-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"])
+                  for _ in range(temp_count)]
+    })
+
+    return stores_df, temp_df
+
+def same_matches(left, right):
+    """두 매칭 결과가 같은지 비교 (NaN 전화번호는 같은 값으로 취급)"""
+    if len(left) != len(right):
+        return False
+    for a, b in zip(left, right):
+        for key in a:
+            if pd.isna(a[key]) and pd.isna(b[key]):
+                continue
+            if a[key] != b[key]:
+                return False
+    return True
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='업소명 매칭 벤치마크')
+    parser.add_argument('--stores', type=int, default=5000, help='stores02.csv 행 수')
+    parser.add_argument('--temp', type=int, default=1000, help='temp.csv 행 수')
+    parser.add_argument('--skip-loop', action='store_true', help='기존 이중 루프 측정 생략 (대용량 측정용)')
+    args = parser.parse_args()
+
+    stores_df, temp_df = make_sample_data(args.stores, args.temp)
+    print(f"샘플 데이터: stores {len(stores_df)}행, temp {len(temp_df)}행")
+
+    start = time.perf_counter()
+    matches = find_matching_businesses(stores_df, temp_df)
+    join_seconds = time.perf_counter() - start
+    print(f"사전 매칭: {join_seconds:.3f}초 ({len(matches)}개 일치)")
+
+    if args.skip_loop:
+        return
+
+    start = time.perf_counter()
+    loop_matches = find_matching_businesses_iterrows(stores_df, temp_df)
+    loop_seconds = time.perf_counter() - start
+    print(f"iterrows 이중 루프: {loop_seconds:.3f}초 ({len(loop_matches)}개 일치)")
+
+    print(f"속도 향상: {loop_seconds / max(join_seconds, 1e-9):.1f}배")
+    print(f"결과 일치: {'예' if same_matches(matches, loop_matches) else '아니오'}")
+
+if __name__ == "__main__":
+    main()
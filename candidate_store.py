@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+검색 후보 기록
+
+다중 결과 검색에서 확인한 상위 후보(이름, 주소, 업종, place id)와 실제로 선택한 후보를
+행마다 한 줄(JSON)씩 기록한다. 유사도 점수 규칙을 바꾼 뒤 rescore_candidates.py 가
+이 기록만으로 후보 선택을 다시 계산한다 (브라우저 / 재크롤링 불필요).
+여러 실행(다른 대상 CSV / 구간)이 같은 기록 파일에 쌓이므로 기록마다 결과 파일 이름을 남기고
+읽을 때 결과 파일 기준으로 구분한다.
+"""
+
+import json
+import os
+import threading
+
+import pandas as pd
+
+from metrics import _plain
+
+# 후보 한 개의 기록 항목
+CANDIDATE_FIELDS = ('index', 'name', 'address', 'category', 'place_id')
+
+
+class CandidateStore:
+    """행 단위 검색 후보 JSONL 기록기 (병렬 워커가 하나를 공유)"""
+
+    def __init__(self, records_file=None):
+        self.records_file = records_file
+        self.result_file = None
+        self.lock = threading.Lock()
+        self.records = open(records_file, 'a', encoding='utf-8') if records_file else None
+
+    @classmethod
+    def from_config(cls, config):
+        """CANDIDATE_CONFIG 설정으로 생성 (비활성화면 기록하지 않음)"""
+        if not config.get('enabled'):
+            return cls()
+        return cls(records_file=config.get('records_file'))
+
+    def set_result_file(self, result_file):
+        """이후 기록에 남길 결과 파일 (크롤러가 결과 파일을 열 때 설정)"""
+        self.result_file = result_run_name(result_file)
+
+    def write(self, row_index, business_name, original_address, searches):
+        """한 행의 검색 단계별 후보 기록 (후보가 있는 단계가 없으면 생략)"""
+        if not self.records or not any(search.get('candidates') for search in searches):
+            return
+        record = {
+            'result_file': self.result_file,
+            'row': _plain(row_index),
+            'business_name': _plain(business_name),
+            'address': _plain(original_address),
+            'searches': searches
+        }
+        with self.lock:
+            self.records.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self.records.flush()
+
+    def close(self):
+        with self.lock:
+            if self.records:
+                self.records.close()
+                self.records = None
+
+
+def result_run_name(result_file):
+    """결과 파일의 실행 이름 (경로 / 확장자 제외, 내보낸 .parquet 등도 같은 이름)"""
+    return os.path.splitext(os.path.basename(result_file))[0] if result_file else None
+
+
+def search_record(label, query, outcome, phone_number):
+    """검색 단계 1개의 후보 기록 생성 (검색 결과 / 캐시 결과 outcome 사용)"""
+    candidates = outcome.get('candidates') or []
+    chosen_index = outcome.get('chosen_index')
+    if chosen_index is None and outcome.get('place_id'):
+        # 선택 순위가 기록되기 전의 캐시 결과는 place id로 선택한 후보 확인
+        chosen_index = next((candidate.get('index') for candidate in candidates
+                             if candidate.get('place_id') == outcome['place_id']), None)
+    return {
+        'stage': label,
+        'query': query,
+        'reason': outcome.get('reason'),
+        'chosen_index': chosen_index,
+        'phone': phone_number,
+        'candidates': [
+            {field: candidate.get(field) for field in CANDIDATE_FIELDS}
+            for candidate in candidates
+        ]
+    }
+
+
+def load_candidate_frame(records_file, result_file=None):
+    """후보 기록 파일을 후보 1개당 1행인 DataFrame으로 읽기
+
+    컬럼: result_file, row, business_name, address, stage_order, stage, query, reason, chosen_index, phone,
+    candidate_index, candidate_name, candidate_address, candidate_category, candidate_place_id
+    후보가 없는 단계는 candidate_* 값이 비어 있는 1행, 같은 실행의 같은 행이 여러 번 기록되었으면 마지막 기록 사용
+    result_file을 지정하면 그 결과 파일을 만든 실행의 기록만 읽음 (결과 파일 이름이 없는 이전 기록은 제외)
+    """
+    run_name = result_run_name(result_file)
+    latest = {}
+    with open(records_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                if run_name and record.get('result_file') != run_name:
+                    continue
+                latest[(record.get('result_file'), record.get('row'))] = record
+
+    rows = []
+    for record in latest.values():
+        for stage_order, search in enumerate(record.get('searches') or []):
+            # 후보가 없는 단계(단일 결과 / 결과 없음)도 순서 판단용으로 후보 값 없이 1행 남김
+            for candidate in search.get('candidates') or [{}]:
+                rows.append((
+                    record.get('result_file'), record.get('row'), record.get('business_name'), record.get('address'),
+                    stage_order, search.get('stage'), search.get('query'), search.get('reason'),
+                    search.get('chosen_index'), search.get('phone'),
+                    *(candidate.get(field) for field in CANDIDATE_FIELDS)
+                ))
+
+    columns = ['result_file', 'row', 'business_name', 'address', 'stage_order', 'stage', 'query', 'reason',
+               'chosen_index', 'phone'] + [f"candidate_{field}" for field in CANDIDATE_FIELDS]
+    return pd.DataFrame(rows, columns=columns)
@@ -0,0 +1,777 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+DevTools 프로토콜 비동기 크롤링 엔진 (PARALLEL_CONFIG['engine'] = 'cdp', websockets 필요)
+
+스레드 병렬 모드는 워커마다 Chrome + WebDriver 세션을 하나씩 띄우지만, 이 엔진은 Chrome 하나에
+세션마다 쿠키 / 저장소가 분리된 브라우저 컨텍스트 + 탭을 열고(Chrome 하나당 세션 수는
+CDP_CONFIG['contexts_per_browser']), Chrome마다 DevTools 웹소켓 하나로 모든 탭을
+asyncio 이벤트 루프 한 곳에서 제어한다.
+각 탭은 FlexibleCrawler 의 검색 → 결과 개수 → 후보 선택 → 상세 페이지 흐름을 코루틴으로 실행하고,
+검색 상태 / 캐시 / 점수 계산 / 후보 기록은 탭마다 만든 WebDriver 없는 FlexibleCrawler 를 그대로 사용한다.
+(페이지 대기 중에는 다른 탭이 진행되므로 대기 시간이 겹쳐짐)
+"""
+
+import asyncio
+import itertools
+import json
+import math
+import time
+import urllib.request
+
+from config import CANDIDATE_CONFIG, CDP_CONFIG, SITE_CONFIG
+from driver_utils import STEALTH_SCRIPTS, get_blocked_url_patterns, get_browser_profile, get_debugger_address
+from page_scripts import (
+    SEARCH_CANDIDATES_SCRIPT, PLACE_SUMMARY_SCRIPT, RESULT_COUNT_SCRIPT, CLICK_RESULT_SCRIPT,
+    SINGLE_ADDRESS_SCRIPT, TEL_LINK_SCRIPT, PHONE_TOGGLE_SCRIPT, PHONE_TEXT_SCRIPT, HAS_ELEMENT_SCRIPT,
+    FRAME_SRC_SCRIPT, extract_place_id
+)
+from page_waits import (
+    SEARCH_STATE_SCRIPT, BLOCKED_PAGE_SCRIPT, PLACE_NOT_FOUND_SCRIPT, ENTRY_READY_SCRIPT,
+    SEARCH_ENTRY, SEARCH_TIMEOUT, SEARCH_BLOCKED, PLACE_NOT_FOUND
+)
+from rate_limiter import SearchBlockedError
+from search_cache import normalize_query
+from search_strategy import (
+    REASON_PHONE_FOUND, REASON_NO_PHONE, REASON_NO_RESULTS, REASON_TIMEOUT, REASON_ERROR,
+    REASON_PLACE_NOT_FOUND, REASON_PLACE_MISMATCH, describe_reason
+)
+from candidate_store import search_record
+from session_recycler import JS_HEAP_SCRIPT, MB, RECYCLE_NAVIGATIONS, RECYCLE_JS_HEAP, RECYCLE_CRASHED
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+SEARCH_FRAME = 'searchIframe'
+ENTRY_FRAME = 'entryIframe'
+ISOLATED_WORLD = 'crawler'
+
+# 결과 클릭 시 시도할 링크 선택자 (WebDriver 흐름과 같은 순서)
+BEST_RESULT_LINKS = ["li.VLTHu.OW9LQ a.place_bluelink", ".place_bluelink"]
+SINGLE_RESULT_LINKS = ["a.place_bluelink", "li.VLTHu.OW9LQ a"]
+PHONE_TEXT_SELECTOR = "div._YI7T.kH0zp em"
+
+
+class CdpError(Exception):
+    """DevTools 명령 실패 / 연결 종료"""
+
+
+def browser_websocket_url(debugger_address, timeout=10):
+    """DevTools 주소(host:port)의 브라우저 웹소켓 URL"""
+    with urllib.request.urlopen(f"http://{debugger_address}/json/version", timeout=timeout) as response:
+        return json.loads(response.read().decode('utf-8'))['webSocketDebuggerUrl']
+
+
+class CdpConnection:
+    """브라우저 웹소켓 하나 (탭별 명령은 flatten 세션 id로 구분)"""
+
+    def __init__(self, websocket, command_timeout=30):
+        self.websocket = websocket
+        self.command_timeout = command_timeout
+        self.ids = itertools.count(1)
+        self.pending = {}
+        self.closed = False
+        self.reader = asyncio.ensure_future(self._read_loop())
+
+    @classmethod
+    async def connect(cls, debugger_address, command_timeout=30):
+        """실행 중인 Chrome의 DevTools에 연결"""
+        if websockets is None:
+            raise ImportError("websockets 가 설치되어 있지 않습니다 (pip install websockets)")
+        url = await asyncio.to_thread(browser_websocket_url, debugger_address)
+        websocket = await websockets.connect(url, max_size=None)
+        return cls(websocket, command_timeout)
+
+    async def send(self, method, params=None, session_id=None):
+        """DevTools 명령 전송 후 결과 대기"""
+        if self.closed:
+            raise CdpError(f"{method}: DevTools 연결이 종료되었습니다")
+        message_id = next(self.ids)
+        message = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[message_id] = future
+        try:
+            await self.websocket.send(json.dumps(message))
+            response = await asyncio.wait_for(future, self.command_timeout)
+        except asyncio.TimeoutError:
+            raise CdpError(f"{method}: {self.command_timeout}초 안에 응답 없음")
+        finally:
+            self.pending.pop(message_id, None)
+
+        if 'error' in response:
+            raise CdpError(f"{method}: {response['error'].get('message')}")
+        return response.get('result', {})
+
+    async def _read_loop(self):
+        """응답을 요청별 future로 전달 (이벤트는 사용하지 않음, 페이지 상태는 폴링으로 확인)"""
+        try:
+            async for raw in self.websocket:
+                message = json.loads(raw)
+                future = self.pending.get(message.get('id'))
+                if future and not future.done():
+                    future.set_result(message)
+        except Exception:
+            pass
+        finally:
+            self.closed = True
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(CdpError("DevTools 연결이 종료되었습니다"))
+
+    async def new_page(self, url='about:blank', isolated=False):
+        """새 탭을 열고 연결 (isolated: 쿠키 / 저장소가 분리된 새 브라우저 컨텍스트에서 열기)"""
+        params = {'url': url}
+        context_id = None
+        if isolated:
+            # 웹소켓 연결이 끊기면 Chrome이 컨텍스트를 정리하도록 disposeOnDetach 사용
+            context = await self.send('Target.createBrowserContext', {'disposeOnDetach': True})
+            context_id = params['browserContextId'] = context['browserContextId']
+        target = await self.send('Target.createTarget', params)
+        attached = await self.send('Target.attachToTarget', {'targetId': target['targetId'], 'flatten': True})
+        return CdpPage(self, target['targetId'], attached['sessionId'], context_id)
+
+    async def close(self):
+        """웹소켓 종료 (Chrome은 종료하지 않음)"""
+        await self.websocket.close()
+        self.reader.cancel()
+
+
+class CdpPage:
+    """탭 하나 (메인 문서 / iframe 안에서 스크립트 실행, browser_context_id: 이 탭 전용 컨텍스트)"""
+
+    def __init__(self, connection, target_id, session_id, browser_context_id=None):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+        self.browser_context_id = browser_context_id
+        self.frame_contexts = {}
+
+    async def send(self, method, **params):
+        """이 탭 세션으로 DevTools 명령 전송"""
+        return await self.connection.send(method, params, self.session_id)
+
+    async def prepare(self, profile):
+        """요청 차단 + 봇 탐지 회피 스크립트 (prepare_session 과 같은 설정, 새 문서마다 적용)"""
+        await self.send('Page.enable')
+        patterns = get_blocked_url_patterns(profile)
+        if patterns:
+            await self.send('Network.enable')
+            await self.send('Network.setBlockedURLs', urls=patterns)
+        for script in STEALTH_SCRIPTS:
+            await self.send('Page.addScriptToEvaluateOnNewDocument', source=script)
+        return len(patterns)
+
+    async def navigate(self, url):
+        """페이지 이동 요청 (로딩 완료는 기다리지 않음, 이전 프레임 실행 컨텍스트는 버림)"""
+        self.frame_contexts.clear()
+        result = await self.send('Page.navigate', url=url)
+        if result.get('errorText'):
+            raise CdpError(f"페이지 이동 실패: {result['errorText']}")
+
+    async def _frame_context(self, frame):
+        """iframe(id) 문서에서 스크립트를 실행할 isolated world 컨텍스트 (iframe이 없으면 None)"""
+        found = await self.send('Runtime.evaluate', expression=f"document.getElementById({json.dumps(frame)})")
+        element = found.get('result', {})
+        if 'objectId' not in element:
+            return None
+        try:
+            node = await self.send('DOM.describeNode', objectId=element['objectId'])
+        finally:
+            await self.send('Runtime.releaseObject', objectId=element['objectId'])
+        frame_id = node['node'].get('frameId')
+        if not frame_id:
+            return None
+
+        if frame_id not in self.frame_contexts:
+            world = await self.send('Page.createIsolatedWorld', frameId=frame_id, worldName=ISOLATED_WORLD)
+            self.frame_contexts[frame_id] = world['executionContextId']
+        return self.frame_contexts[frame_id]
+
+    async def evaluate(self, script, *args, frame=None):
+        """execute_script 형식(return / arguments) 스크립트 실행 (frame: iframe id, 없으면 None 반환)"""
+        params = {
+            'expression': f"(function () {{\n{script}\n}}).apply(null, {json.dumps(list(args), ensure_ascii=False)})",
+            'returnByValue': True,
+            'awaitPromise': True
+        }
+        for attempt in range(2):
+            if frame:
+                context_id = await self._frame_context(frame)
+                if context_id is None:
+                    return None
+                params['contextId'] = context_id
+            try:
+                result = await self.send('Runtime.evaluate', **params)
+                break
+            except CdpError:
+                # iframe 문서가 바뀌어서 이전 컨텍스트가 사라진 경우 한 번 다시 만듦
+                if not frame or attempt:
+                    raise
+                self.frame_contexts.clear()
+
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise CdpError(details.get('exception', {}).get('description') or details.get('text'))
+        return result.get('result', {}).get('value')
+
+    async def close(self):
+        """탭 닫기 (전용 컨텍스트면 쿠키 / 저장소와 함께 삭제)"""
+        try:
+            await self.connection.send('Target.closeTarget', {'targetId': self.target_id})
+            if self.browser_context_id:
+                await self.connection.send('Target.disposeBrowserContext',
+                                           {'browserContextId': self.browser_context_id})
+        except CdpError:
+            pass
+
+
+class CdpBrowserPool:
+    """세션을 Chrome 여러 개에 나눠 배치 (Chrome 하나당 contexts_per_browser개, 세션마다 컨텍스트 + 탭)"""
+
+    def __init__(self, crawler, contexts_per_browser=None, isolate_contexts=True):
+        self.crawler = crawler
+        self.contexts_per_browser = contexts_per_browser
+        self.isolate_contexts = isolate_contexts
+        self.browser_hosts = []
+        self.connections = []
+
+    @classmethod
+    def from_config(cls, crawler, config):
+        """CDP_CONFIG 설정으로 생성"""
+        return cls(
+            crawler,
+            contexts_per_browser=config.get('contexts_per_browser'),
+            isolate_contexts=config.get('isolate_contexts', True)
+        )
+
+    def browser_count(self, sessions):
+        """세션 수에 필요한 Chrome 수 (실행 중인 Chrome에 연결한 경우는 그 Chrome 하나)"""
+        if self.crawler.attached or not self.contexts_per_browser:
+            return 1
+        return max(math.ceil(sessions / self.contexts_per_browser), 1)
+
+    async def open(self, sessions, command_timeout=30):
+        """필요한 만큼 Chrome을 띄워 연결하고 세션 수만큼 탭 생성 (Chrome마다 고르게 배치)"""
+        drivers = [self.crawler.start_driver()]
+        for number in range(1, self.browser_count(sessions)):
+            # 추가 Chrome은 WebDriver 세션을 가진 크롤러로 실행 (검색은 하지 않음)
+            host = type(self.crawler)(worker_id=number, metrics=self.crawler.metrics,
+                                      candidate_store=self.crawler.candidate_store)
+            self.browser_hosts.append(host)
+            drivers.append(host.start_driver())
+
+        for driver in drivers:
+            self.connections.append(await CdpConnection.connect(get_debugger_address(driver), command_timeout))
+
+        pages = []
+        for number in range(sessions):
+            connection = self.connections[number % len(self.connections)]
+            pages.append(await connection.new_page(isolated=self.isolate_contexts))
+        return pages
+
+    async def close(self):
+        """웹소켓 연결 종료 후 추가로 띄운 Chrome 종료 (첫 번째 Chrome은 crawler가 관리)"""
+        for connection in self.connections:
+            await connection.close()
+        for host in self.browser_hosts:
+            host.close()
+
+
+class CdpSearchSession:
+    """탭 하나에서 FlexibleCrawler 검색 흐름을 코루틴으로 실행 (crawler: 이 세션의 검색 상태)"""
+
+    def __init__(self, crawler, page, profile, session_number):
+        self.crawler = crawler
+        self.page = page
+        self.profile = profile
+        self.session_number = session_number
+        self.wait_config = crawler.wait_config
+        self.metrics = crawler.metrics
+
+    async def wait_until(self, check, timeout, poll_interval):
+        """check() 코루틴이 참 값을 반환할 때까지 대기 (시간 초과면 None)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                value = await check()
+                if value:
+                    return value
+            except CdpError:
+                pass
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(poll_interval)
+
+    async def has_frame(self, frame):
+        """메인 문서에 iframe(id)이 있는지 확인"""
+        return await self.page.evaluate(HAS_ELEMENT_SCRIPT, f"#{frame}")
+
+    # ----- 페이지 상태 (page_waits.py 와 같은 판단) -----
+
+    async def search_state(self):
+        """현재 검색 페이지 상태 (아직 준비되지 않았으면 False)"""
+        has_search_frame = await self.has_frame(SEARCH_FRAME)
+        if has_search_frame:
+            state = await self.page.evaluate(SEARCH_STATE_SCRIPT, frame=SEARCH_FRAME)
+            if state:
+                return state
+        if await self.has_frame(ENTRY_FRAME):
+            return SEARCH_ENTRY
+        if not has_search_frame and await self.page.evaluate(BLOCKED_PAGE_SCRIPT):
+            return SEARCH_BLOCKED
+        return False
+
+    async def wait_for_search_ready(self):
+        state = await self.wait_until(self.search_state, self.wait_config['search_timeout'],
+                                      self.wait_config['poll_interval'])
+        return state or SEARCH_TIMEOUT
+
+    async def place_state(self):
+        """place id 상세 페이지 상태 (page_waits._place_state 와 같은 판단)"""
+        if await self.has_frame(ENTRY_FRAME):
+            not_found = await self.page.evaluate(PLACE_NOT_FOUND_SCRIPT, frame=ENTRY_FRAME)
+            return PLACE_NOT_FOUND if not_found else SEARCH_ENTRY
+        if await self.page.evaluate(PLACE_NOT_FOUND_SCRIPT):
+            return PLACE_NOT_FOUND
+        if await self.page.evaluate(BLOCKED_PAGE_SCRIPT):
+            return SEARCH_BLOCKED
+        return False
+
+    async def wait_for_place_ready(self):
+        state = await self.wait_until(self.place_state, self.wait_config['place_timeout'],
+                                      self.wait_config['poll_interval'])
+        return state or SEARCH_TIMEOUT
+
+    async def wait_for_entry_ready(self, timeout=None):
+        async def entry_ready():
+            return await self.page.evaluate(ENTRY_READY_SCRIPT, frame=ENTRY_FRAME)
+        return bool(await self.wait_until(entry_ready, timeout or self.wait_config['detail_timeout'],
+                                          self.wait_config['poll_interval']))
+
+    # ----- 탭 재시작 (SESSION_CONFIG) -----
+
+    async def recycle_reason(self):
+        """탭을 새로 열어야 하면 사유 (이동 횟수 / JS 힙, 브라우저 RSS는 Chrome 전체라 확인하지 않음)"""
+        recycler = self.crawler.session_recycler
+        if not recycler.enabled:
+            return None
+        if recycler.max_navigations and recycler.navigations >= recycler.max_navigations:
+            return RECYCLE_NAVIGATIONS
+        if not recycler.max_js_heap_mb or not recycler.navigations or recycler.navigations % recycler.check_every:
+            return None
+        try:
+            heap = await self.page.evaluate(JS_HEAP_SCRIPT)
+        except CdpError:
+            return None
+        if heap:
+            recycler.last_usage = {'js_heap_mb': heap / MB}
+            if heap / MB >= recycler.max_js_heap_mb:
+                return RECYCLE_JS_HEAP
+        return None
+
+    async def recycle_page(self, reason):
+        """현재 탭을 닫고 새 탭으로 교체"""
+        recycler = self.crawler.session_recycler
+        message = f"♻️ [세션 {self.session_number}] 탭 재시작: {recycler.describe(reason)}"
+        print(message)
+        self.crawler.logger.info(message)
+        with self.metrics.span('recycle'):
+            connection = self.page.connection
+            isolated = self.page.browser_context_id is not None
+            await self.page.close()
+            self.page = await connection.new_page(isolated=isolated)
+            await self.page.prepare(self.profile)
+        recycler.reset()
+
+    # ----- 검색 흐름 (FlexibleCrawler 와 같은 순서) -----
+
+    async def process_row(self, row):
+        """행 1개 검색 후 (결과, 실제 검색 여부) 반환"""
+        crawler = self.crawler
+        skipped, dong_name = crawler._prepare_row(row.index, row.business_name, row.address, row.phone)
+        if skipped:
+            return skipped, False
+        new_phone = await self.search_and_extract_phone(row.business_name, dong_name, row.address)
+        return crawler._build_row_result(row.index, row.business_name, row.address, row.phone, new_phone), True
+
+    async def search_and_extract_phone(self, business_name, dong_name, original_address):
+        """검색과 전화번호 추출"""
+        crawler = self.crawler
+        try:
+            crawler._begin_search(original_address)
+
+            if crawler.refresh_by_place_id:
+                opened, phone_number = await self.open_known_place(business_name)
+                if opened:
+                    return phone_number
+
+            phone_number, trace = await crawler.search_tree.run_async(
+                self.run_decision_stage, business_name=business_name, dong_name=dong_name or ''
+            )
+            crawler._record_search_trace(business_name, trace)
+            return crawler._search_conclusion(phone_number)
+
+        except SearchBlockedError:
+            raise
+        except Exception as e:
+            crawler.logger.error(f"검색 및 전화번호 추출 중 오류: {e}")
+            print(f"검색 및 전화번호 추출 중 오류: {e}")
+            return None
+
+    async def run_decision_stage(self, search_query, label):
+        """결정 트리의 검색 단계 1개 실행 (전화번호, 실패 사유) 반환"""
+        crawler = self.crawler
+        print(f"=== [세션 {self.session_number}] {label} 검색: {search_query} ===")
+        crawler.logger.info(f"=== [세션 {self.session_number}] {label} 검색: {search_query} ===")
+
+        handled, phone_number = crawler._search_from_cache(search_query, label)
+        if not handled:
+            search_url = crawler._search_url(search_query, label)
+            await self.open_search_page(search_url, label)
+            phone_number = await self.check_and_extract_phone()
+
+            place_id = None
+            if crawler.search_cache and not crawler.current_search_outcome.get('place_id'):
+                place_id = await self.current_place_id()
+            phone_number = crawler._finish_search_stage(search_query, phone_number, place_id)
+
+        crawler.current_search_records.append(
+            search_record(label, search_query, crawler.current_search_outcome, phone_number)
+        )
+        return phone_number, crawler.current_search_outcome.get('reason')
+
+    async def open_search_page(self, search_url, label):
+        """페이지 이동 후 결과가 준비될 때까지 대기"""
+        crawler = self.crawler
+        await self.navigate(search_url, label)
+
+        with self.metrics.span('search_wait'):
+            state = await self.wait_for_search_ready()
+        crawler.current_search_state = state
+        crawler.logger.info(f"{label} 검색 페이지 상태: {state}")
+
+        crawler.rate_limiter.record_search_state(state)
+        if state == SEARCH_BLOCKED:
+            crawler.logger.warning(f"{label} 검색 중 접근 제한 페이지 감지: {search_url}")
+            raise SearchBlockedError("네이버 지도 접근 제한 페이지 감지")
+        return state
+
+    async def open_place_page(self, place_url):
+        """저장된 place id 상세 페이지 이동 후 상태 확인 (없는 장소 / 시간 초과는 요청 속도 조절에 반영하지 않음)"""
+        crawler = self.crawler
+        await self.navigate(place_url, "place id")
+
+        with self.metrics.span('search_wait'):
+            state = await self.wait_for_place_ready()
+        crawler.logger.info(f"place id 상세 페이지 상태: {state}")
+
+        if state in (SEARCH_ENTRY, SEARCH_BLOCKED):
+            crawler.rate_limiter.record_search_state(state)
+        if state == SEARCH_BLOCKED:
+            crawler.logger.warning(f"place id 상세 페이지에서 접근 제한 페이지 감지: {place_url}")
+            raise SearchBlockedError("네이버 지도 접근 제한 페이지 감지")
+        return state
+
+    async def navigate(self, url, label):
+        """요청 속도 조절 후 페이지 이동 (필요하면 이동 전에 탭 재시작)"""
+        crawler = self.crawler
+        reason = await self.recycle_reason()
+        if reason:
+            await self.recycle_page(reason)
+
+        # 공유 속도 조절기는 스레드에서 대기 (대기하는 동안 다른 탭은 계속 진행)
+        with self.metrics.span('politeness_wait'):
+            delay = await asyncio.to_thread(crawler.rate_limiter.acquire)
+        if delay:
+            print(f"[세션 {self.session_number}] {label} 검색 전 {delay:.1f}초 대기 (네이버 차단 방지)")
+
+        with self.metrics.span('navigate'):
+            try:
+                await self.page.navigate(url)
+            except CdpError:
+                # 탭이 닫혔거나 응답이 없으면 새 탭으로 한 번 더 시도
+                await self.recycle_page(RECYCLE_CRASHED)
+                await self.page.navigate(url)
+        crawler.session_recycler.record_navigation()
+
+    async def check_and_extract_phone(self):
+        """현재 페이지에서 결과 개수에 따라 전화번호 확인 (_check_and_extract_phone)"""
+        crawler = self.crawler
+        outcome = crawler.current_search_outcome
+        state = crawler.current_search_state
+        crawler.current_search_state = None
+        try:
+            # 결과 리스트 없이 상세 페이지(entryIframe)가 바로 열린 경우
+            if state == SEARCH_ENTRY:
+                return await self.process_entry_result()
+
+            try:
+                if state == SEARCH_TIMEOUT:
+                    print("⚠️ 검색 결과 로딩 대기 시간 초과")
+                    outcome['reason'] = REASON_TIMEOUT
+
+                with self.metrics.span('result_count'):
+                    result_count = await self.page.evaluate(RESULT_COUNT_SCRIPT, frame=SEARCH_FRAME)
+                if result_count is None:
+                    raise CdpError("searchIframe 없음")
+                print(f"🔍 [세션 {self.session_number}] 검색 결과 개수: {result_count}")
+                outcome['result_count'] = result_count
+
+                if result_count == 0:
+                    print("❌ 검색 결과가 없습니다.")
+                    if state != SEARCH_TIMEOUT:
+                        outcome['reason'] = REASON_NO_RESULTS
+                    return None
+                if result_count == 1:
+                    return await self.process_single_result()
+                return await self.process_multiple_results()
+
+            except CdpError as e:
+                print(f"❌ searchIframe 처리 중 오류: {e}")
+
+            # searchIframe에서 결과가 없으면 entryIframe 확인
+            with self.metrics.span('direct_phone'):
+                return await self.extract_phone_number_direct()
+
+        except Exception as e:
+            print(f"전화번호 확인 중 오류: {e}")
+            outcome['reason'] = REASON_ERROR
+            return None
+
+    async def process_entry_result(self):
+        """바로 열린 상세 페이지: 로딩 대기 → 전화번호 추출 → 주소로 사유 판단 (_process_entry_result)"""
+        crawler = self.crawler
+        if not await self.wait_for_entry_ready():
+            print("⚠️ 상세 페이지 로딩 대기 시간 초과")
+            crawler.current_search_outcome['reason'] = REASON_TIMEOUT
+            return None
+
+        summary = json.loads(await self.page.evaluate(PLACE_SUMMARY_SCRIPT, frame=ENTRY_FRAME) or '{}')
+        if summary.get('address'):
+            crawler.current_collected_address = summary['address']
+
+        with self.metrics.span('detail'):
+            phone_number = await self.extract_phone_number_direct() or await self.extract_phone_number_from_detail()
+        if phone_number:
+            return phone_number
+
+        if summary.get('address'):
+            crawler._judge_single_result_address(summary['address'])
+        else:
+            crawler.current_search_outcome['reason'] = REASON_NO_PHONE
+        return None
+
+    async def process_single_result(self):
+        """단일 결과: 직접 추출 → 클릭 후 상세 → 주소로 사유 판단"""
+        with self.metrics.span('direct_phone'):
+            phone_number = await self.extract_phone_number_direct()
+        if phone_number:
+            return phone_number
+
+        _, phone_number = await self.click_result_and_extract(0, SINGLE_RESULT_LINKS)
+        if phone_number:
+            return phone_number
+
+        address = await self.page.evaluate(SINGLE_ADDRESS_SCRIPT, frame=SEARCH_FRAME)
+        if address:
+            self.crawler.current_collected_address = address
+        self.crawler._judge_single_result_address(address)
+        return None
+
+    async def process_multiple_results(self):
+        """다중 결과: 후보 수집 → 대상 지역 / 유사도 점수로 선택 → 클릭 후 상세"""
+        crawler = self.crawler
+        with self.metrics.span('candidates'):
+            raw = await self.page.evaluate(SEARCH_CANDIDATES_SCRIPT, CANDIDATE_CONFIG['top_k'], frame=SEARCH_FRAME)
+        candidates = json.loads(raw or '[]')
+        for candidate in candidates:
+            candidate['place_id'] = extract_place_id(candidate.get('href'))
+        if not candidates:
+            print("❌ 다중 결과에서 검색 결과 요소를 찾을 수 없음")
+            return None
+
+        best_result = crawler._choose_candidate(candidates)
+        if not best_result:
+            return None
+        # 상세 페이지가 열리지 않았으면 일시적인 오류로 기록 (다음 단계 진행, 캐시에 저장하지 않음)
+        opened, phone_number = await self.click_result_and_extract(best_result['index'], BEST_RESULT_LINKS)
+        if not phone_number:
+            crawler.current_search_outcome['reason'] = REASON_NO_PHONE if opened else REASON_ERROR
+        return phone_number
+
+    async def click_result_and_extract(self, index, selectors):
+        """searchIframe의 N번째 결과를 클릭하고 상세 정보에서 전화번호 추출 ((상세 페이지가 열렸는지, 전화번호) 반환)"""
+        try:
+            with self.metrics.span('click'):
+                clicked = await self.page.evaluate(CLICK_RESULT_SCRIPT, index, selectors, frame=SEARCH_FRAME)
+                if clicked is None:
+                    print(f"인덱스 {index}에 해당하는 클릭 가능한 요소를 찾을 수 없음")
+                    return False, None
+                opened = await self.wait_for_entry_ready()
+        except CdpError as e:
+            print(f"결과 클릭 중 오류: {e}")
+            return False, None
+        with self.metrics.span('detail'):
+            return opened, await self.extract_phone_number_from_detail()
+
+    async def extract_phone_number_direct(self):
+        """entryIframe의 tel: 링크 (entryIframe은 최대 5초 대기)"""
+        async def entry_frame():
+            return await self.has_frame(ENTRY_FRAME)
+        if not await self.wait_until(entry_frame, 5, self.wait_config['poll_interval']):
+            return None
+        return await self.page.evaluate(TEL_LINK_SCRIPT, frame=ENTRY_FRAME)
+
+    async def extract_phone_number_from_detail(self):
+        """a.BfF3H(전화번호 보기)를 entryIframe → searchIframe → 메인 순서로 찾아 펼친 뒤 전화번호 추출"""
+        for frame in (ENTRY_FRAME, SEARCH_FRAME, None):
+            try:
+                with self.metrics.span('phone_toggle'):
+                    toggled = await self.page.evaluate(PHONE_TOGGLE_SCRIPT, frame=frame)
+                    if toggled:
+                        async def phone_text():
+                            return await self.page.evaluate(PHONE_TEXT_SCRIPT, PHONE_TEXT_SELECTOR, frame=frame)
+                        return await self.wait_until(phone_text, self.wait_config['detail_timeout'],
+                                                     self.wait_config['poll_interval'])
+            except CdpError as e:
+                print(f"{frame or '메인 페이지'}에서 a.BfF3H 처리 중 오류: {e}")
+
+        # a.BfF3H가 없으면 tel: 링크 → span.xlx7Q 순서로 확인
+        phone_number = await self.page.evaluate(TEL_LINK_SCRIPT, frame=ENTRY_FRAME)
+        if phone_number:
+            return phone_number
+        return await self.page.evaluate(PHONE_TEXT_SCRIPT, "span.xlx7Q")
+
+    async def current_place_id(self):
+        """현재 페이지 / entryIframe 주소의 place id"""
+        try:
+            place_id = extract_place_id(await self.page.evaluate("return location.href;"))
+            if place_id:
+                return place_id
+            return extract_place_id(await self.page.evaluate(FRAME_SRC_SCRIPT, ENTRY_FRAME))
+        except CdpError as e:
+            print(f"place id 확인 중 오류: {e}")
+            return None
+
+    async def open_known_place(self, business_name):
+        """저장된 place id로 상세 페이지를 바로 열어 전화번호 확인 (_open_known_place)"""
+        crawler = self.crawler
+        if not crawler.search_cache or crawler.cache_config['mode'] == 'replay':
+            return False, None
+        place_id = crawler.search_cache.get_place_id(business_name, crawler.current_original_address)
+        if not place_id:
+            return False, None
+
+        print(f"=== [세션 {self.session_number}] 저장된 place id로 상세 페이지 이동: {place_id} ===")
+        place_url = SITE_CONFIG['base_url'] + SITE_CONFIG['place_path'].format(place_id=place_id)
+        crawler.current_search_outcome = {'result_count': None, 'candidates': [], 'place_id': place_id, 'reason': None}
+
+        state = await self.open_place_page(place_url)
+
+        reason = None
+        if state == SEARCH_TIMEOUT:
+            reason = REASON_TIMEOUT
+        elif state != SEARCH_ENTRY or not await self.wait_for_entry_ready():
+            reason = REASON_PLACE_NOT_FOUND
+        else:
+            summary = json.loads(await self.page.evaluate(PLACE_SUMMARY_SCRIPT, frame=ENTRY_FRAME) or '{}')
+            place_name = normalize_query(summary.get('name')).replace(' ', '')
+            target_name = normalize_query(business_name).replace(' ', '')
+            if place_name and target_name not in place_name and place_name not in target_name:
+                print(f"❌ 업체명 불일치: {summary.get('name')}")
+                reason = REASON_PLACE_MISMATCH
+            elif summary.get('address'):
+                crawler.current_collected_address = summary['address']
+
+        if reason:
+            if reason != REASON_TIMEOUT:
+                crawler.search_cache.forget_place_id(business_name, crawler.current_original_address)
+            crawler.current_search_trace.append({'stage': 'place', 'query': place_id, 'reason': reason, 'escalate': True})
+            print(f"place id 상세 페이지 ({place_id}): {describe_reason(reason)} → 검색으로 진행")
+            return False, None
+
+        with self.metrics.span('detail'):
+            phone_number = await self.extract_phone_number_direct() or await self.extract_phone_number_from_detail()
+        reason = REASON_PHONE_FOUND if phone_number else REASON_NO_PHONE
+        crawler.current_search_outcome['reason'] = reason
+        crawler.current_search_trace.append({'stage': 'place', 'query': place_id, 'reason': reason})
+        self.metrics.annotate(search=crawler.current_search_trace)
+        print(f"place id 상세 페이지 ({place_id}): {describe_reason(reason)}")
+        return True, phone_number
+
+
+async def crawl_rows_cdp(crawler, rows, total_count, sessions, ordered_output):
+    """Chrome 탭 여러 개로 행을 나눠 처리 (결과 저장은 crawler 한 곳에서)"""
+    pool = CdpBrowserPool.from_config(crawler, CDP_CONFIG)
+    profile = get_browser_profile()
+    search_sessions = []
+    try:
+        pages = await pool.open(sessions, CDP_CONFIG['command_timeout'])
+        for number, page in enumerate(pages):
+            await page.prepare(profile)
+            # 탭마다 검색 상태를 따로 갖는 WebDriver 없는 크롤러 (측정기 / 후보 기록기는 공유)
+            worker = type(crawler)(worker_id=number + 1, metrics=crawler.metrics,
+                                   candidate_store=crawler.candidate_store, use_webdriver=False)
+            worker.refresh_cache = crawler.refresh_cache
+            worker.refresh_by_place_id = crawler.refresh_by_place_id
+            search_sessions.append(CdpSearchSession(worker, page, profile, number + 1))
+        isolation = '세션별 컨텍스트' if pool.isolate_contexts else '컨텍스트 공유'
+        print(f"⚡ DevTools 비동기 크롤링 시작: Chrome {len(pool.connections)}개, 탭 {len(search_sessions)}개 ({isolation}), "
+              f"{'순서 유지' if ordered_output else '완료 순'} 저장")
+        crawler.logger.info(f"⚡ DevTools 비동기 크롤링 시작: Chrome {len(pool.connections)}개, 탭 {len(search_sessions)}개, "
+                            f"isolate_contexts={pool.isolate_contexts}, ordered_output={ordered_output}")
+
+        # 행 공급 / 결과 저장은 이벤트 루프 한 곳에서만 실행되므로 잠금이 필요 없음
+        row_iter = enumerate(rows)
+        pending = {}
+        next_position = 0
+
+        def save(position, result_data, searched):
+            nonlocal next_position
+            if not ordered_output:
+                crawler._save_parallel_result(result_data, searched)
+                return
+            pending[position] = (result_data, searched)
+            while next_position in pending:
+                crawler._save_parallel_result(*pending.pop(next_position))
+                next_position += 1
+
+        async def session_loop(session):
+            worker = session.crawler
+            for position, row in row_iter:
+                worker.metrics.start_row(row.index, row.business_name, worker.worker_id)
+                row_status = None
+                try:
+                    print(f"\n{'='*50}")
+                    print(f"[세션 {session.session_number}] 처리 중: {row.index}/{total_count} - {row.business_name}")
+                    worker.logger.info(f"[세션 {session.session_number}] 처리 중: {row.index}/{total_count} - {row.business_name}")
+                    result_data, searched = await session.process_row(row)
+                    row_status = result_data.get('업데이트상태')
+                except Exception as e:
+                    worker.logger.error(f"행 처리 중 오류 발생: {e}")
+                    print(f"행 처리 중 오류 발생: {e}")
+                    result_data = worker._build_error_result(row.index, row.business_name, row.address, row.phone, e)
+                    searched = False
+                    row_status = result_data['업데이트상태']
+                finally:
+                    worker.metrics.end_row(row_status)
+                save(position, result_data, searched)
+
+        try:
+            await asyncio.gather(*(session_loop(session) for session in search_sessions))
+        finally:
+            # 중간에 빠진 순번이 있어도 남은 결과는 순서대로 저장
+            for position in sorted(pending):
+                crawler._save_parallel_result(*pending[position])
+            pending.clear()
+    finally:
+        for session in search_sessions:
+            await session.page.close()
+            session.crawler.close()
+        await pool.close()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 재시작용 체크포인트 (대상 CSV 옆의 {target_file}.checkpoint.json)
+
+대상 파일별로 결과 파일 경로, 완료된 인덱스 구간, 마지막 체크포인트 시점의
+결과 파일 크기를 기록해두고, 재시작 시 결과 CSV를 다시 읽지 않고 바로 이어서 처리
+"""
+
+import bisect
+import json
+import os
+from datetime import datetime
+
+
+def checkpoint_path(target_file):
+    """대상 CSV 파일의 체크포인트 파일 경로"""
+    return f"{target_file}.checkpoint.json"
+
+
+class ResumeCheckpoint:
+    """대상 파일 1개에 대한 완료 인덱스 구간 + 결과 파일 위치"""
+
+    def __init__(self, target_file, result_file, columns, ranges=None, result_offset=0):
+        self.target_file = target_file
+        self.result_file = result_file
+        self.columns = list(columns)
+        self.result_offset = result_offset
+
+        # 완료된 인덱스 구간 [[시작, 끝], ...] (양 끝 포함, 시작 기준 정렬)
+        self.ranges = [list(r) for r in (ranges or [])]
+        self.starts = [r[0] for r in self.ranges]
+
+    @classmethod
+    def load(cls, target_file, columns):
+        """체크포인트 파일 읽기 (없거나 출력 컬럼이 다르면 None)"""
+        path = checkpoint_path(target_file)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if state.get('columns') != list(columns):
+            return None
+
+        return cls(target_file, state['result_file'], state['columns'],
+                   ranges=state.get('completed', []),
+                   result_offset=state.get('result_offset', 0))
+
+    def save(self, result_offset):
+        """현재 완료 구간과 결과 파일 크기 기록 (임시 파일에 쓴 뒤 교체)"""
+        self.result_offset = result_offset
+        state = {
+            'target_file': self.target_file,
+            'result_file': self.result_file,
+            'columns': self.columns,
+            'completed': self.ranges,
+            'result_offset': result_offset,
+            'updated_at': datetime.now().isoformat(timespec='seconds')
+        }
+
+        path = checkpoint_path(self.target_file)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def mark_done(self, index):
+        """인덱스 완료 표시 (인접 구간은 합침)"""
+        index = int(index)
+        pos = bisect.bisect_right(self.starts, index)
+        if pos > 0 and self.ranges[pos - 1][1] >= index:
+            return
+
+        merge_prev = pos > 0 and self.ranges[pos - 1][1] == index - 1
+        merge_next = pos < len(self.ranges) and self.ranges[pos][0] == index + 1
+
+        if merge_prev and merge_next:
+            self.ranges[pos - 1][1] = self.ranges[pos][1]
+            del self.ranges[pos]
+            del self.starts[pos]
+        elif merge_prev:
+            self.ranges[pos - 1][1] = index
+        elif merge_next:
+            self.ranges[pos][0] = index
+            self.starts[pos] = index
+        else:
+            self.ranges.insert(pos, [index, index])
+            self.starts.insert(pos, index)
+
+    def is_done(self, index):
+        """완료된 인덱스인지 확인"""
+        index = int(index)
+        pos = bisect.bisect_right(self.starts, index)
+        return pos > 0 and self.ranges[pos - 1][1] >= index
+
+    def first_pending(self, start=1):
+        """start 이상에서 아직 처리하지 않은 첫 인덱스"""
+        pos = bisect.bisect_right(self.starts, start)
+        if pos > 0 and self.ranges[pos - 1][1] >= start:
+            return self.ranges[pos - 1][1] + 1
+        return start
+
+    def completed_count(self):
+        """완료된 인덱스 수"""
+        return sum(end - start + 1 for start, end in self.ranges)
+
+    def truncate_result_file(self):
+        """마지막 체크포인트 이후에 기록된 결과 행 제거 (완료 표시가 없는 행이라 다시 처리됨)"""
+        size = os.path.getsize(self.result_file)
+        if size > self.result_offset > 0:
+            with open(self.result_file, 'r+b') as f:
+                f.truncate(self.result_offset)
+            return size - self.result_offset
+        return 0
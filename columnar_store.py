@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 결과 / 검색 후보 컬럼 형식(Parquet / Arrow) 내보내기 + 읽기 (pyarrow 필요)
+
+결과 CSV는 읽을 때마다 전체를 다시 파싱하고, 전화번호 앞자리 0이 빠지거나 주소유사도점수가
+NaN 섞인 float로 바뀌는 등 타입이 유지되지 않는다. 컬럼별 타입을 정해둔 스키마로 저장하고
+상태 / 지역 컬럼은 dictionary 인코딩해서 읽기 시간과 메모리를 줄인다.
+(CSV를 기준 파일로 유지하고, 같은 이름의 .parquet / .feather 가 더 최신이면 그 파일을 읽음,
+내보낼 때 추가한 지역 컬럼은 스키마 메타데이터에 기록해두고 읽을 때 기본으로 제외해서 원본과 같은 컬럼 유지)
+
+사용 예:
+    python columnar_store.py export flexible_crawling_250829112327.csv            # → .parquet
+    python columnar_store.py export search_candidates.jsonl --format feather
+    python columnar_store.py info flexible_crawling_250829112327.parquet
+"""
+
+import argparse
+import json
+import os
+import time
+
+import pandas as pd
+
+from candidate_store import load_candidate_frame
+from region_index import get_region_index
+from result_store import is_result_store, read_results
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+COLUMNAR_FORMATS = {
+    'parquet': '.parquet',
+    'feather': '.feather'
+}
+COLUMNAR_EXTENSIONS = ('.parquet', '.feather', '.arrow')
+
+# 주소에서 판별해서 추가하는 지역 컬럼 (dictionary 인코딩)
+REGION_COLUMNS = ['시도', '시군구', '읍면동']
+
+# 내보낼 때 추가한 컬럼 목록을 남기는 스키마 메타데이터 키
+DERIVED_COLUMNS_KEY = b'derived_columns'
+
+# 주소 컬럼 후보 (flexible_crawler 결과 / naver_map_crawler 결과 / 검색 후보)
+ADDRESS_COLUMNS = ['기존주소', '소재지전체주소', 'address']
+
+# 컬럼별 저장 타입 (없는 컬럼은 문자열, 전화번호는 앞자리 0 유지를 위해 문자열)
+COLUMN_TYPES = {
+    '인덱스': 'int32',
+    '순번': 'int32',
+    'row': 'int32',
+    'stage_order': 'int16',
+    'chosen_index': 'int16',
+    'candidate_index': 'int16',
+    '주소유사도점수': 'float32',
+    '업데이트상태': 'dictionary',
+    '업데이트_상태': 'dictionary',
+    '업데이트': 'dictionary',
+    '에러 사유': 'dictionary',
+    '재채점결과': 'dictionary',
+    'result_file': 'dictionary',
+    'stage': 'dictionary',
+    'reason': 'dictionary',
+    'candidate_category': 'dictionary',
+    '시도': 'dictionary',
+    '시군구': 'dictionary',
+    '읍면동': 'dictionary'
+}
+
+# 읽을 때 정수 / 실수 컬럼은 결측값을 유지하는 pandas 타입으로 변환
+_PANDAS_TYPES = {
+    'int16': pd.Int16Dtype(),
+    'int32': pd.Int32Dtype(),
+    'float32': pd.Float32Dtype()
+}
+
+
+def is_columnar(path):
+    """Parquet / Arrow 파일인지 확인 (확장자 기준)"""
+    return str(path).lower().endswith(COLUMNAR_EXTENSIONS)
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow 가 설치되어 있지 않습니다 (pip install pyarrow)")
+
+
+def columnar_path(path):
+    """같은 이름의 컬럼 형식 파일이 원본보다 최신이면 그 경로, 아니면 원래 경로"""
+    if pa is None or is_columnar(path):
+        return path
+    stem = os.path.splitext(path)[0]
+    source_mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    for extension in COLUMNAR_EXTENSIONS:
+        candidate = stem + extension
+        if os.path.exists(candidate) and (source_mtime is None or os.path.getmtime(candidate) >= source_mtime):
+            return candidate
+    return path
+
+
+def prefer_columnar(paths):
+    """파일 목록에서 같은 이름의 CSV / 컬럼 형식 파일은 하나만 (최신 컬럼 형식 우선)"""
+    chosen = {}
+    for path in sorted(paths):
+        stem = os.path.splitext(path)[0]
+        if stem not in chosen:
+            chosen[stem] = columnar_path(path)
+    return sorted(chosen.values())
+
+
+def add_region_columns(df):
+    """주소 컬럼에서 시도 / 시군구 / 읍면동 컬럼 추가 (서로 다른 주소마다 한 번만 판별)"""
+    address_column = next((column for column in ADDRESS_COLUMNS if column in df.columns), None)
+    if address_column is None or all(column in df.columns for column in REGION_COLUMNS):
+        return df
+
+    region_index = get_region_index()
+    addresses = df[address_column].dropna().unique()
+    regions = pd.DataFrame([region_index.classify(address) for address in addresses],
+                           index=addresses, columns=REGION_COLUMNS)
+    df = df.copy()
+    for column in REGION_COLUMNS:
+        df[column] = df[address_column].map(regions[column])
+    return df
+
+
+def _arrow_array(values, type_name):
+    """pandas 컬럼을 스키마 타입의 Arrow 배열로 (빈 값은 null)"""
+    if type_name in _PANDAS_TYPES:
+        numbers = pd.to_numeric(values, errors='coerce').astype(_PANDAS_TYPES[type_name])
+        return pa.array(numbers, type=getattr(pa, type_name)(), from_pandas=True)
+    strings = pa.array(values.astype(object).map(str, na_action='ignore'), type=pa.string(), from_pandas=True)
+    return strings.dictionary_encode() if type_name == 'dictionary' else strings
+
+
+def build_table(df, derived_columns=()):
+    """DataFrame(문자열로 읽은 결과)을 COLUMN_TYPES 스키마의 Arrow 테이블로 변환 (derived_columns: 원본에 없던 컬럼)"""
+    _require_pyarrow()
+    arrays = [_arrow_array(df[column], COLUMN_TYPES.get(column, 'string')) for column in df.columns]
+    table = pa.Table.from_arrays(arrays, names=[str(column) for column in df.columns])
+    return table.replace_schema_metadata({DERIVED_COLUMNS_KEY: json.dumps(list(derived_columns)).encode('utf-8')})
+
+
+def write_table(table, output_file):
+    """확장자에 맞춰 Parquet / Feather(Arrow IPC) 파일로 저장"""
+    _require_pyarrow()
+    if output_file.lower().endswith('.parquet'):
+        pq.write_table(table, output_file, compression='zstd')
+    else:
+        feather.write_feather(table, output_file, compression='zstd')
+
+
+def load_source(path):
+    """내보낼 원본 읽기 (결과 CSV / SQLite는 전부 문자열로, 검색 후보 JSONL은 후보 1개당 1행)"""
+    if path.lower().endswith('.jsonl'):
+        return load_candidate_frame(path)
+    return read_results(path, dtype=str)
+
+
+def export_columnar(path, output_file=None, file_format='parquet'):
+    """결과 파일 / 검색 후보 기록을 지역 컬럼을 붙여 컬럼 형식 파일로 내보내기"""
+    output_file = output_file or f"{os.path.splitext(path)[0]}{COLUMNAR_FORMATS[file_format]}"
+    source = load_source(path)
+    df = add_region_columns(source)
+    table = build_table(df, derived_columns=[column for column in df.columns if column not in source.columns])
+    write_table(table, output_file)
+    return output_file, table
+
+
+def read_frame(path, columns=None, derived_columns=False, **csv_options):
+    """결과 파일을 DataFrame으로 읽기
+
+    Parquet / Arrow는 스키마 타입 그대로 (정수 / 실수는 결측값 유지, dictionary 컬럼은 category),
+    내보낼 때 추가한 지역 컬럼은 derived_columns=True 이거나 columns로 지정한 경우에만 포함,
+    SQLite는 read_results, CSV는 pandas.read_csv(csv_options 전달)
+    """
+    if is_columnar(path):
+        _require_pyarrow()
+        if path.lower().endswith('.parquet'):
+            table = pq.read_table(path, columns=columns)
+        else:
+            table = feather.read_table(path, columns=columns)
+        if columns is None and not derived_columns:
+            derived = json.loads((table.schema.metadata or {}).get(DERIVED_COLUMNS_KEY, b'[]'))
+            table = table.select([name for name in table.column_names if name not in derived])
+        types = {getattr(pa, name)(): dtype for name, dtype in _PANDAS_TYPES.items()}
+        return table.to_pandas(types_mapper=types.get)
+    if is_result_store(path):
+        df = read_results(path)
+        return df[columns] if columns else df
+    return pd.read_csv(path, usecols=columns, **csv_options)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='크롤링 결과 / 검색 후보 Parquet / Arrow 내보내기')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help='컬럼 형식 파일로 내보내기')
+    export_parser.add_argument('source', help='결과 CSV / SQLite 파일 또는 검색 후보 기록(JSONL)')
+    export_parser.add_argument('--format', choices=list(COLUMNAR_FORMATS), default='parquet', help='저장 형식')
+    export_parser.add_argument('--output', help='저장 파일 (기본: 같은 이름에 형식 확장자)')
+
+    info_parser = subparsers.add_parser('info', help='스키마 / 행 수 / 읽기 시간 확인')
+    info_parser.add_argument('path', help='Parquet / Arrow 파일')
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        start = time.perf_counter()
+        output_file, table = export_columnar(args.source, args.output, args.format)
+        elapsed = time.perf_counter() - start
+        print(f"💾 내보내기 완료: {output_file} ({table.num_rows}개 행, "
+              f"{os.path.getsize(output_file) / 1024:.0f}KB, {elapsed:.2f}초)")
+    elif args.command == 'info':
+        start = time.perf_counter()
+        df = read_frame(args.path, derived_columns=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        memory = df.memory_usage(deep=True).sum() / 1024 / 1024
+        print(f"📊 {args.path}: {len(df)}개 행, 읽기 {elapsed:.1f}ms, 메모리 {memory:.1f}MB")
+        for column, dtype in df.dtypes.items():
+            print(f"   - {column}: {dtype}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,10 @@ CSV_CONFIG = {
     'output_columns': [
         '인덱스', '사업장명', '기존주소', '기존전화번호', 
         '새전화번호', '업데이트상태', '주소유사도점수', '수집된주소'
-    ]
+    ],
+    
+    # 대상 CSV를 한 번에 읽을 행 수 (전체 파일을 메모리에 올리지 않음)
+    'chunk_size': 5000
 }
 
 # ===== 다른 CSV 파일 사용 예시 =====
@@ -33,3 +36,258 @@ CSV_CONFIG = {
 #         '새전화번호', '업데이트상태', '주소유사도점수', '수집된주소'
 #     ]
 # }
+
+# ===== 병렬 크롤링 설정 =====
+# workers가 2 이상이면 Chrome 세션을 여러 개 띄워 행을 나눠서 처리합니다
+PARALLEL_CONFIG = {
+    # 동시에 실행할 Chrome 세션(워커) 수 (1이면 기존 순차 처리)
+    'workers': 1,
+
+    # True: 입력 순서대로 저장 / False: 처리가 끝난 순서대로 즉시 저장
+    'ordered_output': True,
+
+    # 'threads': 워커마다 Chrome + WebDriver 세션 / 'cdp': Chrome 하나의 탭 여러 개를 DevTools로 비동기 제어
+    'engine': 'threads'
+}
+
+# ===== 페이지 대기 설정 =====
+# 고정 대기 대신 요소가 나타나는 즉시 진행하고, 봇 탐지 회피용 지연은 따로 적용합니다
+WAIT_CONFIG = {
+    # 검색 결과(결과 리스트 / 결과 없음 / entryIframe) 최대 대기 시간 (초)
+    'search_timeout': 10,
+
+    # 결과 클릭 후 상세 정보, 전화번호 펼치기 최대 대기 시간 (초)
+    'detail_timeout': 5,
+
+    # 저장된 place id 상세 페이지 최대 대기 시간 (초, 없는 장소 안내는 나타나는 즉시 판별)
+    'place_timeout': 5,
+
+    # 요소 확인 간격 (초)
+    'poll_interval': 0.2
+}
+
+# ===== 요청 속도 조절 설정 =====
+# 검색 페이지 이동 속도를 응답 상태에 따라 자동으로 조절합니다 (모든 실행 메뉴 / 병렬 워커 공유)
+# 정상 응답이 이어지면 조금씩 빨라지고, 접근 제한 페이지 / 시간 초과 / 연속 결과 없음이 보이면 크게 느려집니다
+RATE_LIMIT_CONFIG = {
+    # 속도 조절 사용 여부 (False면 대기 없이 바로 이동, 로컬 재현 서버용)
+    'enabled': True,
+
+    # 초당 검색 페이지 이동 수 (시작 / 최소 / 최대)
+    'initial_rate': 0.25,   # 4초에 1번
+    'min_rate': 0.1,        # 10초에 1번
+    'max_rate': 0.5,        # 2초에 1번
+
+    # 쉬었다가 연달아 이동할 수 있는 최대 횟수
+    'burst': 1,
+
+    # 정상 응답마다 늘릴 초당 이동 수
+    'increase_step': 0.01,
+
+    # 차단 의심 시 속도에 곱할 값
+    'decrease_factor': 0.5,
+
+    # 대기 간격에 더할 랜덤 비율 (0.3이면 간격의 0~30%)
+    'jitter': 0.3,
+
+    # 검색 결과 없음이 이 횟수만큼 연속되면 차단 의심으로 판단
+    'empty_storm': 5,
+
+    # 접근 제한 페이지 감지 후 검색을 멈출 시간 (초)
+    'block_cooldown': 60
+}
+
+# ===== 대상 지역 설정 =====
+# 검색 결과가 대상 지역 업체인지 판별할 때 사용합니다
+REGION_CONFIG = {
+    # 시도 → 시군구 → 읍면동 목록 파일 (이 폴더 기준 경로)
+    'data_file': 'data/regions.json',
+
+    # 대상 지역 ('시도', '시도 시군구', '시도 시군구 읍면동' 형식, 여러 개 지정 가능)
+    'targets': ['울산광역시 동구']
+}
+
+# ===== 검색 단계 설정 =====
+# 앞 단계에서 전화번호를 찾지 못했을 때, 실패 사유가 escalate_on 에 있을 때만 다음 검색어로 다시 검색합니다
+SEARCH_STRATEGY_CONFIG = {
+    # 검색 단계 순서 (query 에는 {business_name}, {dong_name} 사용 가능)
+    'stages': [
+        {'label': '1차', 'query': '{business_name} {dong_name}'},
+        {'label': '2차', 'query': '{business_name}'}
+    ],
+
+    # 다음 단계로 넘어갈 실패 사유 (단계별로 'escalate_on' 을 따로 지정할 수도 있음)
+    # 'no_results'(검색 결과 없음), 'no_phone'(대상 지역 업체인데 전화번호 없음)은 확정으로 보고 생략
+    'escalate_on': ['wrong_district', 'address_unknown', 'timeout', 'cache_miss', 'error']
+}
+
+# ===== 검색 결과 캐시 설정 =====
+# 검색어 + 원본 주소 기준으로 검색 결과를 SQLite 파일에 저장해 재실행 시 재사용합니다
+CACHE_CONFIG = {
+    # 'readwrite': 캐시 사용 및 저장 / 'replay': 캐시만 사용 (브라우저 미실행) / 'off': 사용 안 함
+    'mode': 'readwrite',
+
+    # 캐시 DB 파일
+    'db_file': 'search_cache.sqlite3',
+
+    # 캐시 유효 기간 (일, None이면 만료 없음)
+    'ttl_days': 30,
+
+    # 캐시에 저장할 확정 사유 (시간 초과 / 오류 등 일시적인 실패는 저장하지 않고 다음 실행에서 다시 검색)
+    'cache_reasons': ['phone_found', 'no_results', 'no_phone', 'wrong_district']
+}
+
+# ===== 결과 파일 저장 설정 =====
+# 결과 파일을 한 번 열어두고 아래 정책에 따라 디스크에 기록합니다
+OUTPUT_CONFIG = {
+    # N행마다 flush
+    'flush_rows': 10,
+
+    # 마지막 flush 후 T초가 지나면 flush
+    'flush_seconds': 5.0,
+
+    # 체크포인트(진행 상황 10개마다, 크롤링 종료 시)에 fsync 까지 수행
+    'fsync_on_checkpoint': True,
+
+    # 결과 저장 방식 ('csv': 결과 CSV에 추가, 'sqlite': 인덱스 기준 upsert 하는 SQLite 파일)
+    'backend': 'csv'
+}
+
+# 저장 방식별 결과 파일 확장자
+RESULT_EXTENSIONS = {
+    'csv': '.csv',
+    'sqlite': '.sqlite3'
+}
+
+# ===== 브라우저 설정 =====
+# 크롬 실행 프로필을 선택합니다 (서버에서 여러 세션을 돌릴 때는 'headless_lite' 권장)
+BROWSER_CONFIG = {
+    # 사용할 프로필 이름
+    'profile': 'default',
+
+    'profiles': {
+        # 기존과 같은 화면 표시 모드 (요청 차단 없음)
+        'default': {
+            'headless': False,
+            'blocked_resource_types': [],
+            'blocked_url_patterns': []
+        },
+
+        # 화면 없이 실행하고 지도 타일/이미지/폰트/미디어/분석 요청을 차단
+        'headless_lite': {
+            'headless': True,
+            'window_size': '1280,1024',
+
+            # 차단할 리소스 종류 ('image', 'font', 'media', 'stylesheet')
+            # stylesheet 는 요소 표시 여부/클릭 위치가 달라질 수 있어 기본으로 차단하지 않습니다
+            'blocked_resource_types': ['image', 'font', 'media'],
+
+            # 추가로 차단할 URL 패턴 (* 와일드카드)
+            'blocked_url_patterns': [
+                '*map.pstatic.net/*',        # 지도 타일
+                '*simg.pstatic.net/*',       # 지도 정적 이미지
+                '*ldb-phinf.pstatic.net/*',  # 업체 사진
+                '*wcs.naver.net/*',          # 방문 분석
+                '*lcs.naver.com/*',
+                '*tivan.naver.com/*',
+                '*nelo2-col.navercorp.com/*',
+                '*google-analytics.com/*',
+                '*googletagmanager.com/*',
+                '*doubleclick.net/*'
+            ]
+        }
+    }
+}
+
+# ===== WebDriver 실행 설정 =====
+DRIVER_CONFIG = {
+    # chromedriver 경로 직접 지정 (None이면 ChromeDriverManager로 한 번 찾은 뒤 저장해서 재사용)
+    'driver_path': None,
+
+    # 찾은 chromedriver 경로를 저장하는 파일 (이 폴더 기준 경로, 버전이 맞지 않으면 다시 찾음)
+    'driver_path_cache': '.chromedriver_path',
+
+    # True면 크롤러 생성 시가 아니라 처음 브라우저가 필요할 때 Chrome 실행
+    'lazy_start': True,
+
+    # 이미 실행 중인 Chrome에 연결 (예: '127.0.0.1:9222', chrome --remote-debugging-port=9222 로 실행)
+    # None이면 새 Chrome 실행
+    'debugger_address': None
+}
+
+# ===== 브라우저 세션 재시작 설정 =====
+# 오래 실행하면 Chrome 메모리가 계속 늘어나므로 기준을 넘으면 다음 검색 전에 세션을 새로 시작합니다
+SESSION_CONFIG = {
+    # 세션 재시작 사용 여부 (실행 중인 Chrome에 연결한 경우에는 사용하지 않음)
+    'enabled': True,
+
+    # 세션 하나에서 허용할 페이지 이동 횟수 (None이면 제한 없음)
+    'max_navigations': 500,
+
+    # 현재 페이지 JS 힙 크기 기준 (MB, None이면 확인 안 함)
+    'max_js_heap_mb': 512,
+
+    # Chrome 프로세스 RSS 합계 기준 (MB, psutil 필요, None이면 확인 안 함)
+    'max_rss_mb': 2048,
+
+    # 메모리 확인 간격 (페이지 이동 횟수)
+    'check_every': 20
+}
+
+# ===== 검색 사이트 설정 =====
+SITE_CONFIG = {
+    # 네이버 지도 주소 (벤치마크 시 fixture_server.py 주소로 바꾸면 실제 사이트에 접속하지 않습니다)
+    'base_url': 'https://map.naver.com',
+
+    # 저장된 place id로 상세 페이지를 바로 여는 경로 (갱신 모드)
+    'place_path': '/p/entry/place/{place_id}'
+}
+
+# ===== 단계별 소요 시간 측정 설정 =====
+# 페이지 이동, 대기, 결과 확인, 클릭, 전화번호 펼치기, 저장 등 단계별 시간을 기록합니다
+METRICS_CONFIG = {
+    # 측정값 파일 기록 여부
+    'enabled': True,
+
+    # 행마다 단계별 소요 시간을 한 줄(JSON)씩 기록하는 파일
+    'records_file': 'crawl_metrics.jsonl',
+
+    # 단계별 p50/p95/p99 요약 파일 (Prometheus 텍스트 형식)
+    'summary_file': 'crawl_metrics.prom',
+
+    # 요약 파일 갱신 간격 (행 수)
+    'summary_every': 10,
+
+    # 분위수 계산에 사용할 단계별 최근 측정 건수
+    'window': 1000,
+
+    # 로컬 /metrics 엔드포인트 포트 (None이면 사용 안 함, 예: 9464)
+    'http_port': None
+}
+
+# ===== 검색 후보 저장 설정 =====
+# 다중 결과 검색의 상위 후보를 저장해두면 유사도 점수 규칙을 바꿨을 때
+# rescore_candidates.py 로 다시 크롤링하지 않고 재채점할 수 있습니다
+CANDIDATE_CONFIG = {
+    # 후보 저장 여부
+    'enabled': True,
+
+    # 행마다 검색 단계별 후보 목록을 한 줄(JSON)씩 기록하는 파일
+    'records_file': 'search_candidates.jsonl',
+
+    # 다중 결과에서 확인하고 저장할 상위 후보 수
+    'top_k': 3
+}
+
+# ===== DevTools 비동기 크롤링 설정 =====
+# PARALLEL_CONFIG['engine'] = 'cdp' 일 때 사용 (websockets 필요: pip install websockets)
+CDP_CONFIG = {
+    # DevTools 명령 응답 대기 시간 (초)
+    'command_timeout': 30,
+
+    # 세션마다 쿠키 / 저장소가 분리된 브라우저 컨텍스트 사용 (False면 모든 탭이 같은 쿠키를 공유)
+    'isolate_contexts': True,
+
+    # Chrome 하나에 둘 세션(컨텍스트) 수, 넘으면 Chrome을 더 띄워 나눔 (None이면 모든 세션을 Chrome 하나에)
+    'contexts_per_browser': 8
+}
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 대상 CSV 스트리밍 읽기
+
+대상 파일 전체를 DataFrame으로 읽지 않고 필요한 컬럼만 청크 단위로 읽어서
+행 레코드(CrawlRow)로 하나씩 넘겨준다. 시작/끝 행은 청크를 읽기 전에 건너뛰므로
+수백 MB 공공데이터 파일도 청크 크기만큼의 메모리로 처리할 수 있다.
+"""
+
+from collections import namedtuple
+
+import pandas as pd
+
+# position: 파일 내 0-based 행 위치 / index: 결과 파일의 1-based 인덱스
+CrawlRow = namedtuple('CrawlRow', ['position', 'index', 'business_name', 'address', 'phone'])
+
+
+class CsvRowSource:
+    """크롤링 대상 CSV 행 공급자"""
+
+    def __init__(self, path, business_name_col, address_col, phone_col=None, chunk_size=5000):
+        self.path = path
+        self.business_name_col = business_name_col
+        self.address_col = address_col
+        self.phone_col = phone_col
+        self.chunk_size = chunk_size
+
+    def _usecols(self):
+        """실제로 읽을 컬럼 목록"""
+        columns = [self.business_name_col, self.address_col]
+        if self.phone_col and self.phone_col not in columns:
+            columns.append(self.phone_col)
+        return columns
+
+    def validate_columns(self):
+        """헤더만 읽어서 필요한 컬럼이 있는지 확인"""
+        header = pd.read_csv(self.path, nrows=0).columns
+        if self.business_name_col not in header:
+            raise ValueError(f"사업장명 컬럼 '{self.business_name_col}'을 찾을 수 없습니다.")
+        if self.address_col not in header:
+            raise ValueError(f"주소 컬럼 '{self.address_col}'을 찾을 수 없습니다.")
+        if self.phone_col and self.phone_col not in header:
+            raise ValueError(f"전화번호 컬럼 '{self.phone_col}'을 찾을 수 없습니다.")
+
+    def count_rows(self, limit=None):
+        """데이터 행 수 (limit이 있으면 limit개까지만 확인)"""
+        count = 0
+        for chunk in pd.read_csv(self.path, usecols=[self.business_name_col], dtype=str,
+                                 chunksize=self.chunk_size, nrows=limit):
+            count += len(chunk)
+        return count
+
+    def iter_rows(self, start=0, stop=None):
+        """start 행부터 stop 행 전까지(0-based) CrawlRow 생성"""
+        if stop is not None and stop <= start:
+            return
+
+        # 헤더(0번 줄)는 남기고 앞쪽 데이터 행은 파싱하지 않고 건너뜀
+        chunks = pd.read_csv(
+            self.path,
+            usecols=self._usecols(),
+            dtype=str,
+            skiprows=range(1, start + 1) if start > 0 else None,
+            nrows=stop - start if stop is not None else None,
+            chunksize=self.chunk_size
+        )
+
+        position = start
+        for chunk in chunks:
+            names = chunk[self.business_name_col].tolist()
+            addresses = chunk[self.address_col].tolist()
+            phones = chunk[self.phone_col].tolist() if self.phone_col else [''] * len(chunk)
+
+            for business_name, address, phone in zip(names, addresses, phones):
+                yield CrawlRow(position, position + 1, business_name, address, phone)
+                position += 1
+
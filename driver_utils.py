@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Chrome WebDriver 공통 설정 유틸리티
+
+설정 파일(BROWSER_CONFIG)에서 선택한 브라우저 프로필에 따라 headless 옵션을 적용하고,
+DevTools 프로토콜로 지도 타일/이미지/폰트/미디어/분석 스크립트 요청을 차단
+chromedriver 경로는 프로세스에서 한 번만 찾고 파일에 저장해서 다음 실행에도 재사용 (DRIVER_CONFIG)
+"""
+
+import os
+import threading
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from config import BROWSER_CONFIG, DRIVER_CONFIG
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 봇 탐지 회피를 위해 세션 시작 직후 실행하는 스크립트
+STEALTH_SCRIPTS = [
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})",
+    "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})",
+    "Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']})",
+    "Object.defineProperty(navigator, 'platform', {get: () => 'MacIntel'})"
+]
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+# 리소스 종류별 차단 URL 패턴 (Network.setBlockedURLs 는 URL 패턴만 지원하므로 확장자로 구분)
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*', '*.bmp*'],
+    'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.mp3*', '*.m3u8*', '*.ogg*'],
+    'stylesheet': ['*.css*']
+}
+
+
+def get_browser_profile(name=None):
+    """설정에서 브라우저 프로필 가져오기 (이름이 없으면 현재 선택된 프로필)"""
+    name = name or BROWSER_CONFIG['profile']
+    if name not in BROWSER_CONFIG['profiles']:
+        raise ValueError(f"브라우저 프로필 '{name}'을 찾을 수 없습니다.")
+    return BROWSER_CONFIG['profiles'][name]
+
+
+def get_blocked_url_patterns(profile):
+    """프로필의 차단 리소스 종류와 URL 패턴을 합친 목록"""
+    patterns = []
+    for resource_type in profile.get('blocked_resource_types', []):
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+    patterns.extend(profile.get('blocked_url_patterns', []))
+    return patterns
+
+
+def apply_browser_profile(chrome_options, profile):
+    """브라우저 프로필의 실행 옵션을 ChromeOptions에 적용"""
+    if profile.get('headless'):
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument(f"--window-size={profile.get('window_size', '1280,1024')}")
+        chrome_options.add_argument("--mute-audio")
+
+    if 'image' in profile.get('blocked_resource_types', []):
+        # 확장자가 없는 이미지 URL도 렌더러 단계에서 로딩하지 않음
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+
+    if get_blocked_url_patterns(profile):
+        # searchIframe / entryIframe 이 별도 프로세스로 분리되면 차단 설정이 적용되지 않으므로
+        # 사이트 격리를 끄고 같은 타겟 안에서 로딩되도록 함
+        # (--disable-features 는 마지막 값만 적용되어 기존 설정을 덮어쓰므로 사용하지 않음)
+        chrome_options.add_argument("--disable-site-isolation-trials")
+
+
+def enable_resource_blocking(driver, profile):
+    """DevTools 프로토콜로 프로필에 지정된 요청 차단 (차단한 패턴 수 반환)"""
+    patterns = get_blocked_url_patterns(profile)
+    if not patterns:
+        return 0
+
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    return len(patterns)
+
+
+def _driver_path_cache_file():
+    cache_file = DRIVER_CONFIG.get('driver_path_cache')
+    return os.path.join(BASE_DIR, cache_file) if cache_file else None
+
+
+def resolve_driver_path(refresh=False):
+    """chromedriver 경로 (설정 경로 → 저장된 경로 → ChromeDriverManager 순, 프로세스에서 한 번만 확인)"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path and not refresh:
+            return _driver_path
+
+        path = DRIVER_CONFIG.get('driver_path')
+        cache_file = _driver_path_cache_file()
+        if not path and not refresh and cache_file and os.path.exists(cache_file):
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = f.read().strip()
+            if cached and os.path.exists(cached):
+                path = cached
+
+        if not path:
+            # 버전 확인 / 다운로드가 필요할 때만 import (import 자체도 느림)
+            from webdriver_manager.chrome import ChromeDriverManager
+            print("chromedriver 경로 확인 중...")
+            path = ChromeDriverManager().install()
+            if cache_file:
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    f.write(path)
+                print(f"chromedriver 경로 저장: {path}")
+
+        _driver_path = path
+        return path
+
+
+def launch_chrome(chrome_options):
+    """저장된 chromedriver 경로로 Chrome 실행 (실행 실패 시 경로를 다시 확인해서 한 번 더 시도)"""
+    try:
+        return webdriver.Chrome(service=Service(resolve_driver_path()), options=chrome_options)
+    except WebDriverException as e:
+        if DRIVER_CONFIG.get('driver_path'):
+            raise
+        # Chrome 업데이트로 저장된 chromedriver 버전이 맞지 않는 경우
+        print(f"저장된 chromedriver로 실행 실패, 경로 다시 확인: {e.msg}")
+        return webdriver.Chrome(service=Service(resolve_driver_path(refresh=True)), options=chrome_options)
+
+
+def attach_chrome(debugger_address):
+    """이미 실행 중인 Chrome(--remote-debugging-port)에 연결"""
+    # 연결 모드에서는 excludeSwitches 등 실행 옵션을 쓸 수 없으므로 새 옵션 사용
+    chrome_options = Options()
+    chrome_options.add_experimental_option('debuggerAddress', debugger_address)
+    return webdriver.Chrome(service=Service(resolve_driver_path()), options=chrome_options)
+
+
+def prepare_session(driver, profile, clear_cookies=True):
+    """새 세션 준비: 요청 차단, 봇 탐지 회피 스크립트, 쿠키 초기화 (차단한 패턴 수 반환)"""
+    blocked_count = enable_resource_blocking(driver, profile)
+    for script in STEALTH_SCRIPTS:
+        driver.execute_script(script)
+    if clear_cookies:
+        driver.delete_all_cookies()
+    return blocked_count
+
+
+def get_debugger_address(driver):
+    """WebDriver가 실행한 Chrome의 DevTools 주소 (예: '127.0.0.1:40123', 연결한 세션이면 설정 주소)"""
+    if DRIVER_CONFIG.get('debugger_address'):
+        return DRIVER_CONFIG['debugger_address']
+    return driver.capabilities.get('goog:chromeOptions', {}).get('debuggerAddress')
@@ -6,7 +6,9 @@
 """
 
 import pandas as pd
-import re
+
+from columnar_store import REGION_COLUMNS, columnar_path, read_frame
+from region_index import RegionMatch, get_region_index
 
 def extract_ulsan_donggu_data():
     """울산 동구 데이터만 추출"""
@@ -15,14 +17,26 @@ def extract_ulsan_donggu_data():
     input_file = 'flexible_crawling_250829112327_수동확인.csv'
     output_file = 'ulsan_donggu_data.csv'
     
+    # 같은 이름의 Parquet / Arrow 파일이 최신이면 그 파일을 읽음 (지역 컬럼 포함)
+    input_file = columnar_path(input_file)
     print(f"📁 원본 파일 읽기: {input_file}")
-    df = pd.read_csv(input_file)
+    df = read_frame(input_file, derived_columns=True)
     
     print(f"📊 전체 데이터: {len(df)}개")
     
-    # 울산 동구 데이터만 필터링
-    ulsan_donggu_mask = df['기존주소'].str.contains('울산광역시 동구', na=False)
+    # 울산 동구 데이터만 필터링 (시도 → 시군구 → 읍면동 색인)
+    region_index = get_region_index()
+    if all(column in df.columns for column in REGION_COLUMNS):
+        # 내보낼 때 판별해 둔 지역 컬럼 사용 (주소를 다시 판별하지 않음)
+        region_values = df[REGION_COLUMNS].astype(object).where(df[REGION_COLUMNS].notna(), None)
+        regions = pd.Series([RegionMatch(*values) for values in region_values.itertuples(index=False)],
+                            index=df.index)
+        df = df.drop(columns=REGION_COLUMNS)
+    else:
+        regions = df['기존주소'].map(region_index.classify)
+    ulsan_donggu_mask = regions.map(region_index.is_target).astype(bool)
     ulsan_donggu_df = df[ulsan_donggu_mask].copy()
+    donggu_regions = regions[ulsan_donggu_mask]
     
     print(f"📊 울산 동구 데이터: {len(ulsan_donggu_df)}개")
     
@@ -51,7 +65,7 @@ def extract_ulsan_donggu_data():
     
     # 동별 분포
     print("\n🏘️ 동별 분포:")
-    dong_counts = ulsan_donggu_df['기존주소'].str.extract(r'동구 (\w+동)')[0].value_counts()
+    dong_counts = pd.Series([region.dong for region in donggu_regions]).value_counts()
     for dong, count in dong_counts.items():
         print(f"   - {dong}: {count}개")
     
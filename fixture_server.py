@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+네이버 지도 로컬 재현 서버 (벤치마크 / 오프라인 확인용)
+
+fixtures/naver_map/scenarios.json 에 정의한 업체별 시나리오(결과 0개, 1개, 여러 개,
+바로 상세 열림 / 전화번호 표시, a.BfF3H 펼치기, 없음)에 맞춰 크롤러가 사용하는
+searchIframe / entryIframe 구조의 HTML을 돌려준다. 시나리오에 search_html /
+entry_html 파일이 지정되어 있으면 실제 사이트에서 저장한 HTML을 그대로 돌려준다.
+
+사용 예:
+    python fixture_server.py --port 8765 --latency-ms 50
+    (config.py 의 SITE_CONFIG['base_url'] 을 http://127.0.0.1:8765 로 변경)
+"""
+
+import argparse
+import html
+import json
+import os
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'naver_map')
+DEFAULT_SCENARIO_FILE = os.path.join(FIXTURE_DIR, 'scenarios.json')
+
+MAIN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title} - 네이버 지도</title></head>
+<body>
+<div id="app-root">{frames}</div>
+<script>
+function openEntry(placeId) {{
+    var old = document.getElementById('entryIframe');
+    if (old) {{ old.remove(); }}
+    var frame = document.createElement('iframe');
+    frame.id = 'entryIframe';
+    frame.src = '/fixture/place/' + placeId;
+    document.getElementById('app-root').appendChild(frame);
+}}
+</script>
+</body></html>"""
+
+SEARCH_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body>
+<div id="_pcmap_list_scroll_container"><ul>{items}</ul></div>
+<script>
+document.querySelectorAll('a.place_bluelink').forEach(function (link) {{
+    link.addEventListener('click', function (event) {{
+        event.preventDefault();
+        window.parent.openEntry(link.getAttribute('data-place-id'));
+    }});
+}});
+</script>
+</body></html>"""
+
+SEARCH_ITEM = """<li class="VLTHu OW9LQ">
+<div class="CHC5F"><a class="place_bluelink" href="/p/entry/place/{id}" data-place-id="{id}"><span class="TYaxT">{name}</span></a>
+<span class="KCMnt">{category}</span></div>
+<div class="Pb4bU_wrap"><span class="Pb4bU">{address}</span></div>
+</li>"""
+
+NO_RESULTS_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body><div class="FYvSc">조건에 맞는 업체가 없습니다. 검색 결과가 없습니다.</div></body></html>"""
+
+ENTRY_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body>
+<div class="place_section">
+<span class="GHAhO">{name}</span> <span class="lnJFt">{category}</span>
+<div class="vV_z_"><a class="PkgBl" href="#" onclick="document.querySelector('div.nQ7Lh').style.display='block'; return false;">
+<span class="LDgIH">{address}</span></a>
+<div class="nQ7Lh" style="display:none">지번 {jibun}</div></div>
+{phone_block}
+</div>
+</body></html>"""
+
+PHONE_LINK = """<div class="O8qbU"><span class="xlx7Q">{phone}</span> <a href="tel:{phone}">전화</a></div>"""
+
+# a.BfF3H 클릭 후 잠시 뒤에 전화번호 영역이 펼쳐지는 구조
+PHONE_TOGGLE = """<div class="O8qbU"><a class="BfF3H" href="#" role="button">전화번호 보기</a><div id="phone_area"></div></div>
+<script>
+document.querySelector('a.BfF3H').addEventListener('click', function (event) {{
+    event.preventDefault();
+    setTimeout(function () {{
+        document.getElementById('phone_area').innerHTML = '<div class="_YI7T kH0zp"><em>{phone}</em></div>';
+    }}, {delay_ms});
+}});
+</script>"""
+
+
+def load_scenarios(path=DEFAULT_SCENARIO_FILE):
+    """시나리오 파일 읽기 (업체명이 긴 것부터 매칭되도록 정렬)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        scenarios = json.load(f)['scenarios']
+    return sorted(scenarios, key=lambda s: len(s['business_name']), reverse=True)
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """시나리오 기반 네이버 지도 페이지 응답"""
+
+    server_version = "NaverMapFixture/1.0"
+
+    def log_message(self, format, *args):
+        # 벤치마크 출력이 요청 로그로 덮이지 않도록 기본 로그 생략
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+
+        parsed = urllib.parse.urlparse(self.path)
+        path = urllib.parse.unquote(parsed.path)
+
+        if path.startswith('/p/search/'):
+            self._send_html(self._main_page(path[len('/p/search/'):]))
+        elif path.startswith('/p/entry/place/'):
+            self._send_place_page(path[len('/p/entry/place/'):])
+        elif path.startswith('/fixture/search/'):
+            self._send_html(self._search_page(path[len('/fixture/search/'):]))
+        elif path.startswith('/fixture/place/'):
+            self._send_html(self._entry_page(path[len('/fixture/place/'):]))
+        else:
+            self._send_html("<html><body>not found</body></html>", status=404)
+
+    def _send_html(self, body, status=200):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _find_scenario(self, query):
+        """검색어가 업체명으로 시작하는 시나리오 찾기"""
+        query = ' '.join(query.split())
+        for scenario in self.server.scenarios:
+            if query.startswith(scenario['business_name']):
+                return scenario
+        return None
+
+    def _find_place(self, place_id):
+        for scenario in self.server.scenarios:
+            for place in scenario.get('places', []):
+                if place['id'] == place_id:
+                    return scenario, place
+        return None, None
+
+    def _main_page(self, query):
+        scenario = self._find_scenario(query)
+        search_src = f"/fixture/search/{urllib.parse.quote(query)}"
+
+        if scenario and scenario['type'] == 'entry' and scenario['places']:
+            # 결과 리스트 없이 상세(entryIframe)가 바로 열리는 경우
+            frames = f'<iframe id="entryIframe" src="/fixture/place/{scenario["places"][0]["id"]}"></iframe>'
+        else:
+            frames = f'<iframe id="searchIframe" src="{search_src}"></iframe>'
+
+        return MAIN_PAGE.format(title=html.escape(query), frames=frames)
+
+    def _send_place_page(self, place_id):
+        """place id로 상세 페이지(entryIframe)를 바로 여는 경우 (없는 id는 404)"""
+        scenario, place = self._find_place(place_id)
+        if not place:
+            self._send_html("<html><body>존재하지 않는 장소입니다.</body></html>", status=404)
+            return
+        frames = f'<iframe id="entryIframe" src="/fixture/place/{html.escape(place_id)}"></iframe>'
+        self._send_html(MAIN_PAGE.format(title=html.escape(place.get('name', '')), frames=frames))
+
+    def _search_page(self, query):
+        scenario = self._find_scenario(query)
+        if not scenario or scenario['type'] == 'none' or not scenario['places']:
+            return NO_RESULTS_PAGE
+
+        if scenario.get('search_html'):
+            return self._read_recorded(scenario['search_html'])
+
+        items = ''.join(
+            SEARCH_ITEM.format(**{key: html.escape(str(place.get(key, ''))) for key in ('id', 'name', 'category', 'address')})
+            for place in scenario['places']
+        )
+        return SEARCH_PAGE.format(items=items)
+
+    def _entry_page(self, place_id):
+        scenario, place = self._find_place(place_id)
+        if not place:
+            return "<html><body>not found</body></html>"
+
+        if place.get('entry_html'):
+            return self._read_recorded(place['entry_html'])
+
+        phone = html.escape(place.get('phone', ''))
+        display = place.get('phone_display', 'link')
+        if display == 'link' and phone:
+            phone_block = PHONE_LINK.format(phone=phone)
+        elif display == 'toggle' and phone:
+            phone_block = PHONE_TOGGLE.format(phone=phone, delay_ms=self.server.detail_delay_ms)
+        else:
+            phone_block = ''
+
+        return ENTRY_PAGE.format(
+            name=html.escape(place.get('name', '')),
+            category=html.escape(place.get('category', '')),
+            address=html.escape(place.get('address', '')),
+            jibun=html.escape(place.get('jibun', '')),
+            phone_block=phone_block
+        )
+
+    def _read_recorded(self, filename):
+        """실제 사이트에서 저장한 HTML 파일 읽기 (fixtures/naver_map 기준 상대 경로)"""
+        with open(os.path.join(FIXTURE_DIR, filename), 'r', encoding='utf-8') as f:
+            return f.read()
+
+
+def start_fixture_server(scenario_file=DEFAULT_SCENARIO_FILE, host='127.0.0.1', port=0,
+                         latency_ms=0, detail_delay_ms=300, verbose=False):
+    """백그라운드 스레드에서 재현 서버 실행 후 (서버, base_url) 반환 (port=0이면 빈 포트 사용)"""
+    server = ThreadingHTTPServer((host, port), FixtureRequestHandler)
+    server.daemon_threads = True
+    server.scenarios = load_scenarios(scenario_file)
+    server.latency_ms = latency_ms
+    server.detail_delay_ms = detail_delay_ms
+    server.verbose = verbose
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='네이버 지도 로컬 재현 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--scenarios', default=DEFAULT_SCENARIO_FILE, help='시나리오 JSON 파일')
+    parser.add_argument('--latency-ms', type=int, default=0, help='요청마다 추가할 응답 지연 (ms)')
+    parser.add_argument('--detail-delay-ms', type=int, default=300, help='a.BfF3H 클릭 후 전화번호 표시 지연 (ms)')
+    args = parser.parse_args()
+
+    server, base_url = start_fixture_server(args.scenarios, args.host, args.port,
+                                            args.latency_ms, args.detail_delay_ms, verbose=True)
+    print(f"🧪 재현 서버 실행 중: {base_url}")
+    print(f"   config.py 의 SITE_CONFIG['base_url'] 을 '{base_url}' 로 설정하세요. (종료: Ctrl+C)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print("\n재현 서버 종료")
+
+
+if __name__ == "__main__":
+    main()
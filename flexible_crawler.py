@@ -4,34 +4,124 @@ import re
 import urllib.parse
 import platform
 import os
-import random
-import csv
 import glob
+import queue
+import threading
+import asyncio
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException
 import logging
 
 # 설정 파일 import
-from config import CSV_CONFIG
+from config import (
+    CSV_CONFIG, PARALLEL_CONFIG, WAIT_CONFIG, CACHE_CONFIG, OUTPUT_CONFIG, RESULT_EXTENSIONS, SITE_CONFIG, METRICS_CONFIG,
+    SEARCH_STRATEGY_CONFIG, CANDIDATE_CONFIG, DRIVER_CONFIG, SESSION_CONFIG
+)
+from search_cache import SearchCache, normalize_query
+from csv_source import CsvRowSource
+from checkpoint import ResumeCheckpoint
+from metrics import PipelineMetrics
+from driver_utils import get_browser_profile, apply_browser_profile, launch_chrome, attach_chrome, prepare_session
+from result_store import ResultStore, is_result_store, read_results
+from result_writer import ResultWriter
+from page_scripts import collect_search_candidates, collect_place_summary, extract_place_id
+from page_waits import (
+    wait_for_search_ready, wait_for_place_ready, wait_for_entry_ready, wait_for_css,
+    SEARCH_ENTRY, SEARCH_TIMEOUT, SEARCH_BLOCKED
+)
+from rate_limiter import get_rate_limiter, SearchBlockedError
+from session_recycler import SessionRecycler, RECYCLE_CRASHED
+from region_index import get_region_index
+from address_parser import parse_address, address_similarity, jibun_similarity
+from candidate_store import CandidateStore, search_record
+from sharding import in_shard, shard_tag
+from search_strategy import (
+    SearchDecisionTree, describe_reason, REASON_PHONE_FOUND, REASON_NO_RESULTS, REASON_NO_PHONE,
+    REASON_WRONG_DISTRICT, REASON_ADDRESS_UNKNOWN, REASON_TIMEOUT, REASON_CACHE_MISS, REASON_ERROR,
+    REASON_PLACE_NOT_FOUND, REASON_PLACE_MISMATCH
+)
 
 class FlexibleCrawler:
-    def __init__(self):
-        self.setup_driver()
+    def __init__(self, worker_id=None, metrics=None, candidate_store=None, use_webdriver=True):
+        # 병렬 모드의 추가 워커는 worker_id를 받고 로그 파일을 새로 만들지 않음
+        self.worker_id = worker_id
+        self.cache_config = CACHE_CONFIG
+        
+        # 캐시 전용 모드에서는 브라우저를 띄우지 않음 (lazy_start면 처음 필요할 때 실행)
+        # DevTools 비동기 세션(cdp_engine.py)은 WebDriver 없이 검색 상태 / 캐시 / 점수 계산만 사용
+        self.use_webdriver = use_webdriver
+        self._driver = None
+        self.attached = False
+        if use_webdriver and self.cache_config['mode'] != 'replay' and not DRIVER_CONFIG['lazy_start']:
+            self.setup_driver()
         self.setup_logging()
         self.processed_count = 0
         self.result_file = None
+        self.result_writer = None
+        self.resume_checkpoint = None
         self.config = CSV_CONFIG
+        self.output_config = OUTPUT_CONFIG
+        self.parallel_config = PARALLEL_CONFIG
+        self.wait_config = WAIT_CONFIG
+        self.rate_limiter = get_rate_limiter()
+        # 세션별 페이지 이동 / 메모리 기준으로 Chrome 재시작
+        self.session_recycler = SessionRecycler.from_config(SESSION_CONFIG)
+        # 대상 지역 판별기 (REGION_CONFIG['targets'], 프로세스에서 한 번만 로드)
+        self.region_index = get_region_index()
+        self.current_search_state = None
+        self.current_search_outcome = {}
+        self.current_search_trace = []
+        self.current_search_records = []
+        self.search_tree = SearchDecisionTree.from_config(SEARCH_STRATEGY_CONFIG)
+        self.current_cache_miss = False
+        self.refresh_cache = False
+        self.refresh_by_place_id = False
+        
+        self.search_cache = None
+        if self.cache_config['mode'] != 'off':
+            self.search_cache = SearchCache(self.cache_config['db_file'], self.cache_config['ttl_days'])
+        
+        # 단계별 소요 시간 측정 (병렬 워커는 메인 크롤러의 측정기를 공유)
+        self.owns_metrics = metrics is None
+        self.metrics = metrics or PipelineMetrics.from_config(METRICS_CONFIG)
         
+        # 다중 결과 후보 기록 (오프라인 재채점용, 병렬 워커는 메인 크롤러의 기록기를 공유)
+        self.owns_candidate_store = candidate_store is None
+        self.candidate_store = candidate_store or CandidateStore.from_config(CANDIDATE_CONFIG)
+        
+    @property
+    def driver(self):
+        """WebDriver (처음 사용할 때 Chrome 실행, 캐시 전용 모드에서는 실행하지 않음)"""
+        if self._driver is None and self.use_webdriver and self.cache_config['mode'] != 'replay':
+            self.setup_driver()
+        return self._driver
+    
+    @driver.setter
+    def driver(self, driver):
+        self._driver = driver
+    
+    def start_driver(self):
+        """브라우저 세션이 없으면 바로 시작 (병렬 워커 / 벤치마크처럼 미리 띄워야 할 때)"""
+        return self.driver
+    
     def setup_driver(self):
         """Chrome WebDriver 설정"""
+        # 실행 중인 Chrome에 연결 (로그인 상태 / 이미 띄운 브라우저 재사용)
+        if DRIVER_CONFIG.get('debugger_address'):
+            print(f"실행 중인 Chrome에 연결 중: {DRIVER_CONFIG['debugger_address']}")
+            self.driver = attach_chrome(DRIVER_CONFIG['debugger_address'])
+            self.attached = True
+            prepare_session(self.driver, get_browser_profile(), clear_cookies=False)
+            print("Chrome 연결 완료!")
+            return
+        
         print("Chrome WebDriver 설정 중...")
         chrome_options = Options()
         
@@ -72,6 +162,10 @@ class FlexibleCrawler:
         # User-Agent 설정
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         
+        # 브라우저 프로필 (headless / 요청 차단)
+        browser_profile = get_browser_profile()
+        apply_browser_profile(chrome_options, browser_profile)
+        
         try:
             if platform.system() == "Darwin" and platform.machine() == "arm64":
                 print("맥OS ARM64 환경 감지, 직접 Chrome 경로 사용")
@@ -79,17 +173,14 @@ class FlexibleCrawler:
                 self.driver = webdriver.Chrome(options=chrome_options)
                 print("맥OS ARM64 Chrome으로 WebDriver 설정 완료!")
             else:
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                # chromedriver 경로는 프로세스에서 한 번만 확인하고 파일에 저장해서 재사용
+                self.driver = launch_chrome(chrome_options)
                 print("Chrome WebDriver 설정 완료!")
             
-            # 봇 탐지 회피를 위한 JavaScript 실행
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
-            self.driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']})")
-            self.driver.execute_script("Object.defineProperty(navigator, 'platform', {get: () => 'MacIntel'})")
-            
-            self.driver.delete_all_cookies()
+            # DevTools 요청 차단 + 봇 탐지 회피 JavaScript + 쿠키 초기화
+            blocked_count = prepare_session(self.driver, browser_profile)
+            if blocked_count:
+                print(f"네트워크 요청 차단 설정 완료 (패턴 {blocked_count}개)")
             
         except Exception as e:
             print(f"Chrome WebDriver 설정 실패: {e}")
@@ -107,6 +198,11 @@ class FlexibleCrawler:
         
     def setup_logging(self):
         """로깅 설정"""
+        if self.worker_id is not None:
+            # 병렬 워커는 메인 크롤러의 로그 설정을 그대로 사용
+            self.logger = logging.getLogger(__name__)
+            return
+        
         timestamp = datetime.now().strftime("%y%m%d%H%M%S")
         log_filename = f"flexible_crawling_{timestamp}.log"
         
@@ -126,71 +222,114 @@ class FlexibleCrawler:
         if pd.isna(address) or address == '':
             return None
             
-        # 동/리 추출 (현재 방식 유지)
-        address_parts = address.split()
-        for part in address_parts:
-            if part.endswith('동') or part.endswith('리'):
-                return part
-                
-        return None
+        # 동/리 추출 (현재 방식 유지, 같은 주소는 파싱 캐시 재사용)
+        return parse_address(address).dong_ri
         
     def check_existing_results(self):
-        """기존 결과 파일 확인"""
+        """현재 대상 파일의 체크포인트로 기존 결과 확인 (없으면 None)"""
         try:
-            # 현재 디렉토리에서 flexible_crawling_*.csv 파일들 찾기
-            csv_files = glob.glob('flexible_crawling_*.csv')
+            # 대상 CSV 옆의 체크포인트 파일에서 결과 파일과 완료 구간을 읽음 (결과 CSV는 읽지 않음)
+            checkpoint = ResumeCheckpoint.load(self.config['target_file'], self.config['output_columns'])
             
-            if not csv_files:
+            if not checkpoint:
                 return None
             
-            # 가장 최근 파일 선택
-            latest_file = max(csv_files, key=os.path.getctime)
-            print(f"📋 기존 결과 파일 발견: {latest_file}")
-            self.logger.info(f"📋 기존 결과 파일 발견: {latest_file}")
-            
-            # 파일 읽기
-            df = pd.read_csv(latest_file)
-            if len(df) > 0:
-                print(f"📊 기존 결과: {len(df)}개 행")
-                self.logger.info(f"📊 기존 결과: {len(df)}개 행")
-                return df.to_dict('records')
+            if not os.path.exists(checkpoint.result_file):
+                print(f"⚠️ 체크포인트의 결과 파일이 없습니다: {checkpoint.result_file}")
+                self.logger.warning(f"체크포인트의 결과 파일이 없습니다: {checkpoint.result_file}")
+                return None
             
-            return None
+            print(f"📋 기존 결과 파일 발견: {checkpoint.result_file}")
+            self.logger.info(f"📋 기존 결과 파일 발견: {checkpoint.result_file}")
+            print(f"📊 기존 결과: {checkpoint.completed_count()}개 행")
+            self.logger.info(f"📊 기존 결과: {checkpoint.completed_count()}개 행")
+            return checkpoint
             
         except Exception as e:
             print(f"기존 결과 확인 중 오류: {e}")
             self.logger.error(f"기존 결과 확인 중 오류: {e}")
             return None
     
-    def initialize_result_file(self, append_mode=False):
-        """결과 파일 초기화"""
+    def _open_result_writer(self, result_file, columns, append=False, checkpoint=None):
+        """결과 파일 writer 열기 (기존 writer는 닫음)"""
+        self._close_result_writer()
+        writer_class = ResultStore if is_result_store(result_file) else ResultWriter
+        self.result_writer = writer_class(
+            result_file, columns, append=append,
+            flush_rows=self.output_config['flush_rows'],
+            flush_seconds=self.output_config['flush_seconds'],
+            fsync_on_checkpoint=self.output_config['fsync_on_checkpoint']
+        )
+        self.result_file = result_file
+        self.candidate_store.set_result_file(result_file)
+        
+        # 체크포인트는 재시작을 지원하는 결과 파일(crawl_phone_numbers)에만 연결
+        self.resume_checkpoint = checkpoint
+        if checkpoint:
+            checkpoint.save(self.result_writer.size())
+    
+    def _close_result_writer(self):
+        """결과 파일 writer 닫기 (남은 행 기록)"""
+        if self.result_writer:
+            self.result_writer.close()
+            self.result_writer = None
+            if self.resume_checkpoint:
+                # SQLite 결과는 인덱스 기준 upsert 라 잘라낼 위치가 없음
+                self.resume_checkpoint.save(0 if is_result_store(self.result_file) else os.path.getsize(self.result_file))
+    
+    def checkpoint_results(self):
+        """지금까지 저장한 결과를 디스크에 기록하고 완료 구간 갱신"""
         try:
-            if append_mode:
-                # 기존 파일에 추가 모드
-                csv_files = glob.glob('flexible_crawling_*.csv')
-                if csv_files:
-                    self.result_file = max(csv_files, key=os.path.getctime)
-                    print(f"📁 기존 결과 파일에 추가: {self.result_file}")
-                    self.logger.info(f"📁 기존 결과 파일에 추가: {self.result_file}")
-                    return
-                else:
-                    print("⚠️ 기존 파일을 찾을 수 없어 새 파일 생성")
-                    append_mode = False
+            if self.result_writer:
+                self.result_writer.checkpoint()
+                if self.resume_checkpoint:
+                    self.resume_checkpoint.save(self.result_writer.size())
+        except Exception as e:
+            print(f"결과 체크포인트 중 오류: {e}")
+            self.logger.error(f"결과 체크포인트 중 오류: {e}")
+    
+    def _result_extension(self):
+        """설정된 저장 방식의 결과 파일 확장자"""
+        return RESULT_EXTENSIONS.get(self.output_config.get('backend', 'csv'), '.csv')
+    
+    def _latest_result_file(self):
+        """현재 대상 파일의 결과 파일 (체크포인트가 없으면 가장 최근 결과 파일)"""
+        checkpoint = ResumeCheckpoint.load(self.config['target_file'], self.config['output_columns'])
+        if checkpoint and os.path.exists(checkpoint.result_file):
+            return checkpoint.result_file
+        
+        result_files = [path for extension in RESULT_EXTENSIONS.values()
+                        for path in glob.glob(f'flexible_crawling_*{extension}')]
+        if not result_files:
+            return None
+        return max(result_files, key=os.path.getctime)
+    
+    def initialize_result_file(self, checkpoint=None):
+        """결과 파일 초기화 (체크포인트가 있으면 그 결과 파일에 이어서 저장)"""
+        try:
+            # 설정에서 출력 컬럼 가져오기
+            headers = self.config['output_columns']
             
-            if not append_mode:
-                # 새 파일 생성
-                timestamp = datetime.now().strftime("%y%m%d%H%M%S")
-                self.result_file = f'flexible_crawling_{timestamp}.csv'
-                
-                # 설정에서 출력 컬럼 가져오기
-                headers = self.config['output_columns']
+            if checkpoint:
+                # 마지막 체크포인트 이후 기록된 행은 완료 표시가 없으므로 잘라내고 다시 처리
+                removed = checkpoint.truncate_result_file()
+                if removed:
+                    print(f"✂️ 체크포인트 이후 기록된 {removed}바이트 제거 (다시 처리)")
+                    self.logger.info(f"체크포인트 이후 기록된 {removed}바이트 제거")
                 
-                with open(self.result_file, 'w', encoding='utf-8-sig', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(headers)
-                
-                print(f"📁 새 결과 파일 생성: {self.result_file}")
-                self.logger.info(f"새 결과 파일 생성: {self.result_file}")
+                self._open_result_writer(checkpoint.result_file, headers, append=True, checkpoint=checkpoint)
+                print(f"📁 기존 결과 파일에 추가: {self.result_file}")
+                self.logger.info(f"📁 기존 결과 파일에 추가: {self.result_file}")
+                return
+            
+            # 새 파일 생성
+            timestamp = datetime.now().strftime("%y%m%d%H%M%S")
+            result_file = f'flexible_crawling_{timestamp}{self._result_extension()}'
+            checkpoint = ResumeCheckpoint(self.config['target_file'], result_file, headers)
+            self._open_result_writer(result_file, headers, checkpoint=checkpoint)
+            
+            print(f"📁 새 결과 파일 생성: {self.result_file}")
+            self.logger.info(f"새 결과 파일 생성: {self.result_file}")
             
         except Exception as e:
             print(f"결과 파일 초기화 중 오류: {e}")
@@ -199,18 +338,17 @@ class FlexibleCrawler:
     def save_single_result(self, result):
         """단일 결과 저장"""
         try:
-            if not self.result_file:
+            if not self.result_writer:
                 print("결과 파일이 초기화되지 않았습니다.")
                 return False
             
-            # 설정에서 출력 컬럼 순서대로 저장
-            with open(self.result_file, 'a', encoding='utf-8-sig', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    result['인덱스'], result['사업장명'], result['기존주소'], 
-                    result['기존전화번호'], result['새전화번호'], result['업데이트상태'], 
-                    result['주소유사도점수'], result['수집된주소']
-                ])
+            # 설정에서 출력 컬럼 순서대로 저장 (flush 정책은 writer가 관리)
+            with self.metrics.span('save'):
+                self.result_writer.write(result)
+            
+            # 완료 표시는 다음 체크포인트 때 결과 파일 크기와 함께 기록
+            if self.resume_checkpoint and pd.notna(result.get('인덱스')):
+                self.resume_checkpoint.mark_done(result['인덱스'])
             
             return True
             
@@ -222,107 +360,359 @@ class FlexibleCrawler:
     def search_and_extract_phone(self, business_name, dong_name, original_address=None):
         """검색과 전화번호 추출"""
         try:
-            self.current_original_address = original_address
-            self.current_collected_address = ""
-            self.current_collected_jibun_address = ""  # 구주소 저장용
-            
-            # 1차 검색: 사업장명 + 동이름
-            search_query = f"{business_name} {dong_name}"
-            print(f"=== 1차 검색: {search_query} ===")
-            self.logger.info(f"=== 1차 검색: {search_query} ===")
-            
-            encoded_query = urllib.parse.quote(search_query)
-            search_url = f"https://map.naver.com/p/search/{encoded_query}"
-            self.logger.info(f"1차 검색 URL: {search_url}")
-            
-            self.driver.get(search_url)
-            
-            wait_time = random.uniform(3.5, 5.0)  # 3.5초 최소값으로 설정
-            print(f"1차 검색 결과 로딩 중... ({wait_time:.1f}초)")
-            self.logger.info(f"1차 검색 결과 로딩 대기 중... ({wait_time:.1f}초)")
-            time.sleep(wait_time)
-            
-            phone_number = self._check_and_extract_phone()
-            if phone_number:
-                return phone_number
-            elif phone_number == "MULTIPLE_RESULTS_NO_PHONE":
-                return "MULTIPLE_RESULTS_NO_PHONE"
-            
-            # 2차 검색: 사업장명만
-            print(f"=== 2차 검색: {business_name} ===")
-            self.logger.info(f"=== 2차 검색: {business_name} ===")
-            
-            encoded_business = urllib.parse.quote(business_name)
-            search_url = f"https://map.naver.com/p/search/{encoded_business}"
-            self.logger.info(f"2차 검색 URL: {search_url}")
-            
-            self.driver.get(search_url)
+            self._begin_search(original_address)
             
-            wait_time = random.uniform(3.5, 5.0)  # 3.5초 최소값으로 설정
-            print(f"2차 검색 결과 로딩 중... ({wait_time:.1f}초)")
-            self.logger.info(f"2차 검색 결과 로딩 대기 중... ({wait_time:.1f}초)")
-            time.sleep(wait_time)
-            
-            phone_number = self._check_and_extract_phone()
-            if phone_number:
-                return phone_number
+            # 갱신 모드: 저장된 place id가 있으면 상세 페이지로 바로 이동 (없는 페이지 / 다른 업체면 검색)
+            if self.refresh_by_place_id:
+                opened, phone_number = self._open_known_place(business_name)
+                if opened:
+                    return phone_number
             
-            print("전화번호를 찾을 수 없음")
-            self.logger.warning("전화번호를 찾을 수 없음")
-            return None
+            # 1차(사업장명 + 동이름) → 2차(사업장명) 순서로, 결론이 나지 않은 경우에만 다음 단계 검색
+            phone_number = self._run_search_tree(business_name, dong_name)
+            return self._search_conclusion(phone_number)
             
+        except SearchBlockedError:
+            raise
         except Exception as e:
             self.logger.error(f"검색 및 전화번호 추출 중 오류: {e}")
             print(f"검색 및 전화번호 추출 중 오류: {e}")
             return None
     
-    def is_ulsan_donggu_address(self, address):
-        """주소가 울산 동구인지 확인"""
-        if not address:
-            return False
+    def _begin_search(self, original_address):
+        """행 하나의 검색 상태 초기화"""
+        self.current_original_address = original_address
+        self.current_collected_address = ""
+        self.current_collected_jibun_address = ""  # 구주소 저장용
+        self.current_cache_miss = False
+        self.current_search_trace = []
+        self.current_search_records = []
+    
+    def _search_conclusion(self, phone_number):
+        """검색 단계를 모두 마친 뒤 반환할 값 (전화번호 / CACHE_MISS / None)"""
+        if phone_number:
+            return phone_number
+        
+        if self.current_cache_miss:
+            return "CACHE_MISS"
+        
+        print("전화번호를 찾을 수 없음")
+        self.logger.warning("전화번호를 찾을 수 없음")
+        return None
+    
+    def _run_search_tree(self, business_name, dong_name):
+        """검색 단계 결정 트리 실행 후 단계별 실패 사유 기록"""
+        phone_number, trace = self.search_tree.run(
+            self._run_decision_stage, business_name=business_name, dong_name=dong_name or ''
+        )
+        self._record_search_trace(business_name, trace)
+        return phone_number
+    
+    def _record_search_trace(self, business_name, trace):
+        """결정 트리 단계별 실패 사유 출력 / 기록, 업체가 확인되었으면 place id 저장"""
+        self.current_search_trace.extend(trace)
+        
+        for step in trace:
+            message = f"{step['stage']} 검색 결과 ({step['query']}): {describe_reason(step['reason'])}"
+            if step.get('escalate') is False and step is trace[-1] and len(trace) < len(self.search_tree.stages):
+                message += " → 다음 단계 검색 생략"
+            print(message)
+            self.logger.info(message)
+        self.metrics.annotate(search=self.current_search_trace)
+        
+        # 업체가 확인된 경우 place id 저장 (다음 갱신 때 상세 페이지로 바로 이동)
+        if trace and trace[-1]['reason'] in (REASON_PHONE_FOUND, REASON_NO_PHONE):
+            self._remember_place_id(business_name)
+    
+    def _remember_place_id(self, business_name):
+        """현재 검색 결과의 place id를 사업장명 + 원본 주소 기준으로 저장"""
+        place_id = self.current_search_outcome.get('place_id')
+        if not (self.search_cache and place_id):
+            return
+        try:
+            self.search_cache.put_place_id(business_name, self.current_original_address, place_id)
+        except Exception as e:
+            self.logger.error(f"place id 저장 중 오류: {e}")
+    
+    def _open_known_place(self, business_name):
+        """저장된 place id로 상세 페이지를 바로 열어 전화번호 확인 ((처리 여부, 전화번호) 반환)"""
+        if not self.search_cache or self.cache_config['mode'] == 'replay':
+            return False, None
+        place_id = self.search_cache.get_place_id(business_name, self.current_original_address)
+        if not place_id:
+            return False, None
+        
+        print(f"=== 저장된 place id로 상세 페이지 이동: {place_id} ===")
+        self.logger.info(f"저장된 place id로 상세 페이지 이동: {business_name} ({place_id})")
+        place_url = SITE_CONFIG['base_url'] + SITE_CONFIG['place_path'].format(place_id=place_id)
+        self.current_search_outcome = {'result_count': None, 'candidates': [], 'place_id': place_id, 'reason': None}
+        
+        state = self._open_place_page(place_url)
+        
+        reason = None
+        if state == SEARCH_TIMEOUT:
+            reason = REASON_TIMEOUT
+        elif state != SEARCH_ENTRY or not wait_for_entry_ready(
+            self.driver, self.wait_config['detail_timeout'], self.wait_config['poll_interval']
+        ):
+            reason = REASON_PLACE_NOT_FOUND
+        else:
+            self.driver.switch_to.frame("entryIframe")
+            try:
+                summary = collect_place_summary(self.driver)
+            finally:
+                self.driver.switch_to.default_content()
+            
+            # 업체명을 확인할 수 있으면 검색했던 업체와 같은지 확인
+            place_name = normalize_query(summary.get('name')).replace(' ', '')
+            target_name = normalize_query(business_name).replace(' ', '')
+            if place_name and target_name not in place_name and place_name not in target_name:
+                print(f"❌ 업체명 불일치: {summary.get('name')}")
+                reason = REASON_PLACE_MISMATCH
+            elif summary.get('address'):
+                self.current_collected_address = summary['address']
+        
+        if reason:
+            # 없는 장소 / 다른 업체면 검색으로 다시 찾도록 저장된 place id 삭제 (시간 초과는 다음 갱신 때 다시 시도)
+            if reason != REASON_TIMEOUT:
+                self.search_cache.forget_place_id(business_name, self.current_original_address)
+            self.current_search_trace.append({'stage': 'place', 'query': place_id, 'reason': reason, 'escalate': True})
+            message = f"place id 상세 페이지 ({place_id}): {describe_reason(reason)} → 검색으로 진행"
+            print(message)
+            self.logger.info(message)
+            return False, None
+        
+        with self.metrics.span('detail'):
+            phone_number = self.extract_phone_number_direct() or self.extract_phone_number_from_detail()
+        reason = REASON_PHONE_FOUND if phone_number else REASON_NO_PHONE
+        self.current_search_outcome['reason'] = reason
+        self.current_search_trace.append({'stage': 'place', 'query': place_id, 'reason': reason})
+        self.metrics.annotate(search=self.current_search_trace)
+        
+        message = f"place id 상세 페이지 ({place_id}): {describe_reason(reason)}"
+        print(message)
+        self.logger.info(message)
+        return True, phone_number
+    
+    def _run_decision_stage(self, search_query, label):
+        """결정 트리의 검색 단계 1개 실행 (전화번호, 실패 사유) 반환"""
+        print(f"=== {label} 검색: {search_query} ===")
+        self.logger.info(f"=== {label} 검색: {search_query} ===")
+        phone_number = self._run_search_stage(search_query, label)
+        self.current_search_records.append(search_record(label, search_query, self.current_search_outcome, phone_number))
+        return phone_number, self.current_search_outcome.get('reason')
+    
+    def _run_search_stage(self, search_query, label):
+        """검색어 1개에 대한 검색 실행 (캐시에 있으면 브라우저 없이 재사용)"""
+        handled, phone_number = self._search_from_cache(search_query, label)
+        if handled:
+            return phone_number
+        
+        search_url = self._search_url(search_query, label)
+        self._open_search_page(search_url, label)
+        phone_number = self._check_and_extract_phone()
+        
+        place_id = None
+        if self.search_cache and not self.current_search_outcome.get('place_id'):
+            place_id = self._current_place_id()
+        return self._finish_search_stage(search_query, phone_number, place_id)
+    
+    def _search_from_cache(self, search_query, label):
+        """캐시 / 캐시 전용 모드로 끝나는 단계면 (True, 전화번호), 브라우저 검색이 필요하면 (False, None)"""
+        if self.search_cache and not self.refresh_cache:
+            with self.metrics.span('cache_lookup'):
+                cached = self.search_cache.get(search_query, self.current_original_address)
+            # 이전에 저장된 일시적인 실패(시간 초과 / 오류)는 사용하지 않고 다시 검색 (사유 미기록 결과는 사용)
+            reason = cached.get('reason') if cached else None
+            if reason and reason not in self.cache_config['cache_reasons']:
+                cached = None
+            if cached is not None:
+                print(f"💾 {label} 검색 캐시 사용: {search_query}")
+                self.logger.info(f"{label} 검색 캐시 사용: {search_query}")
+                self.current_search_outcome = cached
+                self.current_collected_address = cached.get('collected_address', "")
+                self.current_collected_jibun_address = cached.get('collected_jibun_address', "")
+                return True, cached.get('phone')
+        
+        if self.cache_config['mode'] == 'replay':
+            print(f"💾 {label} 검색 캐시 없음 (캐시 전용 모드라 검색 생략): {search_query}")
+            self.logger.info(f"{label} 검색 캐시 없음 (캐시 전용 모드): {search_query}")
+            self.current_cache_miss = True
+            self.current_search_outcome = {'reason': REASON_CACHE_MISS}
+            return True, None
+        
+        return False, None
+    
+    def _search_url(self, search_query, label):
+        """검색 페이지 URL (검색 결과 상태 초기화)"""
+        encoded_query = urllib.parse.quote(search_query)
+        search_url = f"{SITE_CONFIG['base_url']}/p/search/{encoded_query}"
+        self.logger.info(f"{label} 검색 URL: {search_url}")
+        
+        self.current_search_outcome = {'result_count': None, 'candidates': [], 'place_id': None, 'reason': None}
+        return search_url
+    
+    def _finish_search_stage(self, search_query, phone_number, place_id=None):
+        """단계 실패 사유 확정 후 확정 사유의 검색 결과만 캐시에 저장 (place_id: 결과에 없을 때 현재 페이지의 place id)"""
+        # 전화번호를 찾지 못한 사유 (결과 처리 중 기록되지 않았으면 알 수 없는 상태로 처리)
+        if phone_number:
+            self.current_search_outcome['reason'] = REASON_PHONE_FOUND
+        elif not self.current_search_outcome.get('reason'):
+            self.current_search_outcome['reason'] = REASON_ERROR
+        
+        if self.search_cache:
+            try:
+                outcome = dict(self.current_search_outcome)
+                outcome.update({
+                    'place_id': outcome.get('place_id') or place_id,
+                    'phone': phone_number,
+                    'collected_address': self.current_collected_address,
+                    'collected_jibun_address': self.current_collected_jibun_address
+                })
+                self.current_search_outcome = outcome
+                if outcome['reason'] in self.cache_config['cache_reasons']:
+                    self.search_cache.put(search_query, self.current_original_address, outcome)
+            except Exception as e:
+                self.logger.error(f"검색 캐시 저장 중 오류: {e}")
+        
+        return phone_number
+    
+    def _current_place_id(self):
+        """현재 열린 상세 페이지의 네이버 place id 추출"""
+        try:
+            self.driver.switch_to.default_content()
+            place_id = extract_place_id(self.driver.current_url)
+            if place_id:
+                return place_id
+            
+            entry_iframes = self.driver.find_elements(By.ID, "entryIframe")
+            if entry_iframes:
+                return extract_place_id(entry_iframes[0].get_attribute('src'))
+        except Exception as e:
+            print(f"place id 확인 중 오류: {e}")
+        return None
+    
+    def _recycle_session_if_needed(self):
+        """세션 기준(이동 횟수 / JS 힙 / RSS)을 넘었으면 다음 페이지 이동 전에 Chrome 세션 재시작"""
+        if self._driver is None or self.attached:
+            return
+        reason = self.session_recycler.recycle_reason(self._driver)
+        if reason:
+            self.recycle_driver(reason)
+    
+    def recycle_driver(self, reason):
+        """현재 Chrome 세션을 닫고 새 세션 시작 (요청 차단 / 봇 탐지 회피 설정 다시 적용)"""
+        message = f"♻️ 브라우저 세션 재시작: {self.session_recycler.describe(reason)}"
+        print(message)
+        self.logger.info(message)
+        with self.metrics.span('recycle'):
+            try:
+                self._driver.quit()
+            except Exception as e:
+                print(f"이전 세션 종료 중 오류 (무시): {e}")
+            self._driver = None
+            self.setup_driver()
+        self.session_recycler.reset()
+    
+    def _open_search_page(self, search_url, label):
+        """검색 페이지 이동 후 결과가 준비될 때까지 대기"""
+        self._navigate(search_url, label)
+        
+        print(f"{label} 검색 결과 로딩 중...")
+        with self.metrics.span('search_wait'):
+            self.current_search_state = wait_for_search_ready(
+                self.driver, self.wait_config['search_timeout'], self.wait_config['poll_interval']
+            )
+        self.logger.info(f"{label} 검색 페이지 상태: {self.current_search_state}")
+        
+        # 페이지 상태로 요청 속도 조절 (접근 제한이면 이 행은 오류로 남겨 재시도 대상이 되게 함)
+        self.rate_limiter.record_search_state(self.current_search_state)
+        if self.current_search_state == SEARCH_BLOCKED:
+            self.logger.warning(f"{label} 검색 중 접근 제한 페이지 감지: {search_url}")
+            raise SearchBlockedError("네이버 지도 접근 제한 페이지 감지")
+        return self.current_search_state
+    
+    def _open_place_page(self, place_url):
+        """저장된 place id 상세 페이지 이동 후 상태 확인 (없는 장소 / 시간 초과는 요청 속도 조절에 반영하지 않음)"""
+        self._navigate(place_url, "place id")
         
-        # 울산 동구 관련 키워드 확인
-        ulsan_donggu_keywords = [
-            "울산광역시 동구", "울산 동구", "울산시 동구",
-            "동부동", "서부동", "중앙동", "화진동", "대송동", 
-            "일산동", "전하동", "미포동", "주전동", "상대동"
-        ]
+        with self.metrics.span('search_wait'):
+            state = wait_for_place_ready(self.driver, self.wait_config['place_timeout'], self.wait_config['poll_interval'])
+        self.logger.info(f"place id 상세 페이지 상태: {state}")
         
-        address_lower = address.lower()
-        for keyword in ulsan_donggu_keywords:
-            if keyword.lower() in address_lower:
-                return True
+        # 폐업 등으로 없어진 장소가 많아도 공유 요청 속도가 떨어지지 않도록 정상 / 접근 제한만 반영
+        if state in (SEARCH_ENTRY, SEARCH_BLOCKED):
+            self.rate_limiter.record_search_state(state)
+        if state == SEARCH_BLOCKED:
+            self.logger.warning(f"place id 상세 페이지에서 접근 제한 페이지 감지: {place_url}")
+            raise SearchBlockedError("네이버 지도 접근 제한 페이지 감지")
+        return state
+    
+    def _navigate(self, url, label):
+        """요청 속도 조절 후 페이지 이동 (필요하면 이동 전에 세션 재시작)"""
+        # 오래된 세션은 이동 전에 교체 (현재 행은 새 세션에서 그대로 진행)
+        self._recycle_session_if_needed()
+        
+        # 공유 속도 조절기에서 순서가 올 때까지 대기 (네이버 차단 방지)
+        with self.metrics.span('politeness_wait'):
+            delay = self.rate_limiter.acquire()
+        if delay:
+            print(f"{label} 검색 전 {delay:.1f}초 대기 (네이버 차단 방지)")
         
-        return False
+        with self.metrics.span('navigate'):
+            try:
+                self.driver.get(url)
+            except (InvalidSessionIdException, NoSuchWindowException):
+                # 브라우저가 죽었거나 창이 닫힌 경우 새 세션으로 한 번 더 시도
+                if self.attached:
+                    raise
+                self.recycle_driver(RECYCLE_CRASHED)
+                self.driver.get(url)
+        self.session_recycler.record_navigation()
+    
+    def is_ulsan_donggu_address(self, address):
+        """주소가 대상 지역(기본: 울산 동구)인지 확인 (시도 → 시군구 → 읍면동 색인으로 판별)"""
+        return self.region_index.matches(address)
 
     def _check_and_extract_phone(self):
         """현재 페이지에서 전화번호 확인 및 추출 (개선된 분기 처리)"""
         try:
             print("=== iframe 처리 시작 ===")
             
-            # searchIframe 로딩 대기
+            # 검색 페이지 상태 확인 (결과 리스트 / 결과 없음 / entryIframe)
+            state = self.current_search_state or wait_for_search_ready(
+                self.driver, self.wait_config['search_timeout'], self.wait_config['poll_interval']
+            )
+            self.current_search_state = None
+            
+            # 결과 리스트 없이 상세 페이지(entryIframe)가 바로 열린 경우
+            if state == SEARCH_ENTRY:
+                print("📱 상세 페이지 바로 열림 처리 시작")
+                return self._process_entry_result()
+            
             try:
-                print("searchIframe 로딩 대기 중... (최대 10초)")
-                iframe = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "searchIframe"))
-                )
+                if state == SEARCH_TIMEOUT:
+                    print("⚠️ 검색 결과 로딩 대기 시간 초과")
+                    self.current_search_outcome['reason'] = REASON_TIMEOUT
+                
+                iframe = self.driver.find_element(By.ID, "searchIframe")
                 print("searchIframe 발견")
                 
                 print("searchIframe으로 전환 중...")
                 self.driver.switch_to.frame(iframe)
                 print("searchIframe 전환 완료")
                 
-                # 검색 결과 로딩 대기
-                print("검색 결과 로딩 대기 중...")
-                time.sleep(3)
-                
                 # 검색 결과 개수 확인
-                result_count = self._get_search_result_count()
+                with self.metrics.span('result_count'):
+                    result_count = self._get_search_result_count()
                 print(f"🔍 검색 결과 개수: {result_count}")
+                self.current_search_outcome['result_count'] = result_count
                 
-                # 1. 검색 결과 0개
+                # 1. 검색 결과 0개 (시간 초과로 확인하지 못한 경우는 결과 없음으로 확정하지 않음)
                 if result_count == 0:
                     print("❌ 검색 결과가 없습니다.")
+                    if state != SEARCH_TIMEOUT:
+                        self.current_search_outcome['reason'] = REASON_NO_RESULTS
                     self.driver.switch_to.default_content()
                     return None
                 
@@ -347,7 +737,8 @@ class FlexibleCrawler:
             
             # searchIframe에서 결과가 없으면 entryIframe 확인
             print("entryIframe에서 전화번호 확인...")
-            phone_number = self.extract_phone_number_direct()
+            with self.metrics.span('direct_phone'):
+                phone_number = self.extract_phone_number_direct()
             if phone_number:
                 return phone_number
             
@@ -355,6 +746,7 @@ class FlexibleCrawler:
             
         except Exception as e:
             print(f"전화번호 확인 중 오류: {e}")
+            self.current_search_outcome['reason'] = REASON_ERROR
             return None
 
     def _get_search_result_count(self):
@@ -416,7 +808,8 @@ class FlexibleCrawler:
             self.driver.switch_to.default_content()
             
             # 1단계: 직접 전화번호 추출 시도 (데이터가 표기된 경우)
-            phone_number = self.extract_phone_number_direct()
+            with self.metrics.span('direct_phone'):
+                phone_number = self.extract_phone_number_direct()
             if phone_number:
                 print("✅ 직접 전화번호 추출 성공 (데이터 표기됨)")
                 return phone_number
@@ -430,16 +823,7 @@ class FlexibleCrawler:
             
             # 3단계: 주소 확인하여 울산 동구가 맞는지 검증
             print("전화번호 추출 실패, 주소 확인 중...")
-            address_info = self._extract_single_result_address()
-            if address_info:
-                if self.is_ulsan_donggu_address(address_info):
-                    print("✅ 주소 확인: 울산 동구 맞음 (전화번호만 없는 경우)")
-                    return None
-                else:
-                    print("❌ 주소 확인: 울산 동구 아님 (잘못된 결과)")
-                    return None
-            
-            print("❌ 단일 결과에서 전화번호를 찾을 수 없고 주소도 확인 불가")
+            self._judge_single_result_address(self._extract_single_result_address())
             return None
             
         except Exception as e:
@@ -447,6 +831,49 @@ class FlexibleCrawler:
             self.driver.switch_to.default_content()
             return None
 
+    def _process_entry_result(self):
+        """검색 결과 리스트 없이 바로 열린 상세 페이지(entryIframe) 처리"""
+        if not wait_for_entry_ready(self.driver, self.wait_config['detail_timeout'], self.wait_config['poll_interval']):
+            print("⚠️ 상세 페이지 로딩 대기 시간 초과")
+            self.current_search_outcome['reason'] = REASON_TIMEOUT
+            return None
+        
+        self.driver.switch_to.frame("entryIframe")
+        try:
+            summary = collect_place_summary(self.driver)
+        finally:
+            self.driver.switch_to.default_content()
+        if summary.get('address'):
+            self.current_collected_address = summary['address']
+        
+        # tel: 링크 → 전화번호 펼치기(a.BfF3H) 순서로 확인
+        with self.metrics.span('detail'):
+            phone_number = self.extract_phone_number_direct() or self.extract_phone_number_from_detail()
+        if phone_number:
+            return phone_number
+        
+        # 전화번호가 없으면 상세 페이지 주소로 대상 지역 업체인지 판단 (주소를 못 읽어도 열린 업체 페이지는 전화번호 없음)
+        print("상세 페이지에 전화번호 없음, 주소 확인 중...")
+        if summary.get('address'):
+            self._judge_single_result_address(summary['address'])
+        else:
+            self.current_search_outcome['reason'] = REASON_NO_PHONE
+        return None
+    
+    def _judge_single_result_address(self, address_info):
+        """전화번호가 없는 단일 결과의 주소로 실패 사유 기록 (대상 지역이면 전화번호 없음)"""
+        if address_info:
+            if self.is_ulsan_donggu_address(address_info):
+                print("✅ 주소 확인: 울산 동구 맞음 (전화번호만 없는 경우)")
+                self.current_search_outcome['reason'] = REASON_NO_PHONE
+            else:
+                print("❌ 주소 확인: 울산 동구 아님 (잘못된 결과)")
+                self.current_search_outcome['reason'] = REASON_WRONG_DISTRICT
+            return
+        
+        print("❌ 단일 결과에서 전화번호를 찾을 수 없고 주소도 확인 불가")
+        self.current_search_outcome['reason'] = REASON_ADDRESS_UNKNOWN
+
     def _extract_single_result_address(self):
         """단일 결과에서 주소 정보 추출"""
         try:
@@ -485,72 +912,63 @@ class FlexibleCrawler:
         try:
             print("=== 다중 결과 처리 시작 ===")
             
-            # searchIframe에서 검색 결과 다시 찾기
-            results = self.driver.find_elements(By.CSS_SELECTOR, "li.VLTHu.OW9LQ")
-            if not results:
-                results = self.driver.find_elements(By.CSS_SELECTOR, ".place_bluelink")
+            # searchIframe에서 상위 top_k개(CANDIDATE_CONFIG) 결과의 이름/주소/업종/링크를 한 번에 수집
+            with self.metrics.span('candidates'):
+                candidates = collect_search_candidates(self.driver, limit=CANDIDATE_CONFIG['top_k'])
+            self.driver.switch_to.default_content()
             
-            if not results:
+            if not candidates:
                 print("❌ 다중 결과에서 검색 결과 요소를 찾을 수 없음")
-                self.driver.switch_to.default_content()
                 return None
             
-            print(f"다중 결과 {len(results)}개 발견")
+            best_result = self._choose_candidate(candidates)
+            if best_result:
+                # 최적 결과 클릭하여 전화번호 추출 (상세 페이지가 열리지 않았으면 일시적인 오류로 기록)
+                opened, phone_number = self._click_best_result_and_extract(best_result)
+                if not phone_number:
+                    self.current_search_outcome['reason'] = REASON_NO_PHONE if opened else REASON_ERROR
+                return phone_number
+            return None
             
-            # 상위 3개 결과만 확인
-            top_results = results[:3]
-            ulsan_donggu_results = []
-            other_location_results = []
+        except Exception as e:
+            print(f"다중 결과 처리 중 오류: {e}")
+            self.driver.switch_to.default_content()
+            return None
+    
+    def _choose_candidate(self, candidates):
+        """다중 결과 후보 중 대상 지역 + 주소 유사도 점수가 가장 높은 후보 선택 (없으면 사유 기록 후 None)"""
+        print(f"다중 결과 상위 {len(candidates)}개 확인")
+        self.current_search_outcome['candidates'] = candidates
+        
+        ulsan_donggu_results = []
+        other_location_results = []
+        
+        for candidate in candidates:
+            i = candidate['index']
+            search_address = candidate['address']
+            if not search_address:
+                print(f"결과 {i+1}에서 주소 정보를 찾을 수 없음")
+                continue
+            
+            print(f"결과 {i+1} 주소: {search_address} ({candidate['name']})")
+            
+            # 울산 동구 여부 확인
+            if self.is_ulsan_donggu_address(search_address):
+                print(f"✅ 결과 {i+1}: 울산 동구 맞음")
+                ulsan_donggu_results.append(candidate)
+            else:
+                print(f"❌ 결과 {i+1}: 울산 동구 아님")
+                other_location_results.append(candidate)
+        
+        # 울산 동구 결과가 있는 경우
+        if ulsan_donggu_results:
+            print(f"울산 동구 결과 {len(ulsan_donggu_results)}개 발견, 최적 결과 선택 중...")
             
-            for i, result in enumerate(top_results):
-                try:
-                    print(f"결과 {i+1} 주소 확인 중...")
-                    
-                    # searchIframe으로 다시 전환
-                    self.driver.switch_to.frame("searchIframe")
-                    
-                    # 해당 결과 내에서 주소 정보 찾기
-                    address_elements = result.find_elements(By.CSS_SELECTOR, "span.Pb4bU")
-                    
-                    if address_elements:
-                        search_address = address_elements[0].text.strip()
-                        print(f"결과 {i+1} 주소: {search_address}")
-                        
-                        # 울산 동구 여부 확인
-                        if self.is_ulsan_donggu_address(search_address):
-                            print(f"✅ 결과 {i+1}: 울산 동구 맞음")
-                            ulsan_donggu_results.append({
-                                'index': i,
-                                'address': search_address,
-                                'element': result
-                            })
-                        else:
-                            print(f"❌ 결과 {i+1}: 울산 동구 아님")
-                            other_location_results.append({
-                                'index': i,
-                                'address': search_address,
-                                'element': result
-                            })
-                        
-                        # 메인 페이지로 복귀
-                        self.driver.switch_to.default_content()
-                    else:
-                        print(f"결과 {i+1}에서 주소 정보를 찾을 수 없음")
-                        self.driver.switch_to.default_content()
-                        
-                except Exception as e:
-                    print(f"결과 {i+1} 처리 중 오류: {e}")
-                    self.driver.switch_to.default_content()
-                    continue
+            # 주소 유사도 점수로 최적 결과 선택
+            best_result = None
+            best_score = -1
             
-            # 울산 동구 결과가 있는 경우
-            if ulsan_donggu_results:
-                print(f"울산 동구 결과 {len(ulsan_donggu_results)}개 발견, 최적 결과 선택 중...")
-                
-                # 주소 유사도 점수로 최적 결과 선택
-                best_result = None
-                best_score = -1
-                
+            with self.metrics.span('scoring'):
                 for result_info in ulsan_donggu_results:
                     score = self.compare_address_similarity(result_info['address'])
                     print(f"결과 {result_info['index']+1} 유사도 점수: {score}")
@@ -558,25 +976,27 @@ class FlexibleCrawler:
                     if score > best_score:
                         best_score = score
                         best_result = result_info
-                
-                if best_result:
-                    print(f"최적 결과 선택: {best_result['index']+1}번째 (점수: {best_score})")
-                    self.current_collected_address = best_result['address']
-                    
-                    # 최적 결과 클릭하여 전화번호 추출
-                    return self._click_best_result_and_extract(best_result)
-            
-            # 울산 동구 결과가 없는 경우
-            else:
-                print("❌ 울산 동구 결과가 없음 - 식당을 찾지 못한 것으로 판단")
-                return None
             
-        except Exception as e:
-            print(f"다중 결과 처리 중 오류: {e}")
+            if best_result:
+                print(f"최적 결과 선택: {best_result['index']+1}번째 (점수: {best_score})")
+                self.current_collected_address = best_result['address']
+                self.current_search_outcome['place_id'] = best_result['place_id']
+                self.current_search_outcome['chosen_index'] = best_result['index']
+                return best_result
+        
+        # 울산 동구 결과가 없는 경우
+        elif other_location_results:
+            print("❌ 울산 동구 결과가 없음 - 식당을 찾지 못한 것으로 판단")
+            self.current_search_outcome['reason'] = REASON_WRONG_DISTRICT
+            return None
+        
+        else:
+            print("❌ 다중 결과의 주소를 확인할 수 없음")
+            self.current_search_outcome['reason'] = REASON_ADDRESS_UNKNOWN
             return None
 
     def _click_best_result_and_extract(self, best_result):
-        """최적 결과 클릭하여 전화번호 추출"""
+        """최적 결과 클릭하여 전화번호 추출 ((상세 페이지가 열렸는지, 전화번호) 반환)"""
         try:
             print("최적 결과 클릭 중...")
             self.driver.switch_to.frame("searchIframe")
@@ -588,27 +1008,28 @@ class FlexibleCrawler:
             
             if best_result['index'] < len(clickable_results):
                 print(f"클릭할 요소 찾음: {clickable_results[best_result['index']].text}")
-                clickable_results[best_result['index']].click()
-                
-                # 로딩 대기
-                wait_time = 2.0 if platform.system() == "Darwin" else 3.0
-                time.sleep(wait_time)
+                with self.metrics.span('click'):
+                    clickable_results[best_result['index']].click()
+                    
+                    # 상세 정보(entryIframe) 로딩 대기
+                    opened = bool(wait_for_entry_ready(self.driver, self.wait_config['detail_timeout'], self.wait_config['poll_interval']))
                 
                 # 메인 페이지로 복귀
                 self.driver.switch_to.default_content()
                 
                 # 새로 생긴 iframe에서 전화번호 찾기
                 print("새로 생긴 iframe에서 전화번호 찾기...")
-                return self.extract_phone_number_from_detail()
+                with self.metrics.span('detail'):
+                    return opened, self.extract_phone_number_from_detail()
             else:
                 print(f"인덱스 {best_result['index']}에 해당하는 클릭 가능한 요소를 찾을 수 없음")
                 self.driver.switch_to.default_content()
-                return None
+                return False, None
                 
         except Exception as e:
             print(f"최적 결과 클릭 중 오류: {e}")
             self.driver.switch_to.default_content()
-            return None
+            return False, None
 
     def _process_single_result(self):
         """단일 검색 결과 처리"""
@@ -651,17 +1072,19 @@ class FlexibleCrawler:
             
             if clickable_links:
                 print(f"클릭 가능한 링크 {len(clickable_links)}개 발견")
-                clickable_links[0].click()
-                print("단일 결과 클릭 완료")
-                
-                # 로딩 대기
-                time.sleep(2)
+                with self.metrics.span('click'):
+                    clickable_links[0].click()
+                    print("단일 결과 클릭 완료")
+                    
+                    # 상세 정보(entryIframe) 로딩 대기
+                    wait_for_entry_ready(self.driver, self.wait_config['detail_timeout'], self.wait_config['poll_interval'])
                 
                 # 메인 페이지로 복귀
                 self.driver.switch_to.default_content()
                 
                 # 상세 페이지에서 전화번호 추출
-                return self.extract_phone_number_from_detail()
+                with self.metrics.span('detail'):
+                    return self.extract_phone_number_from_detail()
             else:
                 print("❌ 클릭 가능한 링크를 찾을 수 없음")
                 self.driver.switch_to.default_content()
@@ -780,9 +1203,8 @@ class FlexibleCrawler:
                     if best_result_index < len(clickable_results):
                         print(f"클릭할 요소 찾음: {clickable_results[best_result_index].text}")
                         clickable_results[best_result_index].click()
-                        # 네이버 차단 방지를 위한 대기 시간
-                        wait_time = 2.0 if platform.system() == "Darwin" else 3.0
-                        time.sleep(wait_time)  # 로딩 대기
+                        # 상세 정보(entryIframe) 로딩 대기
+                        wait_for_entry_ready(self.driver, self.wait_config['detail_timeout'], self.wait_config['poll_interval'])
                         
                         # 메인 페이지로 복귀
                         self.driver.switch_to.default_content()
@@ -817,53 +1239,8 @@ class FlexibleCrawler:
             print(f"원본 주소: {original_address}")
             print(f"검색 구주소: {jibun_address}")
             
-            # 원본 주소에서 동/리 추출
-            orig_parts = original_address.split()
-            orig_dong_ri = None
-            for part in orig_parts:
-                if part.endswith('동') or part.endswith('리'):
-                    orig_dong_ri = part
-                    break
-            
-            # 검색 구주소에서 동/리 추출
-            jibun_parts = jibun_address.split()
-            jibun_dong_ri = None
-            for part in jibun_parts:
-                if part.endswith('동') or part.endswith('리'):
-                    jibun_dong_ri = part
-                    break
-            
-            score = 0
-            
-            # 동/리 정확히 일치 (가장 중요)
-            if orig_dong_ri and jibun_dong_ri and orig_dong_ri == jibun_dong_ri:
-                score += 10
-            
-            # 시/도 레벨 비교
-            if len(orig_parts) > 0 and len(jibun_parts) > 0:
-                if orig_parts[0] in jibun_address:
-                    score += 1
-            
-            # 시/군 레벨 비교
-            if len(orig_parts) > 1 and len(jibun_parts) > 1:
-                if orig_parts[1] in jibun_address:
-                    score += 1
-            
-            # 번지 번호 비교 (상세 주소)
-            orig_bunji = None
-            for part in orig_parts:
-                if '-' in part and part.replace('-', '').isdigit():
-                    orig_bunji = part
-                    break
-            
-            jibun_bunji = None
-            for part in jibun_parts:
-                if '-' in part and part.replace('-', '').isdigit():
-                    jibun_bunji = part
-                    break
-            
-            if orig_bunji and jibun_bunji and orig_bunji == jibun_bunji:
-                score += 5
+            # 동/리 일치 +10, 시/도 +1, 시/군 +1, 번지 일치 +5 (주소 파싱 결과는 캐시 재사용)
+            score = jibun_similarity(original_address, jibun_address)
             
             print(f"최종 유사도 점수: {score}")
             return score
@@ -882,40 +1259,8 @@ class FlexibleCrawler:
             print(f"원본 주소: {original_address}")
             print(f"검색 주소: {search_address}")
             
-            orig_parts = original_address.split()
-            score = 0
-            
-            # 시/도 레벨 비교
-            if len(orig_parts) > 0:
-                if orig_parts[0] in search_address:
-                    score += 1
-            
-            # 시/군 레벨 비교
-            if len(orig_parts) > 1:
-                if orig_parts[1] in search_address:
-                    score += 1
-            
-            # 동/리 레벨 비교 (가장 중요)
-            orig_dong_ri = None
-            for part in orig_parts:
-                if part.endswith('동') or part.endswith('리'):
-                    orig_dong_ri = part
-                    break
-            
-            if orig_dong_ri:
-                if orig_dong_ri in search_address:
-                    score += 5
-                else:
-                    dong_ri_base = orig_dong_ri.replace('동', '').replace('리', '')
-                    if dong_ri_base in search_address:
-                        score += 3
-            
-            # 상세 주소 비교
-            if len(orig_parts) > 3:
-                detail_parts = orig_parts[3:]
-                for detail in detail_parts:
-                    if detail in search_address:
-                        score += 1
+            # 시/도 +1, 시/군 +1, 동/리 +5 (부분 +3), 상세 주소 +1 (주소 파싱 결과는 캐시 재사용)
+            score = address_similarity(original_address, search_address)
             
             print(f"최종 유사도 점수: {score}")
             return score
@@ -1210,12 +1555,11 @@ class FlexibleCrawler:
                     bf3h_elements = self.driver.find_elements(By.CSS_SELECTOR, "a.BfF3H")
                     if bf3h_elements:
                         print(f"✅ entryIframe에서 a.BfF3H 발견: {len(bf3h_elements)}개")
-                        bf3h_elements[0].click()
-                        print("a.BfF3H 클릭 완료")
-                        # 네이버 차단 방지를 위한 대기 시간
-                        wait_time = 1.5 if platform.system() == "Darwin" else 2.0
-                        print(f"{wait_time}초 대기 중... (네이버 차단 방지)")
-                        time.sleep(wait_time)  # 대기
+                        with self.metrics.span('phone_toggle'):
+                            bf3h_elements[0].click()
+                            print("a.BfF3H 클릭 완료")
+                            # 전화번호 영역이 펼쳐질 때까지 대기
+                            wait_for_css(self.driver, "div._YI7T.kH0zp em", self.wait_config['detail_timeout'], self.wait_config['poll_interval'])
                         
                         # entryIframe 내에서 바로 div._YI7T.kH0zp 찾기 (iframe 전환하지 않음)
                         print("entryIframe 내에서 div._YI7T.kH0zp 안의 em 태그에서 전화번호 찾기...")
@@ -1259,12 +1603,11 @@ class FlexibleCrawler:
                 bf3h_elements = self.driver.find_elements(By.CSS_SELECTOR, "a.BfF3H")
                 if bf3h_elements:
                     print(f"✅ searchIframe에서 a.BfF3H 발견: {len(bf3h_elements)}개")
-                    bf3h_elements[0].click()
-                    print("a.BfF3H 클릭 완료")
-                    # 네이버 차단 방지를 위한 대기 시간
-                    wait_time = 1.5 if platform.system() == "Darwin" else 2.0
-                    print(f"{wait_time}초 대기 중... (네이버 차단 방지)")
-                    time.sleep(wait_time)  # 대기
+                    with self.metrics.span('phone_toggle'):
+                        bf3h_elements[0].click()
+                        print("a.BfF3H 클릭 완료")
+                        # 전화번호 영역이 펼쳐질 때까지 대기
+                        wait_for_css(self.driver, "div._YI7T.kH0zp em", self.wait_config['detail_timeout'], self.wait_config['poll_interval'])
                     
                     # searchIframe 내에서 바로 div._YI7T.kH0zp 찾기 (iframe 전환하지 않음)
                     print("searchIframe 내에서 div._YI7T.kH0zp 안의 em 태그에서 전화번호 찾기...")
@@ -1305,12 +1648,11 @@ class FlexibleCrawler:
                 bf3h_elements = self.driver.find_elements(By.CSS_SELECTOR, "a.BfF3H")
                 if bf3h_elements:
                     print(f"✅ 메인 페이지에서 a.BfF3H 발견: {len(bf3h_elements)}개")
-                    bf3h_elements[0].click()
-                    print("a.BfF3H 클릭 완료")
-                    # 네이버 차단 방지를 위한 대기 시간
-                    wait_time = 1.5 if platform.system() == "Darwin" else 2.0
-                    print(f"{wait_time}초 대기 중... (네이버 차단 방지)")
-                    time.sleep(wait_time)  # 대기
+                    with self.metrics.span('phone_toggle'):
+                        bf3h_elements[0].click()
+                        print("a.BfF3H 클릭 완료")
+                        # 전화번호 영역이 펼쳐질 때까지 대기
+                        wait_for_css(self.driver, "div._YI7T.kH0zp em", self.wait_config['detail_timeout'], self.wait_config['poll_interval'])
                     
                     # BfF3H 클릭 후 나타나는 div에서 em 태그 찾기
                     print("BfF3H 클릭 후 div._YI7T.kH0zp 안의 em 태그에서 전화번호 찾기...")
@@ -1399,6 +1741,8 @@ class FlexibleCrawler:
                     return "네이버 지도에서 해당 업체를 찾을 수 없었습니다"
                 elif update_status == "MULTIPLE_RESULTS_NO_PHONE":
                     return "네이버 지도에서 여러 결과가 나왔지만 전화번호 정보가 없었습니다"
+                elif update_status == "CACHE_MISS":
+                    return "검색 캐시 없음 (캐시 전용 모드)"
                 else:
                     return f"전화번호 수집 실패: {update_status}"
             else:
@@ -1438,191 +1782,369 @@ class FlexibleCrawler:
         except Exception as e:
             return f"주소 수집 중 오류: {str(e)}"
     
-    def crawl_phone_numbers(self, test_count=None, start_from_index=None):
+    def process_row(self, row_index, business_name, address, original_phone):
+        """단일 행 검색 후 결과 데이터 생성 (결과, 실제 검색 여부) 반환"""
+        skipped, dong_name = self._prepare_row(row_index, business_name, address, original_phone)
+        if skipped:
+            return skipped, False
+        
+        # 네이버 지도 검색 및 전화번호 추출
+        new_phone = self.search_and_extract_phone(business_name, dong_name, original_address=address)
+        return self._build_row_result(row_index, business_name, address, original_phone, new_phone), True
+    
+    def _prepare_row(self, row_index, business_name, address, original_phone):
+        """검색 전 행 확인 (검색하지 않는 행이면 (결과, None), 검색할 행이면 (None, 동이름))"""
+        # 주소에서 동이름 추출
+        if pd.isna(address) or address == '':
+            print("주소 정보 없음")
+            return {
+                '인덱스': row_index,
+                '사업장명': business_name,
+                '기존주소': address,
+                '기존전화번호': original_phone,
+                '새전화번호': None,
+                '업데이트상태': '주소정보없음',
+                '주소유사도점수': 0,
+                '수집된주소': ""
+            }, None
+        
+        # 동이름 추출
+        dong_name = self.extract_dong_name(address)
+        if not dong_name:
+            print("동이름 추출 실패")
+            return {
+                '인덱스': row_index,
+                '사업장명': business_name,
+                '기존주소': address,
+                '기존전화번호': original_phone,
+                '새전화번호': None,
+                '업데이트상태': '동이름추출실패',
+                '주소유사도점수': 0,
+                '수집된주소': ""
+            }, None
+        
+        print(f"동이름: {dong_name}")
+        return None, dong_name
+    
+    def _build_row_result(self, row_index, business_name, address, original_phone, new_phone):
+        """검색 결과로 저장할 결과 데이터 생성 (다중 결과 후보도 기록)"""
+        # 결과 처리
+        if new_phone == "MULTIPLE_RESULTS_NO_PHONE":
+            update_status = "MULTIPLE_RESULTS_NO_PHONE"
+            new_phone_for_save = None
+            # MULTIPLE_RESULTS_NO_PHONE 케이스에서도 수집된 주소 정보 유지
+            # current_collected_address는 이미 설정되어 있음
+        elif new_phone == "CACHE_MISS":
+            update_status = "CACHE_MISS"
+            new_phone_for_save = None
+        elif new_phone:
+            update_status = "true"
+            new_phone_for_save = new_phone
+        else:
+            update_status = "결과없음"
+            new_phone_for_save = None
+        
+        # 결과 데이터 생성
+        result_data = {
+            '인덱스': row_index,
+            '사업장명': business_name,
+            '기존주소': address,
+            '기존전화번호': original_phone,
+            '새전화번호': new_phone_for_save,
+            '업데이트상태': self.get_update_status(original_phone, new_phone_for_save, update_status),
+            '주소유사도점수': self.get_address_similarity_score(address, new_phone_for_save),
+            '수집된주소': self.get_collected_address(new_phone_for_save)
+        }
+        
+        self.logger.info(f"결과: {update_status}")
+        if new_phone:
+            self.logger.info(f"새 전화번호: {new_phone}")
+        
+        # 다중 결과 후보 기록 (rescore_candidates.py 재채점용)
+        self.candidate_store.write(row_index, business_name, address, self.current_search_records)
+        
+        return result_data
+    
+    def _build_error_result(self, row_index, business_name, address, original_phone, error):
+        """행 처리 중 오류가 난 경우 저장할 결과 데이터 생성"""
+        return {
+            '인덱스': row_index,
+            '사업장명': business_name,
+            '기존주소': address,
+            '기존전화번호': original_phone,
+            '새전화번호': None,
+            '업데이트상태': f'오류 발생: {str(error)}',
+            '주소유사도점수': 0,
+            '수집된주소': ""
+        }
+    
+    def _open_row_source(self, csv_file):
+        """대상 CSV 컬럼 확인 후 행 스트리밍 공급자 생성"""
+        business_name_col = self.config['columns']['business_name']
+        address_col = self.config['columns']['address']
+        phone_col = self.config['columns'].get('phone', None)
+        
+        source = CsvRowSource(csv_file, business_name_col, address_col, phone_col,
+                              chunk_size=self.config.get('chunk_size', 5000))
+        source.validate_columns()
+        
+        print(f"✅ CSV 구조 확인 완료")
+        print(f"   사업장명 컬럼: {business_name_col}")
+        print(f"   주소 컬럼: {address_col}")
+        if phone_col:
+            print(f"   전화번호 컬럼: {phone_col}")
+        
+        return source
+    
+    def _crawl_rows_parallel(self, rows, total_count, workers, ordered_output):
+        """여러 Chrome 세션으로 행을 나눠 처리하고 결과는 한 곳에서 저장"""
+        print(f"⚡ 병렬 크롤링 시작: 워커 {workers}개, {'순서 유지' if ordered_output else '완료 순'} 저장")
+        self.logger.info(f"⚡ 병렬 크롤링 시작: 워커 {workers}개, ordered_output={ordered_output}")
+        
+        # 공유 작업 공급자 (입력 순번, 행 레코드) - 파일에서 필요한 만큼만 꺼내 씀
+        row_iter = enumerate(rows)
+        row_lock = threading.Lock()
+        
+        def next_task():
+            with row_lock:
+                return next(row_iter, None)
+        
+        result_queue = queue.Queue()
+        stop_event = threading.Event()
+        
+        # 현재 크롤러가 첫 번째 워커, 나머지는 새 Chrome 세션으로 생성
+        crawlers = [self]
+        for worker_id in range(1, workers):
+            try:
+                worker = FlexibleCrawler(worker_id=worker_id, metrics=self.metrics,
+                                         candidate_store=self.candidate_store)
+                worker.start_driver()
+                worker.refresh_cache = self.refresh_cache
+                worker.refresh_by_place_id = self.refresh_by_place_id
+                crawlers.append(worker)
+            except Exception as e:
+                print(f"⚠️ 워커 {worker_id} Chrome 세션 생성 실패: {e}")
+                self.logger.error(f"워커 {worker_id} Chrome 세션 생성 실패: {e}")
+        
+        def worker_loop(crawler):
+            while not stop_event.is_set():
+                task = next_task()
+                if task is None:
+                    break
+                position, row = task
+                crawler.metrics.start_row(row.index, row.business_name, crawler.worker_id)
+                row_status = None
+                try:
+                    print(f"\n{'='*50}")
+                    print(f"[워커 {crawler.worker_id or 0}] 처리 중: {row.index}/{total_count} - {row.business_name}")
+                    crawler.logger.info(f"[워커 {crawler.worker_id or 0}] 처리 중: {row.index}/{total_count} - {row.business_name}")
+                    result_data, searched = crawler.process_row(
+                        row.index, row.business_name, row.address, row.phone
+                    )
+                    row_status = result_data.get('업데이트상태')
+                    result_queue.put((position, result_data, searched))
+                except Exception as e:
+                    crawler.logger.error(f"행 처리 중 오류 발생: {e}")
+                    print(f"행 처리 중 오류 발생: {e}")
+                    error_data = crawler._build_error_result(
+                        row.index, row.business_name, row.address, row.phone, e
+                    )
+                    row_status = error_data['업데이트상태']
+                    result_queue.put((position, error_data, False))
+                finally:
+                    # 결과 저장은 메인 스레드에서 하므로 저장 시간은 단계별 요약에만 반영됨
+                    crawler.metrics.end_row(row_status)
+            result_queue.put(None)
+        
+        threads = [threading.Thread(target=worker_loop, args=(crawler,), daemon=True) for crawler in crawlers]
+        for thread in threads:
+            thread.start()
+        
+        # 결과 저장은 메인 스레드 한 곳에서만 수행
+        pending = {}
+        next_position = 0
+        finished_workers = 0
+        try:
+            while finished_workers < len(threads):
+                item = result_queue.get()
+                if item is None:
+                    finished_workers += 1
+                    continue
+                
+                position, result_data, searched = item
+                if not ordered_output:
+                    self._save_parallel_result(result_data, searched)
+                    continue
+                
+                # 순서 유지 모드: 앞 순번이 모두 도착한 결과만 저장
+                pending[position] = (result_data, searched)
+                while next_position in pending:
+                    self._save_parallel_result(*pending.pop(next_position))
+                    next_position += 1
+            
+            # 중간에 빠진 순번이 있어도 남은 결과는 순서대로 저장
+            for position in sorted(pending):
+                self._save_parallel_result(*pending[position])
+        
+        except KeyboardInterrupt:
+            stop_event.set()
+            for position in sorted(pending):
+                self._save_parallel_result(*pending[position])
+            raise
+        
+        finally:
+            stop_event.set()
+            for crawler in crawlers[1:]:
+                crawler.close()
+    
+    def _crawl_rows_cdp(self, rows, total_count, sessions, ordered_output):
+        """Chrome 탭 여러 개를 DevTools로 비동기 제어해서 행을 나눠 처리 (cdp_engine.py)"""
+        from cdp_engine import crawl_rows_cdp
+        
+        asyncio.run(crawl_rows_cdp(self, rows, total_count, sessions, ordered_output))
+    
+    def _save_parallel_result(self, result_data, searched):
+        """병렬 모드에서 워커가 넘긴 결과 저장"""
+        if self.save_single_result(result_data):
+            self.logger.info(f"✅ 결과 저장 완료: {result_data['사업장명']}")
+        else:
+            print(f"❌ 저장 실패")
+            self.logger.error(f"❌ 결과 저장 실패: {result_data['사업장명']}")
+        
+        if searched:
+            self.processed_count += 1
+            if self.processed_count % 10 == 0:
+                self.checkpoint_results()
+                print(f"🎯 {self.processed_count}개 처리됨")
+                self.logger.info(f"🎯 진행 상황: {self.processed_count}개 처리됨")
+    
+    def refresh_known_places(self, test_count=None, workers=None):
+        """갱신 크롤링 (place id가 저장된 업체는 상세 페이지만 열고, 나머지는 캐시 없이 다시 검색)"""
+        print("🔁 저장된 place id 기준 갱신 크롤링")
+        self.logger.info("저장된 place id 기준 갱신 크롤링 시작")
+        self.refresh_by_place_id = True
+        self.refresh_cache = True
+        try:
+            return self.crawl_phone_numbers(test_count=test_count, start_from_index=1, workers=workers)
+        finally:
+            self.refresh_by_place_id = False
+            self.refresh_cache = False
+    
+    def crawl_phone_numbers(self, test_count=None, start_from_index=None, workers=None, ordered_output=None):
         """전화번호 크롤링 메인 함수"""
         try:
-            # CSV 파일 읽기
+            # CSV 파일 확인 (전체를 읽지 않고 청크 단위로 스트리밍)
             csv_file = self.config['target_file']
             print(f"CSV 파일 읽기: {csv_file}")
-            df = pd.read_csv(csv_file)
-            
-            # 설정에서 컬럼명 가져오기
-            business_name_col = self.config['columns']['business_name']
-            address_col = self.config['columns']['address']
-            phone_col = self.config['columns'].get('phone', None)
-            
-            # 컬럼 존재 확인
-            if business_name_col not in df.columns:
-                raise ValueError(f"사업장명 컬럼 '{business_name_col}'을 찾을 수 없습니다.")
-            if address_col not in df.columns:
-                raise ValueError(f"주소 컬럼 '{address_col}'을 찾을 수 없습니다.")
-            
-            print(f"✅ CSV 구조 확인 완료")
-            print(f"   사업장명 컬럼: {business_name_col}")
-            print(f"   주소 컬럼: {address_col}")
-            if phone_col:
-                print(f"   전화번호 컬럼: {phone_col}")
-            
-            # 순번 추가
-            df['인덱스'] = range(1, len(df) + 1)
+            source = self._open_row_source(csv_file)
             
             # 전체 데이터 또는 테스트 데이터 선택
+            total_count = source.count_rows(limit=test_count)
             if test_count:
-                test_df = df.head(test_count).copy()
-                print(f"테스트 데이터 {test_count}개 선택")
+                print(f"테스트 데이터 {total_count}개 선택")
             else:
-                test_df = df.copy()
-                print(f"전체 데이터 {len(df)}개 선택")
+                print(f"전체 데이터 {total_count}개 선택")
             
-            # 기존 결과 파일 확인 및 재시작 처리
-            existing_results = self.check_existing_results()
+            # 기존 결과 파일 확인 및 재시작 처리 (대상 파일의 체크포인트 기준)
+            checkpoint = self.check_existing_results()
             start_index = 0
+            skip_completed = False
             
             if start_from_index is not None:
                 # 사용자가 지정한 인덱스부터 시작
                 start_index = start_from_index - 1  # 0-based 인덱스로 변환
                 print(f"🚀 지정된 인덱스 {start_from_index}부터 크롤링 시작")
                 self.logger.info(f"🚀 지정된 인덱스 {start_from_index}부터 크롤링 시작")
-            elif existing_results and len(existing_results) > 0:
-                # 기존 결과가 있으면 마지막 처리된 인덱스 다음부터 시작
-                last_processed_index = max(int(row['인덱스']) for row in existing_results if pd.notna(row['인덱스']))
-                start_index = last_processed_index
-                print(f"🔄 기존 결과 발견! 인덱스 {last_processed_index + 1}부터 재시작")
-                self.logger.info(f"🔄 기존 결과 발견! 인덱스 {last_processed_index + 1}부터 재시작")
+            elif checkpoint and checkpoint.completed_count() > 0:
+                # 완료 구간 다음부터 시작하고, 중간에 비어 있는 인덱스는 채우고 완료된 인덱스는 건너뜀
+                start_index = checkpoint.first_pending(1) - 1
+                skip_completed = True
+                print(f"🔄 기존 결과 발견! 인덱스 {start_index + 1}부터 재시작 (완료 {checkpoint.completed_count()}개 건너뜀)")
+                self.logger.info(f"🔄 기존 결과 발견! 인덱스 {start_index + 1}부터 재시작")
             else:
                 # 새로 시작
                 print(f"🆕 새로운 크롤링 시작")
                 self.logger.info(f"🆕 새로운 크롤링 시작")
             
             # 결과 파일 초기화 (기존 결과가 있으면 append 모드)
-            self.initialize_result_file(append_mode=start_index > 0)
+            if not (skip_completed or start_index > 0):
+                checkpoint = None
+            self.initialize_result_file(checkpoint)
             
             # 시작 인덱스부터 처리
-            for index, row in test_df.iloc[start_index:].iterrows():
-                try:
-                    print(f"\n{'='*50}")
-                    total_count = len(test_df)
-                    business_name = row[business_name_col]
-                    print(f"처리 중: {index+1}/{total_count} - {business_name}")
-                    self.logger.info(f"처리 중: {index+1}/{total_count} - {business_name}")
-                    
-                    # 주소에서 동이름 추출
-                    address = row[address_col]
-                    if pd.isna(address) or address == '':
-                        print("주소 정보 없음")
-                        result_data = {
-                            '인덱스': row['인덱스'],
-                            '사업장명': business_name,
-                            '기존주소': address,
-                            '기존전화번호': row[phone_col] if phone_col else '',
-                            '새전화번호': None,
-                            '업데이트상태': '주소정보없음',
-                            '주소유사도점수': 0,
-                            '수집된주소': ""
-                        }
-                        self.save_single_result(result_data)
-                        continue
-                    
-                    # 동이름 추출
-                    dong_name = self.extract_dong_name(address)
-                    if not dong_name:
-                        print("동이름 추출 실패")
-                        result_data = {
-                            '인덱스': row['인덱스'],
-                            '사업장명': business_name,
-                            '기존주소': address,
-                            '기존전화번호': row[phone_col] if phone_col else '',
-                            '새전화번호': None,
-                            '업데이트상태': '동이름추출실패',
-                            '주소유사도점수': 0,
-                            '수집된주소': ""
-                        }
-                        self.save_single_result(result_data)
-                        continue
-                    
-                    print(f"동이름: {dong_name}")
-                    
-                    # 네이버 지도 검색 및 전화번호 추출
-                    new_phone = self.search_and_extract_phone(business_name, dong_name, original_address=address)
-                    
-                    # 결과 처리
-                    if new_phone == "MULTIPLE_RESULTS_NO_PHONE":
-                        update_status = "MULTIPLE_RESULTS_NO_PHONE"
-                        new_phone_for_save = None
-                        # MULTIPLE_RESULTS_NO_PHONE 케이스에서도 수집된 주소 정보 유지
-                        # current_collected_address는 이미 설정되어 있음
-                    elif new_phone:
-                        update_status = "true"
-                        new_phone_for_save = new_phone
-                    else:
-                        update_status = "결과없음"
-                        new_phone_for_save = None
-                    
-                    # 결과 데이터 생성
-                    result_data = {
-                        '인덱스': row['인덱스'],
-                        '사업장명': business_name,
-                        '기존주소': address,
-                        '기존전화번호': row[phone_col] if phone_col else '',
-                        '새전화번호': new_phone_for_save,
-                        '업데이트상태': self.get_update_status(row[phone_col] if phone_col else '', new_phone_for_save, update_status),
-                        '주소유사도점수': self.get_address_similarity_score(address, new_phone_for_save),
-                        '수집된주소': self.get_collected_address(new_phone_for_save)
-                    }
-                    
-                    # 결과 저장
-                    if self.save_single_result(result_data):
-                        print(f"✅ 저장 완료")
-                        self.logger.info(f"✅ 결과 저장 완료: {business_name}")
-                    else:
-                        print(f"❌ 저장 실패")
-                        self.logger.error(f"❌ 결과 저장 실패: {business_name}")
-                    
-                    self.logger.info(f"결과: {update_status}")
-                    if new_phone:
-                        self.logger.info(f"새 전화번호: {new_phone}")
-                    
-                    # 네이버 차단 방지를 위한 랜덤 대기 시간 (전체 대기 시간 10초 이하로 제한)
-                    base_wait = 1.5 if platform.system() == "Darwin" else 2.0
-                    random_wait = random.uniform(0.3, 1.0)
-                    wait_time = base_wait + random_wait
-                    print(f"{wait_time:.1f}초 대기 중...")
-                    self.logger.info(f"{wait_time:.1f}초 대기 중... (네이버 차단 방지 + 랜덤)")
-                    time.sleep(wait_time)
-                    
-                    # 처리 카운트 증가
-                    self.processed_count += 1
-                    
-                    # 진행 상황 표시 (10개마다)
-                    if self.processed_count % 10 == 0:
-                        print(f"🎯 {self.processed_count}개 처리됨")
-                        self.logger.info(f"🎯 진행 상황: {self.processed_count}개 처리됨")
-                    
-                except Exception as e:
-                    self.logger.error(f"행 처리 중 오류 발생: {e}")
-                    print(f"행 처리 중 오류 발생: {e}")
-                    
-                    # 오류 데이터도 저장
-                    error_data = {
-                        '인덱스': row.get('인덱스', index+1),
-                        '사업장명': row.get(business_name_col, '알 수 없음'),
-                        '기존주소': row.get(address_col, ''),
-                        '기존전화번호': row.get(phone_col, '') if phone_col else '',
-                        '새전화번호': None,
-                        '업데이트상태': f'오류 발생: {str(e)}',
-                        '주소유사도점수': 0,
-                        '수집된주소': ""
-                    }
+            workers = workers or self.parallel_config['workers']
+            if ordered_output is None:
+                ordered_output = self.parallel_config['ordered_output']
+            
+            rows = source.iter_rows(start_index, total_count)
+            if skip_completed:
+                rows = (row for row in rows if not checkpoint.is_done(row.index))
+            if workers > 1 and self.parallel_config.get('engine') == 'cdp' and self.cache_config['mode'] != 'replay':
+                self._crawl_rows_cdp(rows, total_count, workers, ordered_output)
+            elif workers > 1:
+                self._crawl_rows_parallel(rows, total_count, workers, ordered_output)
+            else:
+                for row in rows:
+                    # 행 단위 단계별 소요 시간 기록 시작
+                    self.metrics.start_row(row.index, row.business_name, self.worker_id)
+                    row_status = None
+                    try:
+                        print(f"\n{'='*50}")
+                        business_name = row.business_name
+                        print(f"처리 중: {row.index}/{total_count} - {business_name}")
+                        self.logger.info(f"처리 중: {row.index}/{total_count} - {business_name}")
+                        
+                        result_data, searched = self.process_row(
+                            row.index, business_name, row.address, row.phone
+                        )
+                        row_status = result_data.get('업데이트상태')
+                        
+                        # 결과 저장
+                        if self.save_single_result(result_data):
+                            print(f"✅ 저장 완료")
+                            self.logger.info(f"✅ 결과 저장 완료: {business_name}")
+                        else:
+                            print(f"❌ 저장 실패")
+                            self.logger.error(f"❌ 결과 저장 실패: {business_name}")
+                        
+                        if not searched:
+                            continue
+                        
+                        # 처리 카운트 증가
+                        self.processed_count += 1
+                        
+                        # 진행 상황 표시 (10개마다)
+                        if self.processed_count % 10 == 0:
+                            self.checkpoint_results()
+                            print(f"🎯 {self.processed_count}개 처리됨")
+                            self.logger.info(f"🎯 진행 상황: {self.processed_count}개 처리됨")
+                        
+                    except Exception as e:
+                        self.logger.error(f"행 처리 중 오류 발생: {e}")
+                        print(f"행 처리 중 오류 발생: {e}")
+                        
+                        # 오류 데이터도 저장
+                        error_data = self._build_error_result(
+                            row.index, row.business_name, row.address, row.phone, e
+                        )
+                        row_status = error_data['업데이트상태']
+                        
+                        if self.save_single_result(error_data):
+                            print(f"✅ 오류 데이터 저장 완료: {error_data['사업장명']}")
+                            self.logger.info(f"✅ 오류 데이터 저장 완료: {error_data['사업장명']}")
+                        else:
+                            print(f"❌ 오류 데이터 저장 실패: {error_data['사업장명']}")
+                            self.logger.error(f"❌ 오류 데이터 저장 실패: {error_data['사업장명']}")
                     
-                    if self.save_single_result(error_data):
-                        print(f"✅ 오류 데이터 저장 완료: {row.get(business_name_col, '알 수 없음')}")
-                        self.logger.info(f"✅ 오류 데이터 저장 완료: {row.get(business_name_col, '알 수 없음')}")
-                    else:
-                        print(f"❌ 오류 데이터 저장 실패: {row.get(business_name_col, '알 수 없음')}")
-                        self.logger.error(f"❌ 오류 데이터 저장 실패: {row.get(business_name_col, '알 수 없음')}")
+                    finally:
+                        self.metrics.end_row(row_status)
             
+
             # 크롤링 완료
+            self.checkpoint_results()
             self.logger.info(f"전체 처리 완료: 총 {self.processed_count}개 처리됨")
+            self.logger.info(f"요청 속도 상태: {self.rate_limiter.status()}")
+            self.logger.info(f"브라우저 세션 재시작: {self.session_recycler.recycle_count}회")
             print(f"🎉 전체 처리 완료: 총 {self.processed_count}개 처리됨")
             print(f"📁 결과 파일: {self.result_file}")
             return f"총 {self.processed_count}개 처리 완료"
@@ -1634,14 +2156,28 @@ class FlexibleCrawler:
     
     def close(self):
         """브라우저 종료"""
-        if self.driver:
-            self.driver.quit()
-            print("브라우저 종료")
+        self._close_result_writer()
+        if self.owns_metrics and self.metrics:
+            self.metrics.close()
+        if self.owns_candidate_store and self.candidate_store:
+            self.candidate_store.close()
+        if self._driver:
+            if self.attached:
+                # 연결한 Chrome은 닫지 않고 chromedriver만 종료
+                self._driver.service.stop()
+                print("Chrome 연결 종료")
+            else:
+                self._driver.quit()
+                print("브라우저 종료")
+            self._driver = None
+        if self.search_cache:
+            self.search_cache.close()
+            self.search_cache = None
 
     def analyze_failed_data(self, csv_file):
-        """실패한 데이터 분석"""
+        """실패한 데이터 분석 (CSV / SQLite 결과 파일)"""
         try:
-            df = pd.read_csv(csv_file)
+            df = read_results(csv_file)
             
             # 실패 사유별 분류
             failed_categories = {
@@ -1670,7 +2206,7 @@ class FlexibleCrawler:
                     })
                 elif similarity_score == 0:
                     # 주소 유사도 0 (잘못된 지역 매칭)
-                    if '울산' not in str(collected_address) or '동구' not in str(collected_address):
+                    if not self.region_index.matches(collected_address):
                         failed_categories['잘못된_지역매칭'].append({
                             'index': row['인덱스'],
                             'business_name': business_name,
@@ -1757,17 +2293,15 @@ class FlexibleCrawler:
             
             # 결과 파일 초기화 (재시도용)
             timestamp = datetime.now().strftime("%y%m%d%H%M%S")
-            retry_file = f'retry_crawling_{timestamp}.csv'
+            retry_file = f'retry_crawling_{timestamp}{self._result_extension()}'
             
             # 헤더 설정
-            headers = self.config['output_columns']
-            with open(retry_file, 'w', encoding='utf-8-sig', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-            
-            self.result_file = retry_file
+            self._open_result_writer(retry_file, self.config['output_columns'])
             print(f"📁 재시도 결과 파일: {retry_file}")
             
+            # 재시도는 캐시된 실패 결과를 재사용하지 않고 새로 검색 (결과는 캐시에 갱신)
+            self.refresh_cache = True
+            
             # 실패한 데이터만 재처리
             success_count = 0
             for i, item in enumerate(target_items):
@@ -1837,16 +2371,17 @@ class FlexibleCrawler:
                         print(f"❌ 재시도 결과 저장 실패")
                         self.logger.error(f"❌ 재시도 결과 저장 실패: {item['business_name']}")
                     
-                    # 네이버 차단 방지를 위한 대기
-                    wait_time = random.uniform(2.0, 3.0)
-                    print(f"{wait_time:.1f}초 대기 중...")
-                    time.sleep(wait_time)
+                    # 다중 결과 후보 기록 (rescore_candidates.py 재채점용)
+                    self.candidate_store.write(item['index'], item['business_name'], address, self.current_search_records)
                     
                 except Exception as e:
                     self.logger.error(f"재시도 중 오류 발생: {e}")
                     print(f"재시도 중 오류 발생: {e}")
                     continue
             
+            self.refresh_cache = False
+            
+            self.checkpoint_results()
             print(f"\n🎉 재시도 완료!")
             print(f"📊 총 재시도: {len(target_items)}개")
             print(f"📊 성공: {success_count}개")
@@ -1867,135 +2402,85 @@ class FlexibleCrawler:
             self.current_original_address = original_address
             # 수집된 주소 초기화
             self.current_collected_address = ""
+            self.current_collected_jibun_address = ""
+            self.current_cache_miss = False
+            self.current_search_trace = []
+            self.current_search_records = []
             
-            # 1차 검색어: 사업장명 + 동이름
-            search_query = f"{business_name} {dong_name}"
-            print(f"=== 1차 검색 시작: {search_query} ===")
-            
-            self.logger.info(f"검색 시작: {search_query}")
-            
-            # 1차 검색 실행
-            encoded_query = urllib.parse.quote(search_query)
-            search_url = f"https://map.naver.com/p/search/{encoded_query}"
-            print(f"1차 검색 URL: {search_url}")
-            
-            print("1차 검색 페이지 로딩 중...")
-            self.driver.get(search_url)
-            print("1차 검색 페이지 로딩 완료")
-            
-            # 랜덤 대기 시간으로 봇 탐지 회피
-            wait_time = random.uniform(4.0, 7.0)
-            print(f"1차 검색 결과 로딩 대기 중... ({wait_time:.1f}초)")
-            time.sleep(wait_time)
-            print("1차 검색 결과 로딩 대기 완료")
-            
-            # 1차 검색 결과 확인
-            phone_number = self._check_and_extract_phone()
+            # 검색 단계 결정 트리 실행 (결론이 난 단계에서 멈춤)
+            phone_number = self._run_search_tree(business_name, dong_name)
             if phone_number and phone_number != "MULTIPLE_RESULTS_NO_PHONE":
                 return phone_number, "전화번호 발견", 0, self.current_collected_address, ""
             elif phone_number == "MULTIPLE_RESULTS_NO_PHONE":
                 return None, "네이버 지도에서 여러 결과가 나왔지만 전화번호 정보가 없었습니다", 0, self.current_collected_address, ""
             
-            # 1차 검색에서 결과가 없거나 단일 결과에서 전화번호를 찾지 못한 경우에만 2차 검색
-            print(f"=== 2차 검색 시작: {business_name} ===")
-            
-            encoded_business = urllib.parse.quote(business_name)
-            search_url = f"https://map.naver.com/p/search/{encoded_business}"
-            print(f"2차 검색 URL: {search_url}")
-            
-            print("2차 검색 페이지 로딩 중...")
-            self.driver.get(search_url)
-            print("2차 검색 페이지 로딩 완료")
-            
-            # 랜덤 대기 시간으로 봇 탐지 회피
-            wait_time = random.uniform(4.0, 7.0)
-            print(f"2차 검색 결과 로딩 대기 중... ({wait_time:.1f}초)")
-            time.sleep(wait_time)
-            print("2차 검색 결과 로딩 대기 완료")
-            
-            # 2차 검색 결과 확인
-            phone_number = self._check_and_extract_phone()
-            if phone_number and phone_number != "MULTIPLE_RESULTS_NO_PHONE":
-                return phone_number, "전화번호 발견", 0, self.current_collected_address, ""
+            if self.current_cache_miss:
+                return None, "검색 캐시 없음 (캐시 전용 모드)", 0, "", ""
             
             print("전화번호를 찾을 수 없음")
             return None, "네이버 지도에서 해당 업체를 찾을 수 없었습니다", 0, self.current_collected_address, ""
             
+        except SearchBlockedError:
+            raise
         except Exception as e:
             self.logger.error(f"검색 및 전화번호 추출 중 오류: {e}")
             print(f"검색 및 전화번호 추출 중 오류: {e}")
             return None, "검색 중 오류 발생", 0, "", str(e)
 
-    def crawl_range(self, start_row=95, end_row=340):
-        """특정 범위의 행만 크롤링하는 함수"""
+    def crawl_range(self, start_row=95, end_row=340, shard=None):
+        """특정 범위의 행만 크롤링하는 함수 (shard가 있으면 범위 안에서 해당 샤드의 행만)"""
         try:
-            # CSV 파일 읽기
+            # CSV 파일 확인 (전체를 읽지 않고 청크 단위로 스트리밍)
             csv_file = self.config['target_file']
             print(f"CSV 파일 읽기: {csv_file}")
-            df = pd.read_csv(csv_file)
-            
-            # 설정에서 컬럼명 가져오기
-            business_name_col = self.config['columns']['business_name']
-            address_col = self.config['columns']['address']
-            phone_col = self.config['columns'].get('phone', None)
-            
-            # 컬럼 존재 확인
-            if business_name_col not in df.columns:
-                raise ValueError(f"사업장명 컬럼 '{business_name_col}'을 찾을 수 없습니다.")
-            if address_col not in df.columns:
-                raise ValueError(f"주소 컬럼 '{address_col}'을 찾을 수 없습니다.")
-            
-            print(f"✅ CSV 구조 확인 완료")
-            print(f"   사업장명 컬럼: {business_name_col}")
-            print(f"   주소 컬럼: {address_col}")
-            if phone_col:
-                print(f"   전화번호 컬럼: {phone_col}")
-            
-            # 순번 추가
-            df['인덱스'] = range(1, len(df) + 1)
+            source = self._open_row_source(csv_file)
             
             # 지정된 범위의 데이터만 선택 (1-based 인덱스)
             start_idx = start_row - 1  # 0-based로 변환
             end_idx = end_row
-            range_df = df.iloc[start_idx:end_idx].copy()
+            range_count = max(source.count_rows(limit=end_idx) - start_idx, 0)
             
-            print(f"🎯 크롤링 범위: {start_row}번째 ~ {end_row}번째 행 ({len(range_df)}개)")
-            self.logger.info(f"🎯 크롤링 범위: {start_row}번째 ~ {end_row}번째 행 ({len(range_df)}개)")
+            print(f"🎯 크롤링 범위: {start_row}번째 ~ {end_row}번째 행 ({range_count}개)")
+            self.logger.info(f"🎯 크롤링 범위: {start_row}번째 ~ {end_row}번째 행 ({range_count}개)")
+            if shard:
+                print(f"🧩 샤드 {shard.number}/{shard.count}: 사업장명 + 주소 해시가 이 샤드인 행만 처리")
+                self.logger.info(f"🧩 샤드 {shard.number}/{shard.count}")
             
-            # 결과 파일 초기화
+            # 결과 파일 초기화 (샤드 실행이면 파일 이름에 샤드 표시)
             timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            result_filename = f"flexible_crawling_{timestamp}_range_{start_row}-{end_row}.csv"
-            self.result_file = result_filename
+            result_filename = f"flexible_crawling_{timestamp}_range_{start_row}-{end_row}{shard_tag(shard)}{self._result_extension()}"
             
-            # 결과 파일 헤더 작성
-            with open(self.result_file, 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    '인덱스', '사업장명', '기존주소', '기존전화번호', '새전화번호', 
-                    '업데이트상태', '주소유사도점수', '수집된주소', '에러 사유'
-                ])
+            # 결과 파일 헤더 작성 (출력 컬럼 설정 + 에러 사유)
+            self._open_result_writer(result_filename, list(self.config['output_columns']) + ['에러 사유'])
             
             print(f"📁 결과 파일 생성: {self.result_file}")
             self.logger.info(f"📁 결과 파일 생성: {self.result_file}")
             
             # 범위 내 각 행 처리
-            for index, row in range_df.iterrows():
+            for row in source.iter_rows(start_idx, end_idx):
+                # 다른 샤드의 행은 건너뜀
+                if not in_shard(shard, row.business_name, row.address):
+                    continue
+                
+                # 행 단위 단계별 소요 시간 기록 시작
+                self.metrics.start_row(row.index, row.business_name, self.worker_id)
+                result_data = None
                 try:
                     print(f"\n{'='*50}")
-                    current_row_num = index + 1
-                    business_name = row[business_name_col]
+                    current_row_num = row.index
+                    business_name = row.business_name
                     print(f"처리 중: {current_row_num}번째 행 - {business_name}")
                     self.logger.info(f"처리 중: {current_row_num}번째 행 - {business_name}")
                     
                     # 주소에서 동이름 추출
-                    address = row[address_col]
+                    address = row.address
                     if pd.isna(address) or address == '':
                         print("주소 정보 없음")
                         result_data = {
-                            '인덱스': row['인덱스'],
+                            '인덱스': row.index,
                             '사업장명': business_name,
                             '기존주소': address,
-                            '기존전화번호': row[phone_col] if phone_col else '',
+                            '기존전화번호': row.phone,
                             '새전화번호': None,
                             '업데이트상태': '주소정보없음',
                             '주소유사도점수': 0,
@@ -2010,10 +2495,10 @@ class FlexibleCrawler:
                     if not dong_name:
                         print("동이름 추출 실패")
                         result_data = {
-                            '인덱스': row['인덱스'],
+                            '인덱스': row.index,
                             '사업장명': business_name,
                             '기존주소': address,
-                            '기존전화번호': row[phone_col] if phone_col else '',
+                            '기존전화번호': row.phone,
                             '새전화번호': None,
                             '업데이트상태': '동이름추출실패',
                             '주소유사도점수': 0,
@@ -2030,10 +2515,10 @@ class FlexibleCrawler:
                     
                     # 결과 저장
                     result_data = {
-                        '인덱스': row['인덱스'],
+                        '인덱스': row.index,
                         '사업장명': business_name,
                         '기존주소': address,
-                        '기존전화번호': row[phone_col] if phone_col else '',
+                        '기존전화번호': row.phone,
                         '새전화번호': phone_number,
                         '업데이트상태': update_status,
                         '주소유사도점수': similarity_score,
@@ -2044,25 +2529,23 @@ class FlexibleCrawler:
                     self.save_single_result(result_data)
                     self.processed_count += 1
                     
+                    # 다중 결과 후보 기록 (rescore_candidates.py 재채점용)
+                    self.candidate_store.write(row.index, business_name, address, self.current_search_records)
+                    
                     # 진행률 출력
                     progress = (current_row_num - start_row + 1) / (end_row - start_row + 1) * 100
                     print(f"📊 진행률: {progress:.1f}% ({current_row_num - start_row + 1}/{end_row - start_row + 1})")
                     
-                    # 랜덤 지연
-                    delay = random.uniform(2, 4)
-                    print(f"⏱️ {delay:.1f}초 대기...")
-                    time.sleep(delay)
-                    
                 except Exception as e:
                     print(f"❌ 행 처리 중 오류: {str(e)}")
                     self.logger.error(f"행 처리 중 오류: {str(e)}")
                     
                     # 오류 결과 저장
                     result_data = {
-                        '인덱스': row['인덱스'],
+                        '인덱스': row.index,
                         '사업장명': business_name,
                         '기존주소': address,
-                        '기존전화번호': row[phone_col] if phone_col else '',
+                        '기존전화번호': row.phone,
                         '새전화번호': None,
                         '업데이트상태': '처리오류',
                         '주소유사도점수': 0,
@@ -2071,7 +2554,11 @@ class FlexibleCrawler:
                     }
                     self.save_single_result(result_data)
                     continue
+                
+                finally:
+                    self.metrics.end_row(result_data['업데이트상태'] if result_data else None)
             
+            self.checkpoint_results()
             print(f"\n🎉 크롤링 완료!")
             print(f"📊 총 처리된 항목: {self.processed_count}개")
             print(f"📁 결과 파일: {self.result_file}")
@@ -2081,8 +2568,7 @@ class FlexibleCrawler:
             print(f"❌ 크롤링 중 오류: {str(e)}")
             self.logger.error(f"크롤링 중 오류: {str(e)}")
         finally:
-            if hasattr(self, 'driver'):
-                self.driver.quit()
+            self.close()
 
 
 
@@ -2102,15 +2588,16 @@ if __name__ == "__main__":
     print("4. 테스트용 (정해진 갯수만 크롤링)")
     print("5. 실패 데이터 분석")
     print("6. 실패 데이터 재시도")
+    print("7. 매칭된 업체 갱신 (저장된 place id로 상세 페이지 바로 열기)")
     print("="*50)
     
     while True:
         try:
-            choice = input("선택하세요 (1/2/3/4/5/6): ").strip()
-            if choice in ['1', '2', '3', '4', '5', '6']:
+            choice = input("선택하세요 (1/2/3/4/5/6/7): ").strip()
+            if choice in ['1', '2', '3', '4', '5', '6', '7']:
                 break
             else:
-                print("1, 2, 3, 4, 5, 6 중에서 선택해주세요.")
+                print("1, 2, 3, 4, 5, 6, 7 중에서 선택해주세요.")
         except KeyboardInterrupt:
             print("\n프로그램 종료")
             exit()
@@ -2165,23 +2652,21 @@ if __name__ == "__main__":
         elif choice == '5':
             # 실패 데이터 분석
             print("\n📊 실패 데이터 분석 시작")
-            csv_files = glob.glob('flexible_crawling_*.csv')
-            if not csv_files:
+            latest_file = crawler._latest_result_file()
+            if not latest_file:
                 print("❌ 분석할 결과 파일을 찾을 수 없습니다.")
                 print("먼저 크롤링을 실행하여 결과 파일을 생성해주세요.")
             else:
-                latest_file = max(csv_files, key=os.path.getctime)
                 print(f"📋 분석 대상 파일: {latest_file}")
                 crawler.analyze_failed_data(latest_file)
         elif choice == '6':
             # 실패 데이터 재시도
             print("\n🔄 실패 데이터 재시도 시작")
-            csv_files = glob.glob('flexible_crawling_*.csv')
-            if not csv_files:
+            latest_file = crawler._latest_result_file()
+            if not latest_file:
                 print("❌ 재시도할 결과 파일을 찾을 수 없습니다.")
                 print("먼저 크롤링을 실행하여 결과 파일을 생성해주세요.")
             else:
-                latest_file = max(csv_files, key=os.path.getctime)
                 print(f"📋 재시도 대상 파일: {latest_file}")
                 
                 # 재시도 카테고리 선택
@@ -2219,6 +2704,10 @@ if __name__ == "__main__":
                     print(f"\n🔄 모든 실패 데이터 재시도 시작")
                 
                 result = crawler.retry_failed_data(latest_file, selected_category)
+        elif choice == '7':
+            # 저장된 place id로 갱신
+            print("\n🔁 매칭된 업체 갱신 시작")
+            result = crawler.refresh_known_places()
         
         if result:
             print(f"\n크롤링 완료! {result}")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+샤드별 범위 크롤링 결과 합치기 + 검증
+
+run_range_crawling.py --shard i/N 으로 만든 결과 파일(…_shard{i}of{N}.csv)을 인덱스 기준으로
+합치고 다음을 확인합니다.
+  - 샤드 누락: 1..N 중 결과 파일이 없는 샤드
+  - 샤드 불일치: 행 키 해시가 파일의 샤드와 다른 행 (다른 대상 파일 / 샤드 수로 실행한 경우)
+  - 중복 인덱스: 같은 인덱스가 여러 번 있으면 처리오류가 아닌 행, 나중 파일의 행을 사용
+  - 인덱스 누락: --start / --end 범위 안에서 결과가 없는 인덱스
+
+사용 예:
+    python merge_shard_results.py flexible_crawling_*_range_1-100000_shard*.csv --start 1 --end 100000
+"""
+
+import argparse
+import glob
+import sys
+from datetime import datetime
+
+import pandas as pd
+
+from result_store import read_results
+from sharding import row_shard, shard_from_filename
+
+ERROR_STATUS = '처리오류'
+
+
+def expand_files(patterns):
+    """파일 / glob 패턴 목록을 정렬된 파일 목록으로 (같은 파일은 한 번만)"""
+    files = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            if path not in files:
+                files.append(path)
+    return files
+
+
+def load_shard_results(files):
+    """결과 파일들을 읽어서 파일 순서 / 샤드 정보를 붙인 DataFrame으로"""
+    frames = []
+    for order, path in enumerate(files):
+        df = read_results(path, dtype=str)
+        shard = shard_from_filename(path)
+        df['_file'] = path
+        df['_file_order'] = order
+        df['_shard'] = shard.number if shard else None
+        df['_shard_count'] = shard.count if shard else None
+        frames.append(df)
+        print(f"📁 {path}: {len(df)}개 행" + (f" (샤드 {shard.number}/{shard.count})" if shard else ''))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def validate_and_merge(results, start=None, end=None):
+    """인덱스 기준으로 합친 결과와 검증 결과(dict) 반환"""
+    report = {}
+
+    shard_counts = sorted(set(results['_shard_count'].dropna()))
+    if len(shard_counts) > 1:
+        report['shard_count_conflict'] = shard_counts
+    if shard_counts:
+        count = int(shard_counts[-1])
+        present = set(results.loc[results['_shard_count'] == count, '_shard'].dropna().astype(int))
+        report['missing_shards'] = [number for number in range(1, count + 1) if number not in present]
+
+        # 행 키(사업장명 + 기존주소) 해시가 파일의 샤드와 같은지 확인
+        tagged = results[results['_shard'].notna()]
+        expected = [row_shard(name, address, int(shard_count)) for name, address, shard_count
+                    in zip(tagged['사업장명'], tagged['기존주소'], tagged['_shard_count'])]
+        mismatched = tagged[pd.Series(expected, index=tagged.index) != tagged['_shard']]
+        report['shard_mismatch'] = mismatched['인덱스'].tolist()
+
+    # 중복 인덱스: 처리오류가 아닌 행 → 나중 파일 순으로 우선
+    results = results.assign(
+        _index=pd.to_numeric(results['인덱스'], errors='coerce'),
+        _is_error=results['업데이트상태'] == ERROR_STATUS
+    )
+    duplicated = results['_index'].duplicated(keep=False)
+    report['duplicate_indexes'] = sorted(results.loc[duplicated, '_index'].dropna().astype(int).unique().tolist())
+    merged = (results.sort_values(['_index', '_is_error', '_file_order'], ascending=[True, True, False])
+              .drop_duplicates('_index', keep='first'))
+
+    if start is not None and end is not None:
+        found = set(merged['_index'].dropna().astype(int))
+        report['missing_indexes'] = [index for index in range(start, end + 1) if index not in found]
+
+    merged = merged.drop(columns=['_file', '_file_order', '_shard', '_shard_count', '_index', '_is_error'])
+    return merged.reset_index(drop=True), report
+
+
+def print_report(report, limit=20):
+    """검증 결과 출력 (문제가 있으면 True)"""
+    problems = False
+
+    def show(label, values):
+        nonlocal problems
+        if values:
+            problems = True
+            preview = ', '.join(str(value) for value in values[:limit])
+            more = f" 외 {len(values) - limit}개" if len(values) > limit else ''
+            print(f"⚠️ {label} {len(values)}개: {preview}{more}")
+
+    if report.get('shard_count_conflict'):
+        problems = True
+        print(f"⚠️ 샤드 수가 다른 파일이 섞여 있음: {report['shard_count_conflict']}")
+    show('샤드 누락', report.get('missing_shards'))
+    show('샤드 불일치 행 (인덱스)', report.get('shard_mismatch'))
+    if report.get('duplicate_indexes'):
+        print(f"ℹ️ 중복 인덱스 {len(report['duplicate_indexes'])}개 (처리오류가 아닌 행 / 나중 파일 기준으로 하나만 사용)")
+    show('인덱스 누락', report.get('missing_indexes'))
+    if not problems:
+        print("✅ 검증 통과")
+    return problems
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='샤드별 범위 크롤링 결과 합치기 + 검증')
+    parser.add_argument('files', nargs='+', help='샤드 결과 파일 또는 glob 패턴')
+    parser.add_argument('--start', type=int, help='전체 범위 시작 행 (인덱스 누락 확인용)')
+    parser.add_argument('--end', type=int, help='전체 범위 끝 행 (포함)')
+    parser.add_argument('--output', help='합친 결과 파일 (기본: flexible_crawling_<시각>_merged.csv)')
+    parser.add_argument('--strict', action='store_true', help='검증 문제가 있으면 종료 코드 1')
+    args = parser.parse_args()
+
+    files = expand_files(args.files)
+    results = load_shard_results(files)
+    if results.empty:
+        print("❌ 합칠 결과가 없습니다.")
+        return 1
+
+    merged, report = validate_and_merge(results, args.start, args.end)
+    problems = print_report(report)
+
+    output_file = args.output or f"flexible_crawling_{datetime.now().strftime('%Y%m%d%H%M%S')}_merged.csv"
+    merged.to_csv(output_file, index=False, encoding='utf-8-sig')
+    print(f"💾 합친 결과 저장: {output_file} ({len(merged)}개 행)")
+    return 1 if problems and args.strict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
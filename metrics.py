@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 단계별 소요 시간 측정
+
+각 단계(페이지 이동, 대기, 결과 확인, 후보 점수 계산, 클릭, a.BfF3H 펼치기, 저장 등)를
+with metrics.span('단계'): 로 감싸면 행 단위 JSONL 기록과 단계별 최근 N건의
+p50/p95/p99 요약(Prometheus 텍스트 형식 파일 / 로컬 HTTP /metrics)을 만든다.
+"""
+
+import contextvars
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def quantile(sorted_values, q):
+    """정렬된 값에서 nearest-rank 분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class PipelineMetrics:
+    """단계별 span 측정기 (병렬 워커가 하나를 공유)"""
+
+    def __init__(self, records_file=None, summary_file=None, summary_every=10, window=1000, http_port=None):
+        self.records_file = records_file
+        self.summary_file = summary_file
+        self.summary_every = summary_every
+        self.window = window
+
+        self.lock = threading.Lock()
+        # 현재 처리 중인 행 기록 (스레드 / asyncio 작업마다 따로 유지)
+        self.current_row = contextvars.ContextVar(f'metrics_row_{id(self)}', default=None)
+        self.samples = {}      # 단계 → 최근 window건 소요 시간 (초)
+        self.totals = {}       # 단계 → [누적 호출 수, 누적 시간]
+        self.row_count = 0
+
+        self.records = open(records_file, 'a', encoding='utf-8') if records_file else None
+        self.http_server = self._start_http_server(http_port) if http_port else None
+
+    @classmethod
+    def from_config(cls, config):
+        """METRICS_CONFIG 설정으로 생성 (비활성화면 파일 출력 없이 메모리 집계만)"""
+        if not config.get('enabled'):
+            return cls()
+        return cls(
+            records_file=config.get('records_file'),
+            summary_file=config.get('summary_file'),
+            summary_every=config.get('summary_every', 10),
+            window=config.get('window', 1000),
+            http_port=config.get('http_port')
+        )
+
+    def start_row(self, row_index, business_name=None, worker_id=None):
+        """현재 스레드 / 작업에서 처리할 행 기록 시작"""
+        self.current_row.set({
+            'row': row_index,
+            'business_name': business_name,
+            'worker': worker_id or 0,
+            'started': time.perf_counter(),
+            'phases': {},
+            'notes': {}
+        })
+
+    def end_row(self, status=None):
+        """현재 스레드 / 작업의 행 기록 종료 후 JSONL 기록"""
+        row = self.current_row.get()
+        if row is None:
+            return None
+        self.current_row.set(None)
+
+        total = time.perf_counter() - row.pop('started')
+        self._add_sample('row', total)
+
+        record = {
+            'ts': datetime.now().isoformat(timespec='milliseconds'),
+            'row': _plain(row['row']),
+            'business_name': _plain(row['business_name']),
+            'worker': row['worker'],
+            'status': _plain(status),
+            'total_ms': round(total * 1000, 1),
+            'phases': {phase: round(seconds * 1000, 1) for phase, seconds in row['phases'].items()},
+            **row['notes']
+        }
+
+        with self.lock:
+            self.row_count += 1
+            if self.records:
+                self.records.write(json.dumps(record, ensure_ascii=False) + '\n')
+                self.records.flush()
+            write_summary = self.summary_file and self.row_count % self.summary_every == 0
+
+        if write_summary:
+            self.write_summary()
+        return record
+
+    def annotate(self, **fields):
+        """현재 행 기록에 추가 정보 저장 (예: 검색 단계별 실패 사유)"""
+        row = self.current_row.get()
+        if row is not None:
+            row['notes'].update(fields)
+
+    @contextmanager
+    def span(self, phase):
+        """단계 소요 시간 측정 (현재 행 기록과 단계별 요약에 모두 반영)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            row = self.current_row.get()
+            if row is not None:
+                row['phases'][phase] = row['phases'].get(phase, 0) + elapsed
+            self._add_sample(phase, elapsed)
+
+    def _add_sample(self, phase, seconds):
+        with self.lock:
+            if phase not in self.samples:
+                self.samples[phase] = deque(maxlen=self.window)
+                self.totals[phase] = [0, 0.0]
+            self.samples[phase].append(seconds)
+            self.totals[phase][0] += 1
+            self.totals[phase][1] += seconds
+
+    def summary(self):
+        """단계별 최근 window건의 분위수와 누적 호출 수/시간"""
+        with self.lock:
+            snapshot = {phase: sorted(values) for phase, values in self.samples.items()}
+            totals = {phase: list(values) for phase, values in self.totals.items()}
+
+        result = {}
+        for phase, values in snapshot.items():
+            count, total = totals[phase]
+            result[phase] = {
+                'count': count,
+                'sum_seconds': total,
+                'mean_ms': total / count * 1000 if count else 0,
+                **{f"p{int(q * 100)}_ms": quantile(values, q) * 1000 for q in QUANTILES}
+            }
+        return result
+
+    def render_prometheus(self):
+        """Prometheus 텍스트 형식 요약"""
+        lines = [
+            "# HELP crawler_phase_seconds 크롤링 단계별 소요 시간 (최근 구간 분위수)",
+            "# TYPE crawler_phase_seconds summary"
+        ]
+        for phase, stats in sorted(self.summary().items()):
+            for q in QUANTILES:
+                value = stats[f"p{int(q * 100)}_ms"] / 1000
+                lines.append(f'crawler_phase_seconds{{phase="{phase}",quantile="{q}"}} {value:.6f}')
+            lines.append(f'crawler_phase_seconds_sum{{phase="{phase}"}} {stats["sum_seconds"]:.6f}')
+            lines.append(f'crawler_phase_seconds_count{{phase="{phase}"}} {stats["count"]}')
+        lines.append("# HELP crawler_rows_total 처리한 행 수")
+        lines.append("# TYPE crawler_rows_total counter")
+        lines.append(f"crawler_rows_total {self.row_count}")
+        return '\n'.join(lines) + '\n'
+
+    def write_summary(self, path=None):
+        """요약을 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = path or self.summary_file
+        if not path:
+            return
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+    def _start_http_server(self, port):
+        """로컬 /metrics 엔드포인트 실행"""
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') != '/metrics':
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = metrics.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"📈 단계별 측정값 엔드포인트: http://127.0.0.1:{port}/metrics")
+        return server
+
+    def close(self):
+        """요약 저장 후 파일 / 엔드포인트 종료"""
+        if self.summary_file and self.samples:
+            self.write_summary()
+        if self.records:
+            self.records.close()
+            self.records = None
+        if self.http_server:
+            self.http_server.shutdown()
+            self.http_server = None
+
+
+def _plain(value):
+    """JSON으로 기록할 수 있는 값으로 변환 (NaN/numpy 값 처리)"""
+    if value is None:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
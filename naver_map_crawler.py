@@ -4,20 +4,28 @@ import re
 import urllib.parse
 import platform
 import os
-import random
-import csv
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException
 import logging
 
+from config import WAIT_CONFIG, OUTPUT_CONFIG, SITE_CONFIG, METRICS_CONFIG, DRIVER_CONFIG, SESSION_CONFIG
+from result_writer import ResultWriter
+from driver_utils import get_browser_profile, apply_browser_profile, launch_chrome, attach_chrome, prepare_session
+from page_scripts import collect_search_candidates
+from metrics import PipelineMetrics
+from page_waits import (
+    wait_for_search_ready, wait_for_entry_ready, wait_for_css,
+    SEARCH_ENTRY, SEARCH_BLOCKED
+)
+from rate_limiter import get_rate_limiter, SearchBlockedError
+from session_recycler import SessionRecycler, RECYCLE_CRASHED
+from address_parser import parse_address, similarity_breakdown
+
 # ===== 설정 변수 =====
 # 타겟 CSV 파일명 설정 (필요에 따라 변경하세요)
 TARGET_CSV_FILE = "stores.csv"  # 타겟 CSV 파일
@@ -25,12 +33,22 @@ TARGET_CSV_FILE = "stores.csv"  # 타겟 CSV 파일
 
 class NaverMapCrawler:
     def __init__(self):
-        self.setup_driver()
+        # lazy_start면 처음 브라우저가 필요할 때 Chrome 실행
+        self._driver = None
+        self.attached = False
+        if not DRIVER_CONFIG['lazy_start']:
+            self.setup_driver()
         self.setup_logging()
         self.processed_count = 0
         self.batch_size = 1  # 1개씩 실시간 저장
         self.result_file = None
         self.csv_writer = None
+        self.wait_config = WAIT_CONFIG
+        self.rate_limiter = get_rate_limiter()
+        # 세션별 페이지 이동 / 메모리 기준으로 Chrome 재시작
+        self.session_recycler = SessionRecycler.from_config(SESSION_CONFIG)
+        self.current_search_state = None
+        self.metrics = PipelineMetrics.from_config(METRICS_CONFIG)
         
     def clean_original_data(self, input_file):
         """원본 데이터 정리 및 순번 재정렬"""
@@ -161,9 +179,14 @@ class NaverMapCrawler:
                 '업데이트_상태', '주소_유사도_점수', '수집된_주소'
             ]
             
-            with open(self.result_file, 'w', encoding='utf-8-sig', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
+            if self.csv_writer:
+                self.csv_writer.close()
+            self.csv_writer = ResultWriter(
+                self.result_file, headers,
+                flush_rows=OUTPUT_CONFIG['flush_rows'],
+                flush_seconds=OUTPUT_CONFIG['flush_seconds'],
+                fsync_on_checkpoint=OUTPUT_CONFIG['fsync_on_checkpoint']
+            )
             
             print(f"📁 실시간 저장 파일 초기화: {self.result_file}")
             self.logger.info(f"실시간 저장 파일 초기화: {self.result_file}")
@@ -175,22 +198,13 @@ class NaverMapCrawler:
     def save_single_result(self, result):
         """단일 결과 실시간 저장"""
         try:
-            if not self.result_file:
+            if not self.csv_writer:
                 print("결과 파일이 초기화되지 않았습니다.")
                 return False
             
-            # CSV에 한 줄씩 추가
-            with open(self.result_file, 'a', encoding='utf-8-sig', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    result['순번'], result['사업장명'], result['인허가일자'], 
-                    result['영업상태명'], result['기존_소재지전화'], 
-                    result['새_소재지전화'], result['소재지전체주소'], 
-                    result['도로명전체주소'], result['도로명우편번호'], 
-                    result['업태구분명'], result['위생업태명'], 
-                    result['업데이트_상태'], result['주소_유사도_점수'], 
-                    result['수집된_주소']
-                ])
+            # 열어둔 CSV에 한 줄씩 추가 (flush 정책은 writer가 관리)
+            with self.metrics.span('save'):
+                self.csv_writer.write(result)
             
             return True
             
@@ -199,8 +213,28 @@ class NaverMapCrawler:
             self.logger.error(f"단일 결과 저장 중 오류: {e}")
             return False
         
+    @property
+    def driver(self):
+        """WebDriver (처음 사용할 때 Chrome 실행)"""
+        if self._driver is None:
+            self.setup_driver()
+        return self._driver
+    
+    @driver.setter
+    def driver(self, driver):
+        self._driver = driver
+    
     def setup_driver(self):
         """Chrome WebDriver 설정 (맥OS 호환성 고려)"""
+        # 실행 중인 Chrome에 연결 (로그인 상태 / 이미 띄운 브라우저 재사용)
+        if DRIVER_CONFIG.get('debugger_address'):
+            print(f"실행 중인 Chrome에 연결 중: {DRIVER_CONFIG['debugger_address']}")
+            self.driver = attach_chrome(DRIVER_CONFIG['debugger_address'])
+            self.attached = True
+            prepare_session(self.driver, get_browser_profile(), clear_cookies=False)
+            print("Chrome 연결 완료!")
+            return
+        
         print("Chrome WebDriver 설정 중...")
         chrome_options = Options()
         
@@ -242,6 +276,10 @@ class NaverMapCrawler:
         # User-Agent 설정 (최신 Chrome 버전)
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         
+        # 브라우저 프로필 (headless / 요청 차단)
+        browser_profile = get_browser_profile()
+        apply_browser_profile(chrome_options, browser_profile)
+        
         # 맥OS 전용 성능 최적화 (M1 맥북이 아닌 경우)
         if platform.system() == "Darwin" and platform.machine() != "arm64":
             chrome_options.add_argument("--disable-background-timer-throttling")
@@ -258,19 +296,14 @@ class NaverMapCrawler:
                 self.driver = webdriver.Chrome(options=chrome_options)
                 print("맥OS ARM64 Chrome으로 WebDriver 설정 완료!")
             else:
-                # 일반적인 방법으로 ChromeDriver 설치
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                # chromedriver 경로는 프로세스에서 한 번만 확인하고 파일에 저장해서 재사용
+                self.driver = launch_chrome(chrome_options)
                 print("Chrome WebDriver 설정 완료!")
             
-            # 봇 탐지 회피를 위한 JavaScript 실행
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
-            self.driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']})")
-            self.driver.execute_script("Object.defineProperty(navigator, 'platform', {get: () => 'MacIntel'})")
-            
-            # 쿠키 및 로컬 스토리지 초기화
-            self.driver.delete_all_cookies()
+            # DevTools 요청 차단 + 봇 탐지 회피 JavaScript + 쿠키 초기화
+            blocked_count = prepare_session(self.driver, browser_profile)
+            if blocked_count:
+                print(f"네트워크 요청 차단 설정 완료 (패턴 {blocked_count}개)")
             
         except Exception as e:
             print(f"Chrome WebDriver 설정 실패: {e}")
@@ -364,8 +397,8 @@ class NaverMapCrawler:
         if pd.isna(address) or address == '':
             return None, None, None
             
-        # 경상남도 거제시 아주동 1701-3 1층 형태에서 추출
-        parts = address.split()
+        # 경상남도 거제시 아주동 1701-3 1층 형태에서 추출 (같은 주소는 파싱 캐시 재사용)
+        parts = parse_address(address).parts
         if len(parts) >= 3:
             return parts[0], parts[1], parts[2]  # 시, 구, 동
         return None, None, None
@@ -404,17 +437,11 @@ class NaverMapCrawler:
             
             # 1차 검색 실행
             encoded_query = urllib.parse.quote(search_query)
-            search_url = f"https://map.naver.com/p/search/{encoded_query}"
+            search_url = f"{SITE_CONFIG['base_url']}/p/search/{encoded_query}"
             print(f"1차 검색 URL: {search_url}")
             
             print("1차 검색 페이지 로딩 중...")
-            self.driver.get(search_url)
-            print("1차 검색 페이지 로딩 완료")
-            
-            # 랜덤 대기 시간으로 봇 탐지 회피
-            wait_time = random.uniform(4.0, 7.0)
-            print(f"1차 검색 결과 로딩 대기 중... ({wait_time:.1f}초)")
-            time.sleep(wait_time)
+            self._open_search_page(search_url, "1차")
             print("1차 검색 결과 로딩 대기 완료")
             
             # 1차 검색 결과 확인
@@ -429,17 +456,11 @@ class NaverMapCrawler:
             print(f"=== 2차 검색 시작: {business_name} ===")
             
             encoded_business = urllib.parse.quote(business_name)
-            search_url = f"https://map.naver.com/p/search/{encoded_business}"
+            search_url = f"{SITE_CONFIG['base_url']}/p/search/{encoded_business}"
             print(f"2차 검색 URL: {search_url}")
             
             print("2차 검색 페이지 로딩 중...")
-            self.driver.get(search_url)
-            print("2차 검색 페이지 로딩 완료")
-            
-            # 랜덤 대기 시간으로 봇 탐지 회피
-            wait_time = random.uniform(4.0, 7.0)
-            print(f"2차 검색 결과 로딩 대기 중... ({wait_time:.1f}초)")
-            time.sleep(wait_time)
+            self._open_search_page(search_url, "2차")
             print("2차 검색 결과 로딩 대기 완료")
             
             # 2차 검색 결과 확인
@@ -450,21 +471,85 @@ class NaverMapCrawler:
             print("전화번호를 찾을 수 없음")
             return None
             
+        except SearchBlockedError:
+            raise
         except Exception as e:
             self.logger.error(f"검색 및 전화번호 추출 중 오류: {e}")
             print(f"검색 및 전화번호 추출 중 오류: {e}")
             return None
     
+    def _recycle_session_if_needed(self):
+        """세션 기준(이동 횟수 / JS 힙 / RSS)을 넘었으면 다음 페이지 이동 전에 Chrome 세션 재시작"""
+        if self._driver is None or self.attached:
+            return
+        reason = self.session_recycler.recycle_reason(self._driver)
+        if reason:
+            self.recycle_driver(reason)
+    
+    def recycle_driver(self, reason):
+        """현재 Chrome 세션을 닫고 새 세션 시작 (요청 차단 / 봇 탐지 회피 설정 다시 적용)"""
+        message = f"♻️ 브라우저 세션 재시작: {self.session_recycler.describe(reason)}"
+        print(message)
+        with self.metrics.span('recycle'):
+            try:
+                self._driver.quit()
+            except Exception as e:
+                print(f"이전 세션 종료 중 오류 (무시): {e}")
+            self._driver = None
+            self.setup_driver()
+        self.session_recycler.reset()
+    
+    def _open_search_page(self, search_url, label):
+        """검색 페이지 이동 후 결과가 준비될 때까지 대기"""
+        # 오래된 세션은 이동 전에 교체 (현재 행은 새 세션에서 그대로 진행)
+        self._recycle_session_if_needed()
+        
+        # 공유 속도 조절기에서 순서가 올 때까지 대기 (네이버 차단 방지)
+        with self.metrics.span('politeness_wait'):
+            delay = self.rate_limiter.acquire()
+        if delay:
+            print(f"{label} 검색 전 {delay:.1f}초 대기 (네이버 차단 방지)")
+        
+        with self.metrics.span('navigate'):
+            try:
+                self.driver.get(search_url)
+            except (InvalidSessionIdException, NoSuchWindowException):
+                # 브라우저가 죽었거나 창이 닫힌 경우 새 세션으로 한 번 더 시도
+                if self.attached:
+                    raise
+                self.recycle_driver(RECYCLE_CRASHED)
+                self.driver.get(search_url)
+        self.session_recycler.record_navigation()
+        
+        with self.metrics.span('search_wait'):
+            self.current_search_state = wait_for_search_ready(
+                self.driver, self.wait_config['search_timeout'], self.wait_config['poll_interval']
+            )
+        print(f"{label} 검색 페이지 상태: {self.current_search_state}")
+        
+        # 페이지 상태로 요청 속도 조절 (접근 제한이면 이 행은 오류로 기록)
+        self.rate_limiter.record_search_state(self.current_search_state)
+        if self.current_search_state == SEARCH_BLOCKED:
+            raise SearchBlockedError("네이버 지도 접근 제한 페이지 감지")
+        return self.current_search_state
+    
     def _check_and_extract_phone(self):
         """현재 페이지에서 전화번호 확인 및 추출"""
         try:
             # searchIframe에서 검색 결과 확인
             print("=== iframe 처리 시작 ===")
+            
+            # 검색 페이지 상태 확인 (결과 리스트 / 결과 없음 / entryIframe)
+            state = self.current_search_state or wait_for_search_ready(
+                self.driver, self.wait_config['search_timeout'], self.wait_config['poll_interval']
+            )
+            self.current_search_state = None
+            
             try:
-                print("searchIframe 로딩 대기 중... (최대 10초)")
-                iframe = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "searchIframe"))
-                )
+                if state == SEARCH_ENTRY:
+                    raise Exception("결과 리스트 없이 entryIframe이 바로 열림")
+                
+                iframe = self.driver.find_element(By.ID, "searchIframe")
                 print("searchIframe 발견")
                 
                 print("searchIframe으로 전환 중...")
@@ -505,7 +590,8 @@ class NaverMapCrawler:
             
             # searchIframe에서 결과가 없으면 entryIframe 확인
             print("entryIframe에서 전화번호 확인...")
-            phone_number = self.extract_phone_number_direct()
+            with self.metrics.span('direct_phone'):
+                phone_number = self.extract_phone_number_direct()
             if phone_number:
                 return phone_number
             
@@ -520,75 +606,45 @@ class NaverMapCrawler:
         try:
             print(f"=== 다중 검색 결과 처리 시작 ({len(results)}개) ===")
             
-            # 상위 3개 결과만 확인
-            top_results = results[:3]
+            # searchIframe에서 상위 3개 결과의 이름/주소/업종/링크를 한 번에 수집
+            with self.metrics.span('candidates'):
+                self.driver.switch_to.frame("searchIframe")
+                try:
+                    candidates = collect_search_candidates(self.driver, limit=3)
+                finally:
+                    self.driver.switch_to.default_content()
+            
             best_result_index = None
             best_score = -1
             best_address = ""
             
-            for i, result in enumerate(top_results):
-                try:
-                    print(f"결과 {i+1} 확인 중...")
-                    
-                    # searchIframe 내부에서 해당 결과의 주소 정보 찾기
-                    try:
-                        # searchIframe으로 다시 전환
-                        self.driver.switch_to.frame("searchIframe")
-                        
-                        # 해당 결과 내에서 span.Pb4bU 찾기
-                        address_elements = result.find_elements(By.CSS_SELECTOR, "span.Pb4bU")
-                        
-                        if address_elements:
-                            search_address = address_elements[0].text.strip()
-                            print(f"결과 {i+1}에서 span.Pb4bU 발견: {search_address}")
-                            
-                            # 메인 페이지로 복귀
-                            self.driver.switch_to.default_content()
-                            
-                            # 주소 유사도 비교 (타겟 CSV의 소재지전체주소와 비교)
-                            score = self.compare_address_similarity(search_address)
-                            print(f"주소 유사도 점수: {score}")
-                            
-                            if score > best_score:
-                                best_score = score
-                                best_result_index = i
-                                best_address = search_address  # 최적 결과의 주소 저장
-                        else:
-                            print(f"결과 {i+1}에서 span.Pb4bU를 찾을 수 없음")
-                            # 메인 페이지로 복귀
-                            self.driver.switch_to.default_content()
-                        
-                    except Exception as e:
-                        print(f"결과 {i+1} 주소 확인 중 오류: {e}")
-                        self.driver.switch_to.default_content()
+            with self.metrics.span('scoring'):
+                for candidate in candidates:
+                    i = candidate['index']
+                    search_address = candidate['address']
+                    if not search_address:
+                        print(f"결과 {i+1}에서 span.Pb4bU를 찾을 수 없음")
                         continue
                     
-                except Exception as e:
-                    print(f"결과 {i+1} 처리 중 오류: {e}")
-                    self.driver.switch_to.default_content()
-                    continue
+                    print(f"결과 {i+1}에서 span.Pb4bU 발견: {search_address}")
+                    
+                    # 주소 유사도 비교 (타겟 CSV의 소재지전체주소와 비교)
+                    score = self.compare_address_similarity(search_address)
+                    print(f"주소 유사도 점수: {score}")
+                    
+                    if score > best_score:
+                        best_score = score
+                        best_result_index = i
+                        best_address = search_address  # 최적 결과의 주소 저장
             
             # 최적 결과에서 전화번호 추출
             if best_result_index is not None:
                 print(f"최적 결과 선택 (인덱스: {best_result_index}, 점수: {best_score})")
             else:
-                # 모든 결과의 주소 유사도 점수가 0인 경우, 첫 번째 결과를 선택
-                print("모든 결과의 주소 유사도 점수가 0입니다. 첫 번째 결과를 선택합니다.")
+                # 모든 결과의 주소 정보가 없는 경우, 첫 번째 결과를 선택
+                print("모든 결과의 주소 정보를 찾을 수 없습니다. 첫 번째 결과를 선택합니다.")
                 best_result_index = 0
                 best_score = 0
-                
-                # 첫 번째 결과의 주소 정보 가져오기
-                try:
-                    self.driver.switch_to.frame("searchIframe")
-                    first_result = top_results[0]
-                    address_elements = first_result.find_elements(By.CSS_SELECTOR, "span.Pb4bU")
-                    if address_elements:
-                        best_address = address_elements[0].text.strip()
-                        print(f"첫 번째 결과 주소: {best_address}")
-                    self.driver.switch_to.default_content()
-                except Exception as e:
-                    print(f"첫 번째 결과 주소 가져오기 중 오류: {e}")
-                    self.driver.switch_to.default_content()
             
             if best_result_index is not None:
                 print(f"최적 결과 선택 (인덱스: {best_result_index}, 점수: {best_score})")
@@ -607,17 +663,18 @@ class NaverMapCrawler:
                     clickable_results = self.driver.find_elements(By.CSS_SELECTOR, "li.VLTHu.OW9LQ a.place_bluelink")
                     if best_result_index < len(clickable_results):
                         print(f"클릭할 요소 찾음: {clickable_results[best_result_index].text}")
-                        clickable_results[best_result_index].click()
-                        # 네이버 차단 방지를 위한 대기 시간
-                        wait_time = 2.0 if platform.system() == "Darwin" else 3.0
-                        time.sleep(wait_time)  # 로딩 대기
+                        with self.metrics.span('click'):
+                            clickable_results[best_result_index].click()
+                            # 상세 정보(entryIframe) 로딩 대기
+                            wait_for_entry_ready(self.driver, self.wait_config['detail_timeout'], self.wait_config['poll_interval'])
                         
                         # 메인 페이지로 복귀
                         self.driver.switch_to.default_content()
                         
                         # 새로 생긴 iframe에서 전화번호 찾기
                         print("새로 생긴 iframe에서 전화번호 찾기...")
-                        return self.extract_phone_number_from_detail()
+                        with self.metrics.span('detail'):
+                            return self.extract_phone_number_from_detail()
                     else:
                         print(f"인덱스 {best_result_index}에 해당하는 클릭 가능한 요소를 찾을 수 없음")
                         self.driver.switch_to.default_content()
@@ -647,50 +704,11 @@ class NaverMapCrawler:
             print(f"원본 주소: {original_address}")
             print(f"검색 주소: {search_address}")
             
-            # 동/리 추출
-            orig_parts = original_address.split()
-            search_parts = search_address.split()
-            
+            # 항목별 매칭 (주소 파싱 결과는 캐시 재사용)
             score = 0
-            
-            # 시/도 레벨 비교 (예: 경상남도)
-            if len(orig_parts) > 0:
-                if orig_parts[0] in search_address:
-                    score += 1
-                    print(f"시/도 매칭: {orig_parts[0]}")
-            
-            # 시/군 레벨 비교 (예: 거제시)
-            if len(orig_parts) > 1:
-                if orig_parts[1] in search_address:
-                    score += 1
-                    print(f"시/군 매칭: {orig_parts[1]}")
-            
-            # 동/리 레벨 비교 (가장 중요)
-            orig_dong_ri = None
-            for part in orig_parts:
-                if part.endswith('동') or part.endswith('리'):
-                    orig_dong_ri = part
-                    break
-            
-            if orig_dong_ri:
-                if orig_dong_ri in search_address:
-                    score += 5  # 동/리 매칭에 매우 높은 가중치
-                    print(f"동/리 매칭: {orig_dong_ri} (점수 +5)")
-                else:
-                    # 부분 매칭 확인 (예: "고현동" vs "고현")
-                    dong_ri_base = orig_dong_ri.replace('동', '').replace('리', '')
-                    if dong_ri_base in search_address:
-                        score += 3  # 부분 매칭에도 높은 가중치
-                        print(f"동/리 부분 매칭: {dong_ri_base} (점수 +3)")
-            
-            # 상세 주소 비교 (건물명, 번지 등)
-            # 원본 주소에서 상세 정보 추출
-            if len(orig_parts) > 3:
-                detail_parts = orig_parts[3:]
-                for detail in detail_parts:
-                    if detail in search_address:
-                        score += 1
-                        print(f"상세 주소 매칭: {detail}")
+            for label, value, points in similarity_breakdown(original_address, search_address):
+                score += points
+                print(f"{label} 매칭: {value} (점수 +{points})")
             
             print(f"최종 유사도 점수: {score}")
             return score
@@ -1067,169 +1085,167 @@ class NaverMapCrawler:
             results = []
             
             for index, row in test_df.iterrows():
+                self.metrics.start_row(row['순번'], row['사업장명'])
+                update_status = None
                 try:
-                    print(f"\n{'='*50}")
-                    total_count = len(test_df)
-                    print(f"처리 중: {index+1}/{total_count} - {row['사업장명']}")
-                    self.logger.info(f"처리 중: {index+1}/{total_count} - {row['사업장명']}")
+                    try:
+                        print(f"\n{'='*50}")
+                        total_count = len(test_df)
+                        print(f"처리 중: {index+1}/{total_count} - {row['사업장명']}")
+                        self.logger.info(f"처리 중: {index+1}/{total_count} - {row['사업장명']}")
                     
-                    # 주소에서 동이름 추출
-                    address = row['소재지전체주소']
-                    if pd.isna(address) or address == '':
-                        print("주소 정보 없음")
-                        results.append({
-                            '순번': row['순번'],
-                            '사업장명': row['사업장명'],
-                            '기존전화번호': row['소재지전화'],
-                            '새전화번호': None,
-                            '업데이트': '주소정보없음'
-                        })
-                        continue
+                        # 주소에서 동이름 추출
+                        address = row['소재지전체주소']
+                        if pd.isna(address) or address == '':
+                            print("주소 정보 없음")
+                            results.append({
+                                '순번': row['순번'],
+                                '사업장명': row['사업장명'],
+                                '기존전화번호': row['소재지전화'],
+                                '새전화번호': None,
+                                '업데이트': '주소정보없음'
+                            })
+                            update_status = '주소정보없음'
+                            continue
                         
-                    # 동이름 추출 (예: "경상남도 거제시 아주동" -> "아주동")
-                    # 또는 "일운면 지세포리" -> "지세포리"
-                    address_parts = address.split()
-                    dong_name = None
-                    for part in address_parts:
-                        if part.endswith('동') or part.endswith('리'):
-                            dong_name = part
-                            break
+                        # 동이름 추출 (예: "경상남도 거제시 아주동" -> "아주동")
+                        # 또는 "일운면 지세포리" -> "지세포리"
+                        dong_name = parse_address(address).dong_ri
                             
-                    if not dong_name:
-                        print("동이름 추출 실패")
-                        results.append({
-                            '순번': row['순번'],
-                            '사업장명': row['사업장명'],
-                            '기존전화번호': row['소재지전화'],
-                            '새전화번호': None,
-                            '업데이트': '동이름추출실패'
-                        })
-                        continue
+                        if not dong_name:
+                            print("동이름 추출 실패")
+                            results.append({
+                                '순번': row['순번'],
+                                '사업장명': row['사업장명'],
+                                '기존전화번호': row['소재지전화'],
+                                '새전화번호': None,
+                                '업데이트': '동이름추출실패'
+                            })
+                            update_status = '동이름추출실패'
+                            continue
                         
-                    print(f"동이름: {dong_name}")
+                        print(f"동이름: {dong_name}")
                     
-                    # 네이버 지도 검색 및 전화번호 추출
-                    new_phone = self.search_and_extract_phone(row['사업장명'], dong_name, original_address=address)
+                        # 네이버 지도 검색 및 전화번호 추출
+                        new_phone = self.search_and_extract_phone(row['사업장명'], dong_name, original_address=address)
                     
-                    # 결과 처리
-                    if new_phone == "MULTIPLE_RESULTS_NO_PHONE":
-                        update_status = "MULTIPLE_RESULTS_NO_PHONE"
-                        new_phone_for_save = None
-                    elif new_phone:
-                        update_status = "true"
-                        new_phone_for_save = new_phone
-                    else:
-                        update_status = "결과없음"
-                        new_phone_for_save = None
+                        # 결과 처리
+                        if new_phone == "MULTIPLE_RESULTS_NO_PHONE":
+                            update_status = "MULTIPLE_RESULTS_NO_PHONE"
+                            new_phone_for_save = None
+                        elif new_phone:
+                            update_status = "true"
+                            new_phone_for_save = new_phone
+                        else:
+                            update_status = "결과없음"
+                            new_phone_for_save = None
                     
-                    # 결과 데이터 생성 (정리된 파일의 컬럼명 사용)
-                    try:
-                        # 정리된 파일의 '기존소재지전화' 컬럼을 '기존_소재지전화'로 저장
-                        original_phone = row['기존소재지전화']
+                        # 결과 데이터 생성 (정리된 파일의 컬럼명 사용)
+                        try:
+                            # 정리된 파일의 '기존소재지전화' 컬럼을 '기존_소재지전화'로 저장
+                            original_phone = row['기존소재지전화']
                         
-                        result_data = {
-                            '순번': row['순번'],
-                            '사업장명': row['사업장명'],
-                            '인허가일자': row['인허가일자'],
-                            '영업상태명': row['영업상태명'],
-                            '기존_소재지전화': original_phone,
-                            '새_소재지전화': new_phone_for_save,
-                            '소재지전체주소': row['소재지전체주소'],
-                            '도로명전체주소': row['도로명전체주소'],
-                            '도로명우편번호': row['도로명우편번호'],
-                            '업태구분명': row['업태구분명'],
-                            '위생업태명': row['위생업태명'],
-                            '업데이트_상태': self.get_update_status(original_phone, new_phone_for_save, update_status),
-                            '주소_유사도_점수': self.get_address_similarity_score(row['소재지전체주소'], new_phone_for_save),
-                            '수집된_주소': self.get_collected_address(new_phone_for_save)
-                        }
-                    except KeyError as e:
-                        print(f"❌ 컬럼명 오류: {e}")
-                        print(f"📊 사용 가능한 컬럼: {list(row.index)}")
-                        raise e
-                    
-                    # 실시간 저장 (1개씩)
-                    if self.save_single_result(result_data):
-                        print(f"✅ 실시간 저장 완료: {row['사업장명']}")
-                    else:
-                        print(f"❌ 실시간 저장 실패: {row['사업장명']}")
+                            result_data = {
+                                '순번': row['순번'],
+                                '사업장명': row['사업장명'],
+                                '인허가일자': row['인허가일자'],
+                                '영업상태명': row['영업상태명'],
+                                '기존_소재지전화': original_phone,
+                                '새_소재지전화': new_phone_for_save,
+                                '소재지전체주소': row['소재지전체주소'],
+                                '도로명전체주소': row['도로명전체주소'],
+                                '도로명우편번호': row['도로명우편번호'],
+                                '업태구분명': row['업태구분명'],
+                                '위생업태명': row['위생업태명'],
+                                '업데이트_상태': self.get_update_status(original_phone, new_phone_for_save, update_status),
+                                '주소_유사도_점수': self.get_address_similarity_score(row['소재지전체주소'], new_phone_for_save),
+                                '수집된_주소': self.get_collected_address(new_phone_for_save)
+                            }
+                        except KeyError as e:
+                            print(f"❌ 컬럼명 오류: {e}")
+                            print(f"📊 사용 가능한 컬럼: {list(row.index)}")
+                            raise e
                     
-                    print(f"결과: {update_status}")
-                    if new_phone:
-                        print(f"새 전화번호: {new_phone}")
+                        # 실시간 저장 (1개씩)
+                        if self.save_single_result(result_data):
+                            print(f"✅ 실시간 저장 완료: {row['사업장명']}")
+                        else:
+                            print(f"❌ 실시간 저장 실패: {row['사업장명']}")
                     
-                    # 네이버 차단 방지를 위한 랜덤 대기 시간
-                    base_wait = 3.0 if platform.system() == "Darwin" else 4.0
-                    random_wait = random.uniform(0.5, 2.0)
-                    wait_time = base_wait + random_wait
-                    print(f"{wait_time:.1f}초 대기 중... (네이버 차단 방지 + 랜덤)")
-                    time.sleep(wait_time)
+                        print(f"결과: {update_status}")
+                        if new_phone:
+                            print(f"새 전화번호: {new_phone}")
                     
-                    # 처리 카운트 증가
-                    self.processed_count += 1
+                        # 처리 카운트 증가
+                        self.processed_count += 1
                     
-                    # 진행 상황 표시 (10개마다)
-                    if self.processed_count % 10 == 0:
-                        print(f"🎯 진행 상황: {self.processed_count}개 처리됨 (실시간 저장)")
+                        # 진행 상황 표시 (10개마다)
+                        if self.processed_count % 10 == 0:
+                            self.csv_writer.checkpoint()
+                            print(f"🎯 진행 상황: {self.processed_count}개 처리됨 (실시간 저장)")
                     
-                    # 로그 파일 새로 생성 (100개마다)
-                    if self.processed_count % 100 == 0:
-                        print(f"\n📝 100개 처리 완료! 새로운 로그 파일 생성 중...")
-                        self.create_new_logging()
-                        print(f"✅ 새로운 로그 파일 생성됨: {self.current_log_filename}")
+                        # 로그 파일 새로 생성 (100개마다)
+                        if self.processed_count % 100 == 0:
+                            print(f"\n📝 100개 처리 완료! 새로운 로그 파일 생성 중...")
+                            self.create_new_logging()
+                            print(f"✅ 새로운 로그 파일 생성됨: {self.current_log_filename}")
                     
-                except Exception as e:
-                    self.logger.error(f"행 처리 중 오류 발생: {e}")
-                    print(f"행 처리 중 오류 발생: {e}")
-                    # 오류 발생 시에도 실시간 저장
-                    try:
-                        # 정리된 파일의 '기존소재지전화' 컬럼을 '기존_소재지전화'로 저장
-                        original_phone = row['기존소재지전화']
+                    except Exception as e:
+                        self.logger.error(f"행 처리 중 오류 발생: {e}")
+                        print(f"행 처리 중 오류 발생: {e}")
+                        update_status = '오류'
+                        # 오류 발생 시에도 실시간 저장
+                        try:
+                            # 정리된 파일의 '기존소재지전화' 컬럼을 '기존_소재지전화'로 저장
+                            original_phone = row['기존소재지전화']
                         
-                        error_data = {
-                            '순번': row['순번'],
-                            '사업장명': row['사업장명'],
-                            '인허가일자': row['인허가일자'],
-                            '영업상태명': row['영업상태명'],
-                            '기존_소재지전화': original_phone,
-                            '새_소재지전화': None,
-                            '소재지전체주소': row['소재지전체주소'],
-                            '도로명전체주소': row['도로명전체주소'],
-                            '도로명우편번호': row['도로명우편번호'],
-                            '업태구분명': row['업태구분명'],
-                            '위생업태명': row['위생업태명'],
-                            '업데이트_상태': f'오류 발생: {str(e)}',
-                            '주소_유사도_점수': 0,
-                            '수집된_주소': ""
-                        }
-                    except KeyError as key_error:
-                        print(f"❌ 오류 데이터 생성 중 컬럼명 오류: {key_error}")
-                        print(f"📊 사용 가능한 컬럼: {list(row.index)}")
-                        # 기본 오류 데이터 생성
-                        error_data = {
-                            '순번': row.get('순번', 0),
-                            '사업장명': row.get('사업장명', '알 수 없음'),
-                            '인허가일자': row.get('인허가일자', ''),
-                            '영업상태명': row.get('영업상태명', ''),
-                            '기존_소재지전화': '',
-                            '새_소재지전화': None,
-                            '소재지전체주소': row.get('소재지전체주소', ''),
-                            '도로명전체주소': row.get('도로명전체주소', ''),
-                            '도로명우편번호': row.get('도로명우편번호', ''),
-                            '업태구분명': row.get('업태구분명', ''),
-                            '위생업태명': row.get('위생업태명', ''),
-                            '업데이트_상태': f'컬럼명 오류: {str(key_error)}',
-                            '주소_유사도_점수': 0,
-                            '수집된_주소': ""
-                        }
+                            error_data = {
+                                '순번': row['순번'],
+                                '사업장명': row['사업장명'],
+                                '인허가일자': row['인허가일자'],
+                                '영업상태명': row['영업상태명'],
+                                '기존_소재지전화': original_phone,
+                                '새_소재지전화': None,
+                                '소재지전체주소': row['소재지전체주소'],
+                                '도로명전체주소': row['도로명전체주소'],
+                                '도로명우편번호': row['도로명우편번호'],
+                                '업태구분명': row['업태구분명'],
+                                '위생업태명': row['위생업태명'],
+                                '업데이트_상태': f'오류 발생: {str(e)}',
+                                '주소_유사도_점수': 0,
+                                '수집된_주소': ""
+                            }
+                        except KeyError as key_error:
+                            print(f"❌ 오류 데이터 생성 중 컬럼명 오류: {key_error}")
+                            print(f"📊 사용 가능한 컬럼: {list(row.index)}")
+                            # 기본 오류 데이터 생성
+                            error_data = {
+                                '순번': row.get('순번', 0),
+                                '사업장명': row.get('사업장명', '알 수 없음'),
+                                '인허가일자': row.get('인허가일자', ''),
+                                '영업상태명': row.get('영업상태명', ''),
+                                '기존_소재지전화': '',
+                                '새_소재지전화': None,
+                                '소재지전체주소': row.get('소재지전체주소', ''),
+                                '도로명전체주소': row.get('도로명전체주소', ''),
+                                '도로명우편번호': row.get('도로명우편번호', ''),
+                                '업태구분명': row.get('업태구분명', ''),
+                                '위생업태명': row.get('위생업태명', ''),
+                                '업데이트_상태': f'컬럼명 오류: {str(key_error)}',
+                                '주소_유사도_점수': 0,
+                                '수집된_주소': ""
+                            }
                     
-                    # 오류 데이터도 실시간 저장
-                    if self.save_single_result(error_data):
-                        print(f"✅ 오류 데이터 실시간 저장 완료: {row['사업장명']}")
-                    else:
-                        print(f"❌ 오류 데이터 저장 실패: {row['사업장명']}")
+                        # 오류 데이터도 실시간 저장
+                        if self.save_single_result(error_data):
+                            print(f"✅ 오류 데이터 실시간 저장 완료: {row['사업장명']}")
+                        else:
+                            print(f"❌ 오류 데이터 저장 실패: {row['사업장명']}")
+                finally:
+                    self.metrics.end_row(update_status)
                     
             # 실시간 저장 완료
+            self.csv_writer.checkpoint()
             self.logger.info(f"전체 처리 완료: 총 {self.processed_count}개 처리됨 (실시간 저장)")
             print(f"🎉 전체 처리 완료: 총 {self.processed_count}개 처리됨")
             print(f"📁 결과 파일: {self.result_file}")
@@ -1266,10 +1282,9 @@ class NaverMapCrawler:
                         print(f"✅ entryIframe에서 a.BfF3H 발견: {len(bf3h_elements)}개")
                         bf3h_elements[0].click()
                         print("a.BfF3H 클릭 완료")
-                        # 네이버 차단 방지를 위한 대기 시간
-                        wait_time = 1.5 if platform.system() == "Darwin" else 2.0
-                        print(f"{wait_time}초 대기 중... (네이버 차단 방지)")
-                        time.sleep(wait_time)  # 대기
+                        # 전화번호 영역이 펼쳐질 때까지 대기
+                        with self.metrics.span('phone_toggle'):
+                            wait_for_css(self.driver, "div._YI7T.kH0zp em", self.wait_config['detail_timeout'], self.wait_config['poll_interval'])
                         
                         # entryIframe 내에서 바로 div._YI7T.kH0zp 찾기 (iframe 전환하지 않음)
                         print("entryIframe 내에서 div._YI7T.kH0zp 안의 em 태그에서 전화번호 찾기...")
@@ -1315,10 +1330,9 @@ class NaverMapCrawler:
                     print(f"✅ searchIframe에서 a.BfF3H 발견: {len(bf3h_elements)}개")
                     bf3h_elements[0].click()
                     print("a.BfF3H 클릭 완료")
-                    # 네이버 차단 방지를 위한 대기 시간
-                    wait_time = 1.5 if platform.system() == "Darwin" else 2.0
-                    print(f"{wait_time}초 대기 중... (네이버 차단 방지)")
-                    time.sleep(wait_time)  # 대기
+                    # 전화번호 영역이 펼쳐질 때까지 대기
+                    with self.metrics.span('phone_toggle'):
+                        wait_for_css(self.driver, "div._YI7T.kH0zp em", self.wait_config['detail_timeout'], self.wait_config['poll_interval'])
                     
                     # searchIframe 내에서 바로 div._YI7T.kH0zp 찾기 (iframe 전환하지 않음)
                     print("searchIframe 내에서 div._YI7T.kH0zp 안의 em 태그에서 전화번호 찾기...")
@@ -1361,10 +1375,9 @@ class NaverMapCrawler:
                     print(f"✅ 메인 페이지에서 a.BfF3H 발견: {len(bf3h_elements)}개")
                     bf3h_elements[0].click()
                     print("a.BfF3H 클릭 완료")
-                    # 네이버 차단 방지를 위한 대기 시간
-                    wait_time = 1.5 if platform.system() == "Darwin" else 2.0
-                    print(f"{wait_time}초 대기 중... (네이버 차단 방지)")
-                    time.sleep(wait_time)  # 대기
+                    # 전화번호 영역이 펼쳐질 때까지 대기
+                    with self.metrics.span('phone_toggle'):
+                        wait_for_css(self.driver, "div._YI7T.kH0zp em", self.wait_config['detail_timeout'], self.wait_config['poll_interval'])
                     
                     # BfF3H 클릭 후 나타나는 div에서 em 태그 찾기
                     print("BfF3H 클릭 후 div._YI7T.kH0zp 안의 em 태그에서 전화번호 찾기...")
@@ -1478,9 +1491,20 @@ class NaverMapCrawler:
             
     def close(self):
         """브라우저 종료"""
-        if self.driver:
-            self.driver.quit()
-            print("브라우저 종료")
+        if self.csv_writer:
+            self.csv_writer.close()
+            self.csv_writer = None
+        if self.metrics:
+            self.metrics.close()
+        if self._driver:
+            if self.attached:
+                # 연결한 Chrome은 닫지 않고 chromedriver만 종료
+                self._driver.service.stop()
+                print("Chrome 연결 종료")
+            else:
+                self._driver.quit()
+                print("브라우저 종료")
+            self._driver = None
 
 # 메인 실행
 if __name__ == "__main__":
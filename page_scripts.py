@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+네이버 지도 페이지 안에서 실행하는 JavaScript 추출 스크립트
+
+결과마다 find_elements / .text 를 반복 호출하면 WebDriver 왕복이 결과 수만큼
+늘어나므로, execute_script 한 번으로 필요한 값을 모두 JSON 으로 받아온다
+"""
+
+import json
+import re
+
+# searchIframe 안에서 검색 결과 후보(이름, 주소, 업종, 링크)를 한 번에 수집
+# arguments[0]: 최대 후보 수 (0이면 전체)
+SEARCH_CANDIDATES_SCRIPT = """
+var items = document.querySelectorAll('li.VLTHu.OW9LQ');
+if (!items.length) {
+    items = document.querySelectorAll('.place_bluelink');
+}
+var limit = arguments[0] || items.length;
+var candidates = [];
+for (var i = 0; i < items.length && i < limit; i++) {
+    var item = items[i];
+    var pick = function (selector) {
+        var el = item.querySelector(selector);
+        return el ? el.innerText.trim() : '';
+    };
+    var link = item.matches('a') ? item : item.querySelector("a.place_bluelink, a[href*='/place/']");
+    candidates.push({
+        index: i,
+        name: pick('span.TYaxT, span.YwYLL, .place_bluelink span') || (item.matches('a') ? item.innerText.trim() : ''),
+        address: pick('span.Pb4bU'),
+        category: pick('span.KCMnt, span.YzBgS'),
+        href: link ? (link.href || '') : ''
+    });
+}
+return JSON.stringify(candidates);
+"""
+
+# entryIframe 안에서 상세 페이지의 업체명 / 업종 / 주소를 한 번에 수집
+PLACE_SUMMARY_SCRIPT = """
+var pick = function (selector) {
+    var el = document.querySelector(selector);
+    return el ? el.innerText.trim() : '';
+};
+return JSON.stringify({
+    name: pick('span.GHAhO'),
+    category: pick('span.lnJFt'),
+    address: pick('span.LDgIH')
+});
+"""
+
+PLACE_ID_PATTERN = re.compile(r'/place/(\d+)')
+
+
+def extract_place_id(url):
+    """URL에서 네이버 place id 추출"""
+    match = PLACE_ID_PATTERN.search(url or '')
+    return match.group(1) if match else None
+
+
+def collect_search_candidates(driver, limit=0):
+    """현재 프레임(searchIframe)에서 검색 결과 후보 목록 수집"""
+    candidates = json.loads(driver.execute_script(SEARCH_CANDIDATES_SCRIPT, limit) or '[]')
+    for candidate in candidates:
+        candidate['place_id'] = extract_place_id(candidate.get('href'))
+    return candidates
+
+
+def collect_place_summary(driver):
+    """현재 프레임(entryIframe)에서 업체명 / 업종 / 주소 수집"""
+    return json.loads(driver.execute_script(PLACE_SUMMARY_SCRIPT) or '{}')
+
+# ----- DevTools 비동기 크롤링(cdp_engine.py)용: WebDriver find_elements 대신 한 번에 실행 -----
+
+# searchIframe 안의 검색 결과 개수 (_get_search_result_count 와 같은 순서로 확인)
+RESULT_COUNT_SCRIPT = """
+var items = document.querySelectorAll('li.VLTHu.OW9LQ');
+if (!items.length) {
+    items = document.querySelectorAll('.place_bluelink');
+}
+if (items.length) {
+    return items.length;
+}
+var text = document.body ? document.body.innerText : '';
+if (text.indexOf('검색 결과가 없습니다') !== -1 || text.indexOf('결과가 없습니다') !== -1) {
+    return 0;
+}
+var links = document.querySelectorAll("a[href*='place.naver.com']");
+return links.length;
+"""
+
+# searchIframe 안에서 N번째 결과 링크 클릭
+# arguments[0]: 결과 순번, arguments[1]: 순서대로 시도할 CSS 선택자 목록 (클릭한 링크 텍스트 반환)
+CLICK_RESULT_SCRIPT = """
+var selectors = arguments[1];
+for (var i = 0; i < selectors.length; i++) {
+    var links = document.querySelectorAll(selectors[i]);
+    if (links.length) {
+        var link = links[arguments[0]];
+        if (!link) {
+            return null;
+        }
+        link.click();
+        return link.innerText.trim();
+    }
+}
+return null;
+"""
+
+# 단일 결과의 주소 (_extract_single_result_address 와 같은 선택자 순서)
+SINGLE_ADDRESS_SCRIPT = """
+var selectors = ['span.Pb4bU', "span[class*='address']", "div[class*='address']", "span[class*='location']"];
+for (var i = 0; i < selectors.length; i++) {
+    var el = document.querySelector(selectors[i]);
+    var text = el ? el.innerText.trim() : '';
+    if (text && text.length > 5) {
+        return text;
+    }
+}
+return null;
+"""
+
+# tel: 링크의 전화번호
+TEL_LINK_SCRIPT = """
+var link = document.querySelector("a[href*='tel:']");
+return link ? link.getAttribute('href').replace('tel:', '').trim() : null;
+"""
+
+# a.BfF3H(전화번호 보기) 클릭 (있으면 true)
+PHONE_TOGGLE_SCRIPT = """
+var toggle = document.querySelector('a.BfF3H');
+if (!toggle) {
+    return false;
+}
+toggle.click();
+return true;
+"""
+
+# 펼쳐진 전화번호 영역 / span.xlx7Q 에서 전화번호 형식의 텍스트
+# arguments[0]: CSS 선택자
+PHONE_TEXT_SCRIPT = """
+var elements = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < elements.length; i++) {
+    var text = elements[i].innerText.trim();
+    if (text && text.length > 8 && text.indexOf('-') !== -1) {
+        return text;
+    }
+}
+return null;
+"""
+
+# 현재 프레임에 CSS 선택자 요소가 있는지 확인 (arguments[0]: CSS 선택자)
+HAS_ELEMENT_SCRIPT = "return !!document.querySelector(arguments[0]);"
+
+# iframe 요소의 src (arguments[0]: iframe id)
+FRAME_SRC_SCRIPT = """
+var frame = document.getElementById(arguments[0]);
+return frame ? frame.getAttribute('src') : null;
+"""
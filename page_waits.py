@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+네이버 지도 페이지 대기 유틸리티
+
+고정 time.sleep 대신 필요한 요소가 나타나는 즉시 반환하는 대기 함수
+(페이지 이동 간 간격은 rate_limiter.py 에서 관리)
+"""
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# 검색 페이지 상태
+SEARCH_RESULTS = 'results'        # searchIframe에 결과 리스트가 표시됨
+SEARCH_NO_RESULTS = 'no_results'  # "검색 결과가 없습니다" 표시됨
+SEARCH_ENTRY = 'entry'            # 결과 리스트 없이 entryIframe(상세)이 바로 열림
+SEARCH_TIMEOUT = 'timeout'        # 제한 시간 안에 아무 상태도 확인되지 않음
+SEARCH_BLOCKED = 'blocked'        # 보안 확인(캡차) / 접근 제한 페이지가 표시됨
+PLACE_NOT_FOUND = 'place_not_found'  # place id 상세 페이지가 없는 장소 / 삭제된 장소로 표시됨
+
+# searchIframe 안에서 결과 리스트 / 결과 없음 여부를 한 번에 확인
+SEARCH_STATE_SCRIPT = """
+if (document.querySelector('li.VLTHu.OW9LQ, .place_bluelink')) {
+    return 'results';
+}
+var text = document.body ? document.body.innerText : '';
+if (text.indexOf('검색 결과가 없습니다') !== -1 || text.indexOf('결과가 없습니다') !== -1) {
+    return 'no_results';
+}
+return null;
+"""
+
+# 검색 iframe 대신 보안 확인 / 접근 제한 페이지가 표시되었는지 확인
+BLOCKED_PAGE_SCRIPT = """
+if (document.querySelector('#captcha, .captcha_wrap, iframe[src*="captcha"]')) {
+    return true;
+}
+var text = document.body ? document.body.innerText : '';
+var keywords = ['자동입력 방지', '보안 확인', '비정상적인 접근', '일시적으로 제한', '서비스 이용이 제한', 'Too Many Requests'];
+for (var i = 0; i < keywords.length; i++) {
+    if (text.indexOf(keywords[i]) !== -1) {
+        return true;
+    }
+}
+return false;
+"""
+
+# 없는 장소 / 삭제된 장소 안내가 표시되었는지 확인 (메인 문서 / entryIframe 어디서나 실행)
+PLACE_NOT_FOUND_SCRIPT = """
+var text = document.body ? document.body.innerText : '';
+var keywords = ['존재하지 않는 장소', '장소를 찾을 수 없', '페이지를 찾을 수 없', '삭제된 장소', '정보를 찾을 수 없'];
+for (var i = 0; i < keywords.length; i++) {
+    if (text.indexOf(keywords[i]) !== -1) {
+        return true;
+    }
+}
+return false;
+"""
+
+# entryIframe 안에서 상세 정보가 그려졌는지 확인
+ENTRY_READY_SCRIPT = """
+if (document.readyState !== 'complete') {
+    return false;
+}
+return !!document.querySelector("a.BfF3H, span.xlx7Q, a[href^='tel:'], span.LDgIH, a.PkgBl");
+"""
+
+
+def _search_state(driver):
+    """현재 검색 페이지 상태 확인 (아직 준비되지 않았으면 False)"""
+    driver.switch_to.default_content()
+
+    search_iframes = driver.find_elements(By.ID, "searchIframe")
+    if search_iframes:
+        driver.switch_to.frame(search_iframes[0])
+        try:
+            state = driver.execute_script(SEARCH_STATE_SCRIPT)
+        finally:
+            driver.switch_to.default_content()
+        if state:
+            return state
+
+    if driver.find_elements(By.ID, "entryIframe"):
+        return SEARCH_ENTRY
+
+    if not search_iframes and driver.execute_script(BLOCKED_PAGE_SCRIPT):
+        return SEARCH_BLOCKED
+
+    return False
+
+
+def wait_for_search_ready(driver, timeout=10, poll_interval=0.2):
+    """검색 결과 리스트, 결과 없음 표시, entryIframe 중 하나가 나타날 때까지 대기"""
+    try:
+        return WebDriverWait(
+            driver, timeout, poll_frequency=poll_interval,
+            ignored_exceptions=(WebDriverException,)
+        ).until(_search_state)
+    except TimeoutException:
+        driver.switch_to.default_content()
+        return SEARCH_TIMEOUT
+
+
+def _place_state(driver):
+    """place id 상세 페이지 상태 확인 (아직 준비되지 않았으면 False)"""
+    driver.switch_to.default_content()
+
+    entry_iframes = driver.find_elements(By.ID, "entryIframe")
+    if entry_iframes:
+        driver.switch_to.frame(entry_iframes[0])
+        try:
+            not_found = driver.execute_script(PLACE_NOT_FOUND_SCRIPT)
+        finally:
+            driver.switch_to.default_content()
+        return PLACE_NOT_FOUND if not_found else SEARCH_ENTRY
+
+    if driver.execute_script(PLACE_NOT_FOUND_SCRIPT):
+        return PLACE_NOT_FOUND
+
+    if driver.execute_script(BLOCKED_PAGE_SCRIPT):
+        return SEARCH_BLOCKED
+
+    return False
+
+
+def wait_for_place_ready(driver, timeout=5, poll_interval=0.2):
+    """place id 상세 페이지에서 entryIframe, 없는 장소 안내, 접근 제한 중 하나가 나타날 때까지 대기"""
+    try:
+        return WebDriverWait(
+            driver, timeout, poll_frequency=poll_interval,
+            ignored_exceptions=(WebDriverException,)
+        ).until(_place_state)
+    except TimeoutException:
+        driver.switch_to.default_content()
+        return SEARCH_TIMEOUT
+
+
+def wait_for_entry_ready(driver, timeout=5, poll_interval=0.2):
+    """결과 클릭 후 entryIframe 상세 정보가 로딩될 때까지 대기 (메인 페이지 상태로 반환)"""
+    def _entry_ready(d):
+        d.switch_to.default_content()
+        entry_iframes = d.find_elements(By.ID, "entryIframe")
+        if not entry_iframes:
+            return False
+        d.switch_to.frame(entry_iframes[0])
+        try:
+            return d.execute_script(ENTRY_READY_SCRIPT)
+        finally:
+            d.switch_to.default_content()
+
+    try:
+        return WebDriverWait(
+            driver, timeout, poll_frequency=poll_interval,
+            ignored_exceptions=(WebDriverException,)
+        ).until(_entry_ready)
+    except TimeoutException:
+        driver.switch_to.default_content()
+        return False
+
+
+def wait_for_css(driver, css_selector, timeout=5, poll_interval=0.2):
+    """현재 프레임에서 CSS 선택자 요소가 나타날 때까지 대기"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll_interval).until(
+            lambda d: d.find_elements(By.CSS_SELECTOR, css_selector)
+        )
+    except TimeoutException:
+        return []
+
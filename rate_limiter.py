@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+네이버 지도 요청 속도 조절기 (토큰 버킷 + AIMD)
+
+검색 페이지 이동 직전에 acquire()로 토큰을 받고, 페이지 상태를 record()로 알려주면
+정상 응답이 이어지는 동안 조금씩 속도를 올리고(additive increase) 접근 제한 페이지,
+시간 초과, 연속된 "결과 없음"이 보이면 속도를 크게 낮춘다(multiplicative decrease).
+한 프로세스의 모든 크롤러 / 병렬 워커가 get_rate_limiter()로 같은 조절기를 공유한다.
+"""
+
+import random
+import threading
+import time
+
+from config import RATE_LIMIT_CONFIG
+from page_waits import SEARCH_RESULTS, SEARCH_ENTRY, SEARCH_NO_RESULTS, SEARCH_TIMEOUT, SEARCH_BLOCKED
+
+# 응답 분류
+OUTCOME_OK = 'ok'              # 결과 리스트 / 상세 페이지 정상 표시
+OUTCOME_EMPTY = 'empty'        # 검색 결과 없음 (연속되면 차단 의심)
+OUTCOME_TIMEOUT = 'timeout'    # 제한 시간 안에 페이지 상태 확인 실패
+OUTCOME_BLOCKED = 'blocked'    # 보안 확인 / 접근 제한 페이지
+
+SEARCH_STATE_OUTCOMES = {
+    SEARCH_RESULTS: OUTCOME_OK,
+    SEARCH_ENTRY: OUTCOME_OK,
+    SEARCH_NO_RESULTS: OUTCOME_EMPTY,
+    SEARCH_TIMEOUT: OUTCOME_TIMEOUT,
+    SEARCH_BLOCKED: OUTCOME_BLOCKED
+}
+
+
+class SearchBlockedError(Exception):
+    """네이버 지도에서 접근 제한 / 보안 확인 페이지가 표시됨"""
+
+
+class AdaptiveRateLimiter:
+    """초당 요청 수를 응답 상태에 따라 조절하는 토큰 버킷 (스레드 간 공유)"""
+
+    def __init__(self, initial_rate=0.25, min_rate=0.1, max_rate=0.5, burst=1,
+                 increase_step=0.01, decrease_factor=0.5, jitter=0.3,
+                 empty_storm=5, block_cooldown=60, enabled=True):
+        self.enabled = enabled
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.jitter = jitter
+        self.empty_storm = empty_storm
+        self.block_cooldown = block_cooldown
+
+        self.lock = threading.Lock()
+        self.tokens = burst
+        self.last_refill = time.monotonic()
+        self.cooldown_until = 0
+        self.consecutive_empty = 0
+        self.counts = {OUTCOME_OK: 0, OUTCOME_EMPTY: 0, OUTCOME_TIMEOUT: 0, OUTCOME_BLOCKED: 0}
+
+    @classmethod
+    def from_config(cls, config):
+        """RATE_LIMIT_CONFIG 설정으로 생성"""
+        return cls(
+            initial_rate=config.get('initial_rate', 0.25),
+            min_rate=config.get('min_rate', 0.1),
+            max_rate=config.get('max_rate', 0.5),
+            burst=config.get('burst', 1),
+            increase_step=config.get('increase_step', 0.01),
+            decrease_factor=config.get('decrease_factor', 0.5),
+            jitter=config.get('jitter', 0.3),
+            empty_storm=config.get('empty_storm', 5),
+            block_cooldown=config.get('block_cooldown', 60),
+            enabled=config.get('enabled', True)
+        )
+
+    def _refill(self, now):
+        """마지막 확인 이후 지난 시간만큼 토큰 채우기 (최대 burst개)"""
+        self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def acquire(self):
+        """토큰 1개를 예약하고 사용할 수 있을 때까지 대기 (대기한 초 반환)"""
+        if not self.enabled:
+            return 0
+
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0
+            if delay > 0 and self.jitter:
+                # 일정한 간격으로 보이지 않도록 간격의 일부만큼 랜덤 추가
+                delay += random.uniform(0, self.jitter / self.rate)
+            # 차단 후 대기 중이면 대기가 끝난 뒤부터 예약 순서대로 간격 유지
+            delay += max(self.cooldown_until - now, 0)
+
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def record(self, outcome):
+        """응답 상태 반영 (정상: 속도 증가 / 차단·시간 초과·연속 결과 없음: 속도 감소)"""
+        if not self.enabled:
+            return
+
+        with self.lock:
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+
+            if outcome == OUTCOME_OK:
+                self.consecutive_empty = 0
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+            elif outcome == OUTCOME_EMPTY:
+                # 결과 없음은 정상일 수도 있으므로 연속될 때만 차단으로 판단
+                self.consecutive_empty += 1
+                if self.consecutive_empty >= self.empty_storm:
+                    self.consecutive_empty = 0
+                    self._back_off(f"검색 결과 없음 {self.empty_storm}회 연속")
+            elif outcome == OUTCOME_TIMEOUT:
+                self._back_off("검색 페이지 시간 초과")
+            elif outcome == OUTCOME_BLOCKED:
+                self._back_off("접근 제한 페이지 감지")
+                self.tokens = 0
+                self.cooldown_until = time.monotonic() + self.block_cooldown
+                print(f"⛔ {self.block_cooldown}초 동안 검색 중지")
+
+    def record_search_state(self, state):
+        """wait_for_search_ready() 결과로 응답 상태 반영"""
+        outcome = SEARCH_STATE_OUTCOMES.get(state, OUTCOME_TIMEOUT)
+        self.record(outcome)
+        return outcome
+
+    def _back_off(self, reason):
+        """속도를 decrease_factor 배로 낮춤 (lock 안에서 호출)"""
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        print(f"🐢 요청 속도 감소 ({reason}): {1 / self.rate:.1f}초에 1번")
+
+    def status(self):
+        """현재 요청 간격과 응답 상태별 횟수"""
+        with self.lock:
+            return {
+                'interval_seconds': round(1 / self.rate, 2),
+                'counts': dict(self.counts)
+            }
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter(config=None):
+    """프로세스 전체가 공유하는 속도 조절기 (처음 호출할 때 RATE_LIMIT_CONFIG로 생성)"""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = AdaptiveRateLimiter.from_config(config or RATE_LIMIT_CONFIG)
+        return _shared_limiter
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+주소 지역 판별 (시도 → 시군구 → 읍면동)
+
+data/regions.json 의 지역 이름을 긴 이름부터 하나의 정규식(alternation)으로 컴파일해
+주소를 한 번 훑어서 시도 / 시군구 / 읍면동을 찾고, REGION_CONFIG['targets'] 에 지정한
+지역(예: '울산광역시 동구', '경상남도')에 속하는지 판별한다.
+'동구'처럼 여러 시도에 있는 이름은 같은 주소의 시도 / 읍면동으로 어느 지역인지 결정한다.
+"""
+
+import json
+import os
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from config import REGION_CONFIG
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SIDO = 'sido'
+SIGUNGU = 'sigungu'
+DONG = 'dong'
+
+# 주소에서 찾은 지역 (찾지 못한 단계는 None)
+RegionMatch = namedtuple('RegionMatch', ['sido', 'sigungu', 'dong'])
+
+# 이름 앞뒤가 다른 한글로 이어지면 다른 지명의 일부로 봄 (예: '남동구' 안의 '동구')
+NAME_PATTERN = r'(?<![가-힣0-9])(?:{names})(?![가-힣])'
+DONG_NUMBER = re.compile(r'\d+(?=동$)')
+
+
+def _name_pattern(name, level):
+    """지역 이름 정규식 (행정동 번호 허용: '전하동' → '전하1동', '전하2동')"""
+    if level == DONG and name.endswith('동') and len(name) > 2:
+        return re.escape(name[:-1]) + r'\d*동'
+    return re.escape(name)
+
+
+class RegionIndex:
+    """지역 이름 색인 + 대상 지역 판별기"""
+
+    def __init__(self, regions, targets=()):
+        self.entries = {}   # 이름 → [(단계, 시도, 시군구, 읍면동), ...]
+        patterns = {}
+
+        for sido, sido_info in regions.get('sido', {}).items():
+            for name in [sido] + sido_info.get('aliases', []):
+                self._add(name, (SIDO, sido, None, None), patterns)
+            for sigungu, sigungu_info in (sido_info.get('sigungu') or {}).items():
+                for name in [sigungu] + sigungu_info.get('aliases', []):
+                    self._add(name, (SIGUNGU, sido, sigungu, None), patterns)
+                for dong in sigungu_info.get('dong', []):
+                    self._add(dong, (DONG, sido, sigungu, dong), patterns)
+
+        # 긴 이름이 먼저 매칭되도록 정렬해서 하나의 정규식으로 컴파일
+        names = sorted(patterns, key=len, reverse=True)
+        self.pattern = re.compile(NAME_PATTERN.format(names='|'.join(patterns[name] for name in names)))
+        self.targets = [self._parse_target(target) for target in targets]
+
+    def _add(self, name, entry, patterns):
+        self.entries.setdefault(name, []).append(entry)
+        patterns.setdefault(name, _name_pattern(name, entry[0]))
+
+    def _parse_target(self, target):
+        """'울산광역시 동구' 같은 대상 지역 문자열을 RegionMatch로 변환"""
+        match = self.classify(target)
+        if match.sido is None:
+            raise ValueError(f"지역 목록에 없는 대상 지역입니다: {target}")
+        return match
+
+    @classmethod
+    def load(cls, data_file, targets=()):
+        """지역 데이터 파일 읽어서 생성"""
+        with open(data_file, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), targets)
+
+    def classify(self, address):
+        """주소에서 시도 / 시군구 / 읍면동 찾기"""
+        if not isinstance(address, str) or not address:
+            return RegionMatch(None, None, None)
+
+        found = {SIDO: [], SIGUNGU: [], DONG: []}
+        for match in self.pattern.finditer(address):
+            name = match.group(0)
+            for entry in self.entries.get(name) or self.entries.get(DONG_NUMBER.sub('', name), []):
+                found[entry[0]].append(entry)
+
+        sido = found[SIDO][0][1] if found[SIDO] else None
+        sigungus = [e for e in found[SIGUNGU] if sido is None or e[1] == sido]
+        sigungu_keys = {(e[1], e[2]) for e in sigungus}
+        dongs = [e for e in found[DONG]
+                 if (sido is None or e[1] == sido) and (not sigungu_keys or (e[1], e[2]) in sigungu_keys)]
+
+        if dongs:
+            _, dong_sido, sigungu, dong = dongs[0]
+            return RegionMatch(sido or dong_sido, sigungu, dong)
+        if len(sigungu_keys) == 1:
+            # 시도가 없어도 시군구 이름이 한 곳뿐이면 그 시도로 판단
+            sigungu_sido, sigungu = next(iter(sigungu_keys))
+            return RegionMatch(sido or sigungu_sido, sigungu, None)
+        if sido and sigungus:
+            return RegionMatch(sido, sigungus[0][2], None)
+        return RegionMatch(sido, None, None)
+
+    def matches(self, address):
+        """주소가 대상 지역 중 하나에 속하는지 확인"""
+        return self.is_target(self.classify(address))
+
+    def is_target(self, region):
+        """classify() 결과가 대상 지역 중 하나에 속하는지 확인"""
+        if region.sido is None:
+            return False
+        for target in self.targets:
+            if (target.sido == region.sido
+                    and (target.sigungu is None or target.sigungu == region.sigungu)
+                    and (target.dong is None or target.dong == region.dong)):
+                return True
+        return False
+
+    def describe_targets(self):
+        """대상 지역 이름 (출력용)"""
+        return ', '.join(' '.join(part for part in target if part) for target in self.targets)
+
+
+@lru_cache(maxsize=None)
+def _load_region_index(data_file, targets):
+    return RegionIndex.load(data_file, targets)
+
+
+def get_region_index(config=None):
+    """REGION_CONFIG 기준 지역 판별기 (파일은 처음 한 번만 읽음)"""
+    config = config or REGION_CONFIG
+    # 상대 경로는 작업 폴더가 아니라 이 파일 위치 기준 (벤치마크처럼 작업 폴더를 바꿔도 동작)
+    data_file = os.path.join(BASE_DIR, config['data_file'])
+    return _load_region_index(data_file, tuple(config['targets']))
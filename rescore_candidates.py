@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+저장된 검색 후보 오프라인 재채점 (브라우저 / 재크롤링 불필요)
+
+크롤링 중 search_candidates.jsonl 에 기록된 다중 결과 후보 중 지정한 결과 파일을 만든 실행의 기록만 읽어서
+대상 지역 판별 + 주소 유사도 점수로 후보 선택을 다시 계산하고, 결과 CSV에
+새 점수 / 선택 변경 여부를 반영한 새 결과 파일을 만듭니다.
+
+행마다 크롤링이 멈춘 검색 단계(마지막으로 기록된 단계)의 후보만 다시 비교합니다.
+선택된 후보가 바뀐 행은 그 업체의 전화번호를 모르므로 새전화번호를 비우고 재검색 대상으로 표시합니다.
+
+사용 예:
+    python rescore_candidates.py flexible_crawling_250829112327.csv
+    python rescore_candidates.py 결과.csv --weight dong_ri=7 --weight detail=2
+"""
+
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from address_parser import SIMILARITY_WEIGHTS, address_similarity
+from candidate_store import load_candidate_frame
+from config import CANDIDATE_CONFIG
+from region_index import get_region_index
+from result_store import read_results
+
+RESCORE_SAME = '동일'
+RESCORE_CHANGED = '선택변경'
+RESCORE_NO_CANDIDATE = '후보없음'
+
+
+def parse_weights(values):
+    """--weight 항목=점수 목록을 SIMILARITY_WEIGHTS 에 덮어쓴 점수표로 변환"""
+    weights = dict(SIMILARITY_WEIGHTS)
+    for value in values or []:
+        key, _, points = value.partition('=')
+        if key not in weights or not points:
+            raise ValueError(f"알 수 없는 점수 항목입니다: {value} (사용 가능: {', '.join(weights)})")
+        weights[key] = float(points) if '.' in points else int(points)
+    return weights
+
+
+def rescore_candidates(candidates, weights=None, region_index=None):
+    """후보 DataFrame(load_candidate_frame)에서 행별 최적 후보 다시 선택
+
+    반환 컬럼: row, candidate_index, candidate_name, candidate_address, candidate_place_id,
+    score, chosen_index, rescore (동일 / 선택변경)
+    """
+    region_index = region_index or get_region_index()
+
+    # 크롤링이 멈춘 단계(행별 마지막 기록 단계)의 주소가 있는 후보만 비교
+    last_stage = candidates.groupby('row')['stage_order'].transform('max')
+    frame = candidates[(candidates['stage_order'] == last_stage)
+                       & candidates['candidate_address'].notna()
+                       & (candidates['candidate_address'] != '')].copy()
+
+    # 대상 지역 여부와 유사도 점수는 서로 다른 주소 / 주소 쌍마다 한 번만 계산
+    addresses = frame['candidate_address'].unique()
+    in_target = pd.Series([region_index.matches(address) for address in addresses], index=addresses)
+    frame = frame[frame['candidate_address'].map(in_target).astype(bool)]
+
+    pairs = frame[['address', 'candidate_address']].drop_duplicates()
+    pairs['score'] = [address_similarity(original, address, weights)
+                      for original, address in zip(pairs['address'], pairs['candidate_address'])]
+    frame = frame.merge(pairs, on=['address', 'candidate_address'], how='left')
+
+    # 점수가 같으면 앞 순위 후보 선택 (크롤링 중 선택 규칙과 같음)
+    frame = frame.sort_values(['row', 'score', 'candidate_index'], ascending=[True, False, True])
+    best = frame.drop_duplicates('row', keep='first')
+
+    same = best['candidate_index'] == pd.to_numeric(best['chosen_index'], errors='coerce')
+    best = best.assign(rescore=same.map({True: RESCORE_SAME, False: RESCORE_CHANGED}))
+    return best[['row', 'candidate_index', 'candidate_name', 'candidate_address', 'candidate_place_id',
+                 'score', 'chosen_index', 'rescore']].reset_index(drop=True)
+
+
+def apply_rescore(results, best):
+    """결과 DataFrame에 재채점 결과 반영 (선택이 바뀐 행은 새전화번호를 비우고 재검색 대상으로 표시)"""
+    results = results.copy()
+    best = best.set_index('row')
+    rows = pd.to_numeric(results['인덱스'], errors='coerce')
+
+    rescore = rows.map(best['rescore']).fillna(RESCORE_NO_CANDIDATE)
+    score = rows.map(best['score']).map(lambda value: f"{value:g}", na_action='ignore')
+    changed = rescore == RESCORE_CHANGED
+
+    results['주소유사도점수'] = score.where(score.notna(), results['주소유사도점수'])
+    results.loc[changed, '수집된주소'] = rows[changed].map(best['candidate_address'])
+    results.loc[changed, '새전화번호'] = None
+    results.loc[changed, '업데이트상태'] = '재채점 후 다른 후보 선택 (재검색 필요)'
+    results['재채점결과'] = rescore
+    return results
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='저장된 검색 후보 오프라인 재채점')
+    parser.add_argument('results', help='크롤링 결과 CSV 파일')
+    parser.add_argument('--candidates', default=CANDIDATE_CONFIG['records_file'], help='검색 후보 기록 파일 (JSONL)')
+    parser.add_argument('--weight', action='append', metavar='항목=점수',
+                        help=f"유사도 점수 변경 (항목: {', '.join(SIMILARITY_WEIGHTS)})")
+    parser.add_argument('--output', help='새 결과 파일 (기본: <결과파일>_재채점.csv)')
+    args = parser.parse_args()
+
+    weights = parse_weights(args.weight)
+    output_file = args.output or f"{os.path.splitext(args.results)[0]}_재채점.csv"
+
+    start = time.perf_counter()
+    # 다른 대상 CSV / 구간 실행의 같은 행 번호 기록이 섞이지 않도록 결과 파일 기준으로 읽음
+    candidates = load_candidate_frame(args.candidates, result_file=args.results)
+    print(f"📁 후보 기록: {args.candidates} ({candidates['row'].nunique()}개 행, {candidates['candidate_address'].notna().sum()}개 후보)")
+    if candidates.empty:
+        print(f"⚠️ {os.path.basename(args.results)} 실행의 후보 기록이 없습니다 (결과 파일 이름이 기록되기 전의 후보는 사용하지 않음)")
+
+    best = rescore_candidates(candidates, weights)
+    results = read_results(args.results, dtype=str)
+    rescored = apply_rescore(results, best)
+    rescored.to_csv(output_file, index=False, encoding='utf-8-sig')
+    elapsed = time.perf_counter() - start
+
+    counts = rescored['재채점결과'].value_counts()
+    print(f"⚖️ 점수표: {weights}")
+    print(f"✅ 선택 동일: {counts.get(RESCORE_SAME, 0)}개, 🔁 선택 변경(재검색 필요): {counts.get(RESCORE_CHANGED, 0)}개, "
+          f"후보 없음: {counts.get(RESCORE_NO_CANDIDATE, 0)}개")
+    print(f"💾 재채점 결과 저장: {output_file} ({elapsed:.2f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+결과 저장 SQLite 백엔드 (OUTPUT_CONFIG['backend'] = 'sqlite')
+
+ResultWriter(CSV)와 같은 인터페이스로 결과 행을 인덱스 기준 upsert 하므로, 재시작 때
+처리 중이던 행을 다시 저장해도 중복 행이 생기지 않는다. 상태 / 동 / 새전화번호 컬럼에
+인덱스를 만들어 두어 분석 쿼리를 결과 파일 전체를 읽지 않고 실행할 수 있다.
+
+사용 예:
+    python result_store.py summary flexible_crawling_250829112327.sqlite3
+    python result_store.py export flexible_crawling_250829112327.sqlite3 --output 결과.csv
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+
+import pandas as pd
+
+from address_parser import parse_address
+
+RESULT_TABLE = 'results'
+SCHEMA_TABLE = 'result_schema'
+DONG_COLUMN = '동'
+STORE_EXTENSIONS = ('.sqlite3', '.sqlite', '.db')
+
+
+def is_result_store(path):
+    """SQLite 결과 파일인지 확인 (확장자 기준)"""
+    return str(path).lower().endswith(STORE_EXTENSIONS)
+
+
+def _quote(name):
+    """SQL 식별자 (한글 컬럼명 / 공백 포함)"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _value(value):
+    """SQLite에 저장할 값 (NaN / numpy 값 처리)"""
+    if value is None:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+class ResultStore:
+    """인덱스 기준 upsert 결과 저장소 (ResultWriter와 같은 write / flush / checkpoint / close)"""
+
+    def __init__(self, path, columns, append=False, flush_rows=10, flush_seconds=5.0, fsync_on_checkpoint=True,
+                 key_column='인덱스', address_column='기존주소', indexed_columns=('업데이트상태', '새전화번호')):
+        self.path = path
+        self.columns = list(columns)
+        self.key_column = key_column
+        self.address_column = address_column if address_column in self.columns else None
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.fsync_on_checkpoint = fsync_on_checkpoint
+
+        if key_column not in self.columns:
+            raise ValueError(f"결과 컬럼에 키 컬럼 '{key_column}'이 없습니다.")
+
+        # 병렬 워커는 생성한 스레드와 사용하는 스레드가 다르므로 check_same_thread 해제
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        if append and self._stored_columns() is not None:
+            # 기존 파일과 컬럼이 다르면 다른 실행의 결과이므로 이어서 저장하지 않음
+            if self._stored_columns() != self.columns:
+                raise ValueError(f"결과 파일 컬럼이 일치하지 않습니다: {path} ({self._stored_columns()} != {self.columns})")
+        else:
+            self._create_tables(indexed_columns)
+
+        self.stored_columns = self.columns + ([DONG_COLUMN] if self.address_column else [])
+        placeholders = ', '.join('?' for _ in self.stored_columns)
+        updates = ', '.join(f"{_quote(column)} = excluded.{_quote(column)}"
+                            for column in self.stored_columns + ['updated_at'] if column != key_column)
+        self.upsert_sql = (
+            f"INSERT INTO {RESULT_TABLE} ({', '.join(_quote(c) for c in self.stored_columns)}, updated_at) "
+            f"VALUES ({placeholders}, ?) ON CONFLICT({_quote(key_column)}) DO UPDATE SET {updates}"
+        )
+
+        self.pending_rows = 0
+        self.last_flush = time.monotonic()
+
+    def _stored_columns(self):
+        """기존 결과 파일의 출력 컬럼 (테이블이 없으면 None)"""
+        try:
+            row = self.conn.execute(f"SELECT columns FROM {SCHEMA_TABLE}").fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0].split('\t') if row else None
+
+    def _create_tables(self, indexed_columns):
+        """결과 테이블과 조회용 인덱스 새로 생성 (같은 파일이 있으면 비움)"""
+        column_defs = []
+        for column in self.columns:
+            if column == self.key_column:
+                column_defs.append(f"{_quote(column)} INTEGER PRIMARY KEY")
+            else:
+                column_defs.append(f"{_quote(column)}")
+        if self.address_column:
+            column_defs.append(f"{_quote(DONG_COLUMN)} TEXT")
+        column_defs.append("updated_at REAL NOT NULL")
+
+        with self.conn:
+            self.conn.execute(f"DROP TABLE IF EXISTS {RESULT_TABLE}")
+            self.conn.execute(f"DROP TABLE IF EXISTS {SCHEMA_TABLE}")
+            self.conn.execute(f"CREATE TABLE {RESULT_TABLE} ({', '.join(column_defs)})")
+            self.conn.execute(f"CREATE TABLE {SCHEMA_TABLE} (columns TEXT NOT NULL, key_column TEXT NOT NULL)")
+            self.conn.execute(f"INSERT INTO {SCHEMA_TABLE} VALUES (?, ?)", ('\t'.join(self.columns), self.key_column))
+
+            # 상태 / 동 / 전화번호별 조회용 인덱스
+            for number, column in enumerate([c for c in indexed_columns if c in self.columns]
+                                            + ([DONG_COLUMN] if self.address_column else [])):
+                self.conn.execute(f"CREATE INDEX idx_{RESULT_TABLE}_{number} ON {RESULT_TABLE} ({_quote(column)})")
+
+    def write(self, result):
+        """결과 1행 upsert (같은 인덱스가 있으면 덮어씀, 스키마에 없는 키는 무시)"""
+        values = [_value(result.get(column)) for column in self.columns]
+        if self.address_column:
+            values.append(parse_address(result.get(self.address_column)).dong_ri)
+        values.append(time.time())
+        self.conn.execute(self.upsert_sql, values)
+        self.pending_rows += 1
+
+        if (self.pending_rows >= self.flush_rows
+                or time.monotonic() - self.last_flush >= self.flush_seconds):
+            self.flush()
+
+    def flush(self):
+        """지금까지 upsert 한 행 커밋"""
+        self.conn.commit()
+        self.pending_rows = 0
+        self.last_flush = time.monotonic()
+
+    def checkpoint(self):
+        """커밋 후 WAL 내용을 DB 파일에 반영"""
+        self.flush()
+        if self.fsync_on_checkpoint:
+            self.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def size(self):
+        """재시작 시 잘라낼 위치 (인덱스 기준 upsert라 자를 필요 없음)"""
+        return 0
+
+    def close(self):
+        """남은 행을 커밋하고 연결 종료"""
+        if self.conn is None:
+            return
+        self.checkpoint()
+        self.conn.close()
+        self.conn = None
+
+
+def _open_readonly(path):
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    return sqlite3.connect(path, timeout=30)
+
+
+def read_results(path, dtype=None):
+    """결과 파일(CSV / SQLite)을 DataFrame으로 읽기 (SQLite는 키 순서, 내부 컬럼 제외)"""
+    if not is_result_store(path):
+        return pd.read_csv(path, dtype=dtype, encoding='utf-8-sig')
+
+    conn = _open_readonly(path)
+    try:
+        columns, key_column = conn.execute(f"SELECT columns, key_column FROM {SCHEMA_TABLE}").fetchone()
+        columns = columns.split('\t')
+        query = (f"SELECT {', '.join(_quote(c) for c in columns)} FROM {RESULT_TABLE} "
+                 f"ORDER BY {_quote(key_column)}")
+        return pd.read_sql_query(query, conn, dtype=dtype)
+    finally:
+        conn.close()
+
+
+def export_csv(path, output_file):
+    """SQLite 결과를 CSV로 내보내기 (기존 결과 CSV와 같은 컬럼 / 인코딩)"""
+    df = read_results(path)
+    df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    return len(df)
+
+
+def summarize(path, status_column='업데이트상태'):
+    """상태별 / 동별 행 수 (인덱스를 사용하는 집계 쿼리)"""
+    conn = _open_readonly(path)
+    try:
+        columns = conn.execute(f"SELECT columns FROM {SCHEMA_TABLE}").fetchone()[0].split('\t')
+        summary = {'rows': conn.execute(f"SELECT COUNT(*) FROM {RESULT_TABLE}").fetchone()[0]}
+        if status_column in columns:
+            summary['status'] = conn.execute(
+                f"SELECT {_quote(status_column)}, COUNT(*) FROM {RESULT_TABLE} "
+                f"GROUP BY {_quote(status_column)} ORDER BY COUNT(*) DESC"
+            ).fetchall()
+        table_columns = {row[1] for row in conn.execute(f"PRAGMA table_info({RESULT_TABLE})")}
+        if DONG_COLUMN in table_columns:
+            summary['dong'] = conn.execute(
+                f"SELECT {_quote(DONG_COLUMN)}, COUNT(*) FROM {RESULT_TABLE} "
+                f"GROUP BY {_quote(DONG_COLUMN)} ORDER BY COUNT(*) DESC"
+            ).fetchall()
+        return summary
+    finally:
+        conn.close()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='SQLite 결과 파일 조회 / CSV 내보내기')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help='CSV로 내보내기')
+    export_parser.add_argument('store', help='SQLite 결과 파일')
+    export_parser.add_argument('--output', help='CSV 파일 (기본: 같은 이름의 .csv)')
+
+    summary_parser = subparsers.add_parser('summary', help='상태별 / 동별 행 수')
+    summary_parser.add_argument('store', help='SQLite 결과 파일')
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        output_file = args.output or f"{os.path.splitext(args.store)[0]}.csv"
+        count = export_csv(args.store, output_file)
+        print(f"💾 CSV 내보내기 완료: {output_file} ({count}개 행)")
+    elif args.command == 'summary':
+        start = time.perf_counter()
+        summary = summarize(args.store)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"📊 전체: {summary['rows']}개 행 ({elapsed:.1f}ms)")
+        for title, key in (('업데이트 상태별', 'status'), ('동별', 'dong')):
+            if summary.get(key):
+                print(f"\n{title}:")
+                for value, count in summary[key]:
+                    print(f"   - {value if value is not None else '(없음)'}: {count}개")
+
+
+if __name__ == "__main__":
+    main()
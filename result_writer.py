@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+결과 CSV 버퍼 저장
+
+행마다 파일을 열고 닫는 대신 파일을 한 번 열어두고, 설정된 정책(N행마다 /
+T초마다)에 따라 flush 하고 체크포인트 시점에는 fsync 까지 수행
+"""
+
+import csv
+import os
+import time
+
+
+def read_csv_header(path):
+    """CSV 파일의 헤더 행 반환 (파일이 없거나 비어 있으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            return next(csv.reader(f), None)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+class ResultWriter:
+    """컬럼 스키마가 고정된 결과 CSV writer"""
+
+    def __init__(self, path, columns, append=False, flush_rows=10, flush_seconds=5.0, fsync_on_checkpoint=True):
+        self.path = path
+        self.columns = list(columns)
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.fsync_on_checkpoint = fsync_on_checkpoint
+
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            # 기존 파일과 컬럼이 다르면 행이 밀려서 저장되므로 추가하지 않음
+            header = read_csv_header(path)
+            if header != self.columns:
+                raise ValueError(f"결과 파일 컬럼이 일치하지 않습니다: {path} ({header} != {self.columns})")
+            self.file = open(path, 'a', encoding='utf-8-sig', newline='')
+            self.writer = csv.writer(self.file)
+        else:
+            self.file = open(path, 'w', encoding='utf-8-sig', newline='')
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(self.columns)
+            self.checkpoint()
+
+        self.pending_rows = 0
+        self.last_flush = time.monotonic()
+
+    def write(self, result):
+        """결과 1행 기록 (스키마에 없는 키는 무시, 빠진 컬럼은 빈 값)"""
+        self.writer.writerow([result.get(column, '') for column in self.columns])
+        self.pending_rows += 1
+
+        if (self.pending_rows >= self.flush_rows
+                or time.monotonic() - self.last_flush >= self.flush_seconds):
+            self.flush()
+
+    def flush(self):
+        """버퍼 내용을 OS로 넘김"""
+        self.file.flush()
+        self.pending_rows = 0
+        self.last_flush = time.monotonic()
+
+    def checkpoint(self):
+        """flush 후 디스크까지 기록 (크래시 시에도 여기까지는 보존)"""
+        self.flush()
+        if self.fsync_on_checkpoint:
+            os.fsync(self.file.fileno())
+
+    def size(self):
+        """OS로 넘긴 데이터 기준 결과 파일 크기 (바이트)"""
+        return os.fstat(self.file.fileno()).st_size
+
+    def close(self):
+        """남은 행을 기록하고 파일 닫기"""
+        if self.file.closed:
+            return
+        self.checkpoint()
+        self.file.close()
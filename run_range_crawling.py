@@ -2,14 +2,32 @@
 # -*- coding: utf-8 -*-
 
 """
-95번째부터 340번째 행까지 크롤링 실행 스크립트
+지정한 범위의 행을 크롤링하는 스크립트
+
+여러 서버에 나눠서 실행할 때는 서버마다 --shard 1/3, --shard 2/3, --shard 3/3 처럼 지정하고
+완료 후 merge_shard_results.py 로 결과 파일을 합칩니다.
+
+사용 예:
+    python run_range_crawling.py --start 95 --end 340
+    python run_range_crawling.py --start 1 --end 100000 --shard 2/4
 """
 
+import argparse
+
 from flexible_crawler import FlexibleCrawler
+from sharding import parse_shard
 
 def main():
+    parser = argparse.ArgumentParser(description='범위 크롤링')
+    parser.add_argument('--start', type=int, default=1, help='시작 행 (1부터)')
+    parser.add_argument('--end', type=int, default=340, help='끝 행 (포함)')
+    parser.add_argument('--shard', type=parse_shard, help="이 서버가 처리할 샤드 (예: 2/4)")
+    args = parser.parse_args()
+    
     print("🚀 범위 크롤링 시작")
-    print("📋 크롤링 범위: 95번째 ~ 340번째 행")
+    print(f"📋 크롤링 범위: {args.start}번째 ~ {args.end}번째 행")
+    if args.shard:
+        print(f"🧩 샤드: {args.shard.number}/{args.shard.count}")
     print("=" * 50)
     
     try:
@@ -17,7 +35,7 @@ def main():
         crawler = FlexibleCrawler()
         
         # 범위 크롤링 실행
-        crawler.crawl_range(start_row=1)
+        crawler.crawl_range(start_row=args.start, end_row=args.end, shard=args.shard)
         
         print("\n✅ 크롤링 완료!")
         
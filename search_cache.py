@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+네이버 지도 검색 결과 캐시 (SQLite)
+
+검색어(정규화) + 원본 주소 기준으로 검색 1회의 결과(결과 개수, 후보 목록,
+선택된 place id, 전화번호, 수집된 주소)를 저장해두고, 재실행 시 브라우저 없이 재사용.
+매칭된 업체의 place id는 사업장명 + 원본 주소 기준으로 만료 없이 따로 저장해서
+갱신 실행 때 검색 없이 상세 페이지로 바로 이동하는 데 사용
+"""
+
+import json
+import sqlite3
+import time
+import unicodedata
+
+
+def normalize_query(text):
+    """검색어 정규화 (유니코드 NFC, 공백 정리, 대소문자 무시)"""
+    if text is None:
+        return ""
+    text = unicodedata.normalize('NFC', str(text))
+    return ' '.join(text.split()).casefold()
+
+
+class SearchCache:
+    """검색 결과 캐시"""
+
+    def __init__(self, db_file, ttl_days=30):
+        self.db_file = db_file
+        self.ttl_seconds = ttl_days * 24 * 60 * 60 if ttl_days else None
+
+        # 병렬 워커는 생성한 스레드와 사용하는 스레드가 다르므로 check_same_thread 해제
+        self.conn = sqlite3.connect(db_file, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_results (
+                query TEXT NOT NULL,
+                address TEXT NOT NULL,
+                outcome TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (query, address)
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS place_ids (
+                business_name TEXT NOT NULL,
+                address TEXT NOT NULL,
+                place_id TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (business_name, address)
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, query, original_address=None):
+        """캐시된 검색 결과 반환 (없거나 만료되면 None)"""
+        row = self.conn.execute(
+            "SELECT outcome, created_at FROM search_results WHERE query = ? AND address = ?",
+            (normalize_query(query), normalize_query(original_address))
+        ).fetchone()
+        if row is None:
+            return None
+
+        outcome, created_at = row
+        if self.ttl_seconds and time.time() - created_at > self.ttl_seconds:
+            return None
+
+        return json.loads(outcome)
+
+    def put(self, query, original_address, outcome):
+        """검색 결과 저장 (같은 키는 덮어씀)"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO search_results (query, address, outcome, created_at) VALUES (?, ?, ?, ?)",
+            (normalize_query(query), normalize_query(original_address),
+             json.dumps(outcome, ensure_ascii=False), time.time())
+        )
+        self.conn.commit()
+
+    def get_place_id(self, business_name, original_address=None):
+        """매칭된 업체의 place id 반환 (없으면 None)"""
+        row = self.conn.execute(
+            "SELECT place_id FROM place_ids WHERE business_name = ? AND address = ?",
+            (normalize_query(business_name), normalize_query(original_address))
+        ).fetchone()
+        return row[0] if row else None
+
+    def put_place_id(self, business_name, original_address, place_id):
+        """매칭된 업체의 place id 저장 (같은 업체는 덮어씀)"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO place_ids (business_name, address, place_id, updated_at) VALUES (?, ?, ?, ?)",
+            (normalize_query(business_name), normalize_query(original_address), str(place_id), time.time())
+        )
+        self.conn.commit()
+
+    def forget_place_id(self, business_name, original_address=None):
+        """더 이상 맞지 않는 place id 삭제"""
+        self.conn.execute(
+            "DELETE FROM place_ids WHERE business_name = ? AND address = ?",
+            (normalize_query(business_name), normalize_query(original_address))
+        )
+        self.conn.commit()
+
+    def purge_expired(self):
+        """만료된 캐시 삭제 후 삭제 건수 반환"""
+        if not self.ttl_seconds:
+            return 0
+        cursor = self.conn.execute(
+            "DELETE FROM search_results WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+        self.conn.commit()
+        return cursor.rowcount
+
+    def close(self):
+        """DB 연결 종료"""
+        self.conn.close()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+검색 단계 결정 트리
+
+검색어 단계(1차: 사업장명 + 동이름, 2차: 사업장명 ...)를 순서대로 실행하면서
+각 단계가 전화번호를 찾지 못한 사유를 기록하고, 다음 검색어로 결과가 달라질 수
+있는 사유일 때만 다음 단계로 넘어간다. (예: 결과 없음 / 대상 지역 업체인데 전화번호
+없음은 확정으로 보고 2차 검색 생략, 다른 지역 결과 / 시간 초과는 2차 검색 진행)
+"""
+
+# 단계별 실패 사유
+REASON_PHONE_FOUND = 'phone_found'          # 전화번호 발견
+REASON_NO_RESULTS = 'no_results'            # "검색 결과가 없습니다" 확인
+REASON_NO_PHONE = 'no_phone'                # 대상 지역 업체를 찾았지만 전화번호 없음
+REASON_WRONG_DISTRICT = 'wrong_district'    # 결과가 모두 대상 지역 밖
+REASON_ADDRESS_UNKNOWN = 'address_unknown'  # 결과 주소를 확인하지 못함
+REASON_TIMEOUT = 'timeout'                  # 검색 결과 로딩 시간 초과
+REASON_CACHE_MISS = 'cache_miss'            # 캐시 전용 모드에서 캐시 없음
+REASON_ERROR = 'error'                      # 처리 중 오류 / 알 수 없는 상태
+REASON_PLACE_NOT_FOUND = 'place_not_found'  # 저장된 place id의 상세 페이지가 열리지 않음
+REASON_PLACE_MISMATCH = 'place_mismatch'    # 저장된 place id의 업체명이 다름
+
+REASON_DESCRIPTIONS = {
+    REASON_PHONE_FOUND: '전화번호 발견',
+    REASON_NO_RESULTS: '검색 결과 없음',
+    REASON_NO_PHONE: '대상 지역 업체에 전화번호 없음',
+    REASON_WRONG_DISTRICT: '대상 지역 밖의 결과만 있음',
+    REASON_ADDRESS_UNKNOWN: '결과 주소 확인 불가',
+    REASON_TIMEOUT: '검색 결과 로딩 시간 초과',
+    REASON_CACHE_MISS: '검색 캐시 없음',
+    REASON_ERROR: '처리 중 오류',
+    REASON_PLACE_NOT_FOUND: '저장된 place id 상세 페이지 없음',
+    REASON_PLACE_MISMATCH: '저장된 place id의 업체명 불일치'
+}
+
+
+def describe_reason(reason):
+    """실패 사유 설명 (기록되지 않은 이전 캐시 결과는 '사유 미기록')"""
+    return REASON_DESCRIPTIONS.get(reason, '사유 미기록')
+
+
+class SearchDecisionTree:
+    """검색어 단계 목록 + 다음 단계로 넘어갈 사유 목록"""
+
+    def __init__(self, stages, escalate_on):
+        self.stages = stages
+        self.escalate_on = set(escalate_on)
+
+    @classmethod
+    def from_config(cls, config):
+        """SEARCH_STRATEGY_CONFIG 설정으로 생성"""
+        return cls(config['stages'], config['escalate_on'])
+
+    def should_escalate(self, stage, reason):
+        """이 단계의 실패 사유로 다음 단계를 실행할지 판단 (사유가 없으면 기존처럼 진행)"""
+        if reason is None:
+            return True
+        escalate_on = stage.get('escalate_on')
+        escalate_on = set(escalate_on) if escalate_on is not None else self.escalate_on
+        return reason in escalate_on
+
+    def _stage_queries(self, fields):
+        """(단계 위치, 단계, 검색어) 목록 (같은 검색어가 되는 단계 / 빈 검색어는 제외)"""
+        queries = []
+        for position, stage in enumerate(self.stages):
+            query = ' '.join(stage['query'].format(**fields).split())
+            if query and all(query != previous for _, _, previous in queries):
+                queries.append((position, stage, query))
+        return queries
+
+    def _record_step(self, trace, position, stage, query, phone_number, reason):
+        """단계 결과를 기록하고 다음 단계로 넘어갈지 반환"""
+        if phone_number:
+            trace.append({'stage': stage['label'], 'query': query, 'reason': REASON_PHONE_FOUND})
+            return False
+
+        escalate = position + 1 < len(self.stages) and self.should_escalate(stage, reason)
+        trace.append({'stage': stage['label'], 'query': query, 'reason': reason, 'escalate': escalate})
+        return escalate
+
+    def run(self, run_stage, **fields):
+        """run_stage(검색어, 단계 이름) -> (전화번호, 사유)를 단계별로 실행
+
+        (전화번호, 단계별 기록 목록)을 반환한다. 같은 검색어가 되는 단계(예: 동이름 없음)는 생략.
+        """
+        trace = []
+        phone_number = None
+        for position, stage, query in self._stage_queries(fields):
+            phone_number, reason = run_stage(query, stage['label'])
+            if not self._record_step(trace, position, stage, query, phone_number, reason):
+                break
+
+        return phone_number, trace
+
+    async def run_async(self, run_stage, **fields):
+        """run() 과 같은 순서로 실행하되 run_stage 가 코루틴인 경우 (DevTools 비동기 크롤링)"""
+        trace = []
+        phone_number = None
+        for position, stage, query in self._stage_queries(fields):
+            phone_number, reason = await run_stage(query, stage['label'])
+            if not self._record_step(trace, position, stage, query, phone_number, reason):
+                break
+
+        return phone_number, trace
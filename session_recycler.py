@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Chrome 세션 재시작 정책
+
+하나의 Chrome 세션으로 수천 번 검색 페이지를 이동하면 렌더러 메모리가 계속 늘어나
+페이지가 느려지므로, 세션별 페이지 이동 횟수 / JS 힙 크기 / 브라우저 프로세스 RSS를
+확인해서 기준을 넘으면 다음 페이지 이동 전에 세션을 새로 시작하도록 알려준다.
+(RSS 확인은 psutil 이 설치된 경우에만 사용)
+"""
+
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# 세션 재시작 사유
+RECYCLE_NAVIGATIONS = 'navigations'
+RECYCLE_JS_HEAP = 'js_heap'
+RECYCLE_RSS = 'rss'
+RECYCLE_CRASHED = 'crashed'
+
+RECYCLE_DESCRIPTIONS = {
+    RECYCLE_NAVIGATIONS: '페이지 이동 횟수 초과',
+    RECYCLE_JS_HEAP: 'JS 힙 크기 초과',
+    RECYCLE_RSS: '브라우저 메모리(RSS) 초과',
+    RECYCLE_CRASHED: '세션 응답 없음'
+}
+
+JS_HEAP_SCRIPT = "return performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+MB = 1024 * 1024
+
+_psutil_warned = False
+
+
+def browser_rss_bytes(driver):
+    """chromedriver 아래 Chrome 프로세스들의 RSS 합계 (psutil 이 없거나 확인할 수 없으면 None)"""
+    if psutil is None:
+        return None
+    try:
+        service_process = driver.service.process
+        if service_process is None:
+            return None
+        root = psutil.Process(service_process.pid)
+        return sum(child.memory_info().rss for child in root.children(recursive=True))
+    except (AttributeError, psutil.Error):
+        return None
+
+
+class SessionRecycler:
+    """세션 하나의 페이지 이동 / 메모리 사용량을 세고 재시작 시점을 판단"""
+
+    def __init__(self, max_navigations=None, max_js_heap_mb=None, max_rss_mb=None, check_every=20, enabled=True):
+        self.enabled = enabled
+        self.max_navigations = max_navigations
+        self.max_js_heap_mb = max_js_heap_mb
+        self.max_rss_mb = max_rss_mb
+        self.check_every = max(check_every, 1)
+
+        self.navigations = 0
+        self.started_at = time.monotonic()
+        self.recycle_count = 0
+        self.last_usage = {}
+
+        global _psutil_warned
+        if enabled and max_rss_mb and psutil is None and not _psutil_warned:
+            _psutil_warned = True
+            print("⚠️ psutil 이 설치되어 있지 않아 브라우저 RSS 기준은 사용하지 않습니다 (pip install psutil)")
+
+    @classmethod
+    def from_config(cls, config):
+        """SESSION_CONFIG 설정으로 생성"""
+        return cls(
+            max_navigations=config.get('max_navigations'),
+            max_js_heap_mb=config.get('max_js_heap_mb'),
+            max_rss_mb=config.get('max_rss_mb'),
+            check_every=config.get('check_every', 20),
+            enabled=config.get('enabled', True)
+        )
+
+    def record_navigation(self):
+        """페이지 이동 1회 기록"""
+        self.navigations += 1
+
+    def measure(self, driver):
+        """현재 세션의 JS 힙 / 브라우저 RSS (MB)"""
+        usage = {}
+        if self.max_js_heap_mb:
+            try:
+                heap = driver.execute_script(JS_HEAP_SCRIPT)
+                if heap:
+                    usage['js_heap_mb'] = heap / MB
+            except Exception:
+                pass
+        if self.max_rss_mb:
+            rss = browser_rss_bytes(driver)
+            if rss:
+                usage['rss_mb'] = rss / MB
+        self.last_usage = usage
+        return usage
+
+    def recycle_reason(self, driver):
+        """다음 페이지 이동 전에 세션을 재시작해야 하면 사유, 아니면 None"""
+        if not self.enabled or driver is None:
+            return None
+        if self.max_navigations and self.navigations >= self.max_navigations:
+            return RECYCLE_NAVIGATIONS
+
+        # 메모리 확인은 check_every 번 이동마다 (매번 확인하면 그 자체가 느림)
+        if not self.navigations or self.navigations % self.check_every:
+            return None
+        usage = self.measure(driver)
+        if self.max_js_heap_mb and usage.get('js_heap_mb', 0) >= self.max_js_heap_mb:
+            return RECYCLE_JS_HEAP
+        if self.max_rss_mb and usage.get('rss_mb', 0) >= self.max_rss_mb:
+            return RECYCLE_RSS
+        return None
+
+    def reset(self):
+        """새 세션 시작 후 카운터 초기화"""
+        self.recycle_count += 1
+        self.navigations = 0
+        self.started_at = time.monotonic()
+        self.last_usage = {}
+
+    def describe(self, reason):
+        """재시작 사유 설명 (출력용)"""
+        usage = ', '.join(f"{key} {value:.0f}" for key, value in self.last_usage.items())
+        detail = f"이동 {self.navigations}회" + (f", {usage}" if usage else '')
+        return f"{RECYCLE_DESCRIPTIONS.get(reason, reason)} ({detail})"
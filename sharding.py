@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+여러 서버에 나눠서 크롤링하기 위한 행 분배 (해시 샤딩)
+
+행 키(사업장명 + 주소)의 안정적인 해시로 샤드를 정하므로, 각 서버는 같은 대상 파일을 읽고
+자기 샤드(--shard i/N)의 행만 처리하면 된다. 느린 행이 한 구간에 몰려도 샤드 사이에 고르게
+나뉘고, 같은 업체가 여러 번 나오면 같은 샤드(같은 검색 캐시)에서 처리된다.
+"""
+
+import hashlib
+import re
+from collections import namedtuple
+
+SHARD_PATTERN = re.compile(r'^\s*(\d+)\s*/\s*(\d+)\s*$')
+SHARD_TAG_PATTERN = re.compile(r'_shard(\d+)of(\d+)')
+
+# number: 1부터 시작하는 샤드 번호, count: 전체 샤드 수
+Shard = namedtuple('Shard', ['number', 'count'])
+
+
+def parse_shard(text):
+    """'2/4' 형식 문자열을 Shard로 변환"""
+    match = SHARD_PATTERN.match(str(text))
+    if not match:
+        raise ValueError(f"샤드는 'i/N' 형식이어야 합니다: {text}")
+    number, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 1 <= number <= count:
+        raise ValueError(f"샤드 번호는 1부터 {count} 사이여야 합니다: {text}")
+    return Shard(number, count)
+
+
+def _key_text(value):
+    """행 키에 쓸 문자열 (NaN / None은 빈 문자열, 공백 정리)"""
+    if not isinstance(value, str):
+        return ''
+    return ' '.join(value.split())
+
+
+def row_shard(business_name, address, count):
+    """행 키(사업장명 + 주소)의 해시로 정한 샤드 번호 (1..count, 실행 환경과 무관하게 같은 값)"""
+    key = f"{_key_text(business_name)}\t{_key_text(address)}".encode('utf-8')
+    digest = hashlib.blake2b(key, digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % count + 1
+
+
+def in_shard(shard, business_name, address):
+    """행이 이 샤드에 속하는지 확인 (샤드가 없으면 모든 행)"""
+    return shard is None or row_shard(business_name, address, shard.count) == shard.number
+
+
+def shard_tag(shard):
+    """결과 파일 이름에 붙일 샤드 표시 (예: '_shard2of4')"""
+    return f"_shard{shard.number}of{shard.count}" if shard else ''
+
+
+def shard_from_filename(filename):
+    """결과 파일 이름의 샤드 표시 읽기 (없으면 None)"""
+    match = SHARD_TAG_PATTERN.search(filename)
+    return Shard(int(match.group(1)), int(match.group(2))) if match else None
@@ -9,6 +9,8 @@ import numpy as np
 from pathlib import Path
 import logging
 
+from columnar_store import columnar_path, read_frame
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -20,15 +22,17 @@ logging.basicConfig(
 )
 
 def load_data():
-    """CSV 파일들을 로드합니다."""
+    """CSV 파일들을 로드합니다 (같은 이름의 Parquet / Arrow 파일이 최신이면 그 파일)."""
     try:
         # stores02.csv 로드 (업소명: 4번째 칼럼, 전화번호: 5번째 칼럼)
-        stores_df = pd.read_csv('stores02.csv', encoding='utf-8')
-        logging.info(f"stores02.csv 로드 완료: {len(stores_df)}개 행")
+        stores_file = columnar_path('stores02.csv')
+        stores_df = read_frame(stores_file, encoding='utf-8')
+        logging.info(f"{stores_file} 로드 완료: {len(stores_df)}개 행")
         
         # temp.csv 로드 (사업장명: 2번째 칼럼, 새전화번호: 5번째 칼럼)
-        temp_df = pd.read_csv('temp.csv', encoding='utf-8')
-        logging.info(f"temp.csv 로드 완료: {len(temp_df)}개 행")
+        temp_file = columnar_path('temp.csv')
+        temp_df = read_frame(temp_file, encoding='utf-8')
+        logging.info(f"{temp_file} 로드 완료: {len(temp_df)}개 행")
         
         return stores_df, temp_df
         
@@ -49,6 +53,11 @@ def clean_business_name(name):
     
     return name
 
+def clean_business_names(names):
+    """업소명 칼럼 전체를 한 번에 정리합니다 (clean_business_name 과 같은 규칙)."""
+    cleaned = names.astype(str).str.split().str.join(' ')
+    return cleaned.where(names.notna(), "")
+
 def find_matching_businesses(stores_df, temp_df):
     """업소명이 일치하는 업체들을 찾습니다."""
     matches = []
@@ -66,24 +75,32 @@ def find_matching_businesses(stores_df, temp_df):
     logging.info(f"temp.csv 사업장명 칼럼: {temp_business_col}")
     logging.info(f"temp.csv 새전화번호 칼럼: {temp_phone_col}")
     
-    for idx, temp_row in temp_df.iterrows():
-        temp_business = clean_business_name(temp_row[temp_business_col])
-        temp_phone = temp_row[temp_phone_col]
+    # 업소명은 양쪽 모두 칼럼 단위로 한 번만 정리
+    stores_names = clean_business_names(stores_df[stores_business_col])
+    temp_names = clean_business_names(temp_df[temp_business_col])
+    
+    # 업소명 → stores02.csv 행 위치 (같은 업소명이 여러 개면 첫 번째 행만 사용)
+    first_rows = ~stores_names.duplicated(keep='first').to_numpy()
+    store_positions = dict(zip(stores_names.to_numpy()[first_rows], np.flatnonzero(first_rows)))
+    
+    temp_phones = temp_df[temp_phone_col]
+    has_phones = ~(temp_phones.isna() | (temp_phones == "")).to_numpy()
+    old_phones = stores_df.iloc[:, 4]  # 전화번호 칼럼 (5번째, 인덱스 4)
+    
+    # temp.csv에 있는 모든 업체를 기록 (전화번호 유무와 관계없이)
+    for temp_pos, temp_business in enumerate(temp_names.to_numpy()):
+        stores_pos = store_positions.get(temp_business)
+        if stores_pos is None:
+            continue
         
-        # temp.csv에 있는 모든 업체를 기록 (전화번호 유무와 관계없이)
-        for stores_idx, stores_row in stores_df.iterrows():
-            stores_business = clean_business_name(stores_row[stores_business_col])
-            
-            if temp_business == stores_business:
-                matches.append({
-                    'temp_idx': idx,
-                    'stores_idx': stores_idx,
-                    'business_name': temp_business,
-                    'new_phone': temp_phone,
-                    'old_phone': stores_row.iloc[4],  # 전화번호 칼럼 (5번째, 인덱스 4)
-                    'has_phone': not (pd.isna(temp_phone) or temp_phone == "")
-                })
-                break
+        matches.append({
+            'temp_idx': temp_df.index[temp_pos],
+            'stores_idx': stores_df.index[stores_pos],
+            'business_name': temp_business,
+            'new_phone': temp_phones.iloc[temp_pos],
+            'old_phone': old_phones.iloc[stores_pos],
+            'has_phone': bool(has_phones[temp_pos])
+        })
     
     return matches
 
@@ -1,18 +1,23 @@
 import pandas as pd
+import numpy as np
 import os
 import glob
 from datetime import datetime
 
+from columnar_store import COLUMNAR_EXTENSIONS, columnar_path, prefer_columnar, read_frame
+
 def find_crawling_files():
-    """crawling 폴더에서 크롤링 결과 CSV 파일들을 찾습니다."""
+    """crawling 폴더에서 크롤링 결과 파일들을 찾습니다 (같은 이름의 Parquet / Arrow 파일이 최신이면 그 파일)."""
     # 현재 디렉토리에서 크롤링 결과 파일들을 찾습니다
     crawling_files = glob.glob("stores_crawling_batch*.csv")
-    return sorted(crawling_files)
+    for extension in COLUMNAR_EXTENSIONS:
+        crawling_files += glob.glob(f"stores_crawling_batch*{extension}")
+    return prefer_columnar(crawling_files)
 
 def read_original_stores():
     """원본 stores.csv 파일을 읽습니다."""
     try:
-        df = pd.read_csv('stores.csv')
+        df = read_frame(columnar_path('stores.csv'))
         return df
     except FileNotFoundError:
         print("stores.csv 파일을 찾을 수 없습니다.")
@@ -21,7 +26,7 @@ def read_original_stores():
 def read_crawling_results(file_path):
     """크롤링 결과 파일을 읽습니다."""
     try:
-        df = pd.read_csv(file_path)
+        df = read_frame(file_path)
         return df
     except FileNotFoundError:
         print(f"{file_path} 파일을 찾을 수 없습니다.")
@@ -47,6 +52,35 @@ def create_update_description(row):
     else:
         return f"전화번호가 변경되었습니다 (기존: {original_phone} → 새: {new_phone})"
 
+def create_update_descriptions(crawling_df):
+    """업데이트 설명을 칼럼 단위로 한 번에 생성합니다 (create_update_description 과 같은 규칙)."""
+    original_phone = crawling_df['기존전화번호'].astype(object).where(crawling_df['기존전화번호'].notna(), '')
+    new_phone = crawling_df['새전화번호'].astype(object).where(crawling_df['새전화번호'].notna(), '')
+    no_new_phone = (crawling_df['새전화번호'].isna() | (crawling_df['새전화번호'] == '')).to_numpy()
+    update = crawling_df['업데이트'].to_numpy()
+    
+    changed = ("전화번호가 변경되었습니다 (기존: " + original_phone.astype(str)
+               + " → 새: " + new_phone.astype(str) + ")")
+    
+    conditions = [
+        no_new_phone & (update == '결과없음'),
+        no_new_phone & (update == 'MULTIPLE_RESULTS_NO_PHONE'),
+        no_new_phone,
+        (original_phone == new_phone).to_numpy(),
+        ((original_phone == '') & (new_phone != '')).to_numpy()
+    ]
+    choices = [
+        "네이버 지도에서 해당 업체를 찾을 수 없었습니다",
+        "네이버 지도에서 여러 결과가 나왔지만 전화번호 정보가 없었습니다",
+        "크롤링 결과가 없습니다",
+        "기존 전화번호와 동일합니다",
+        "기존에 전화번호가 없었는데 새로 찾았습니다"
+    ]
+    choices = [np.full(len(crawling_df), choice, dtype=object) for choice in choices]
+    
+    descriptions = np.select(conditions, choices, default=changed.to_numpy(dtype=object))
+    return pd.Series(descriptions, index=crawling_df.index, dtype=object)
+
 def merge_data(original_df, crawling_df):
     """원본 데이터와 크롤링 결과를 병합합니다."""
     # 원본 데이터 복사
@@ -59,16 +93,31 @@ def merge_data(original_df, crawling_df):
     result_df = result_df.reindex(columns=cols)
     result_df['새전화'] = ''
     
-    # 크롤링 결과를 순번에 맞게 매핑
-    for _, crawling_row in crawling_df.iterrows():
-        store_index = crawling_row['순번'] - 1  # 0-based index
-        
-        if store_index < len(result_df):
-            result_df.at[store_index, '새전화'] = crawling_row['새전화번호']
-            
-            # 업데이트 설명 생성
-            update_desc = create_update_description(crawling_row)
-            result_df.at[store_index, '업데이트'] = update_desc
+    # 크롤링 결과를 순번에 맞게 매핑 (0-based index, 같은 순번은 마지막 결과 사용)
+    # Parquet / Arrow의 결측값 있는 정수(Int32)도 CSV처럼 NaN 실수로 바꿔서 범위 밖으로 처리
+    store_index = pd.to_numeric(crawling_df['순번'], errors='coerce').astype('float64') - 1
+    in_range = (store_index >= 0) & (store_index < len(result_df))
+    matched_df = crawling_df[in_range.to_numpy()]
+    store_index = store_index[in_range.to_numpy()].astype(int)
+    
+    keep = ~store_index.duplicated(keep='last').to_numpy()
+    matched_df = matched_df[keep]
+    store_index = store_index[keep].to_numpy()
+    
+    if len(matched_df) == 0:
+        return result_df
+    
+    if '업데이트' not in result_df.columns:
+        result_df['업데이트'] = np.nan
+    
+    # 새전화 / 업데이트 설명을 칼럼 단위로 한 번에 기록
+    new_phone_col = result_df['새전화'].astype(object)
+    new_phone_col.loc[store_index] = matched_df['새전화번호'].to_numpy(dtype=object)
+    result_df['새전화'] = new_phone_col
+    
+    update_col = result_df['업데이트'].astype(object)
+    update_col.loc[store_index] = create_update_descriptions(matched_df).to_numpy()
+    result_df['업데이트'] = update_col
     
     return result_df
 